@@ -0,0 +1,5972 @@
+// ------------------- DO NOT EDIT ----------------------
+// This file was generated by `reflex_experiment/extractor_generator.py`!
+// ------------------------------------------------------
+
+import React from "react";
+
+export function extractCompactHTMLElementBase(obj: HTMLElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+  ];
+}
+
+export function extractCompactHTMLMediaElement(obj: HTMLMediaElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.autoplay, // autoplay
+    obj.controls, // controls
+    obj.crossOrigin ?? null, // cross_origin
+    obj.currentSrc, // current_src
+    obj.currentTime, // current_time
+    obj.defaultMuted, // default_muted
+    obj.defaultPlaybackRate, // default_playback_rate
+    obj.duration, // duration
+    obj.ended, // ended
+    obj.loop, // loop
+    obj.muted, // muted
+    obj.networkState, // network_state
+    obj.paused, // paused
+    obj.playbackRate, // playback_rate
+    obj.preload, // preload
+    obj.readyState, // ready_state
+    obj.seeking, // seeking
+    obj.src, // src
+    obj.volume, // volume
+    obj.preservesPitch, // preserves_pitch
+  ];
+}
+
+export function extractCompactHTMLAnchorElement(obj: HTMLAnchorElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.hash, // hash
+    obj.host, // host
+    obj.hostname, // hostname
+    obj.href, // href
+    obj.origin, // origin
+    obj.password, // password
+    obj.pathname, // pathname
+    obj.port, // port
+    obj.protocol, // protocol
+    obj.search, // search
+    obj.target, // target
+    obj.download, // download
+    obj.rel, // rel
+    obj.hreflang, // hreflang
+    obj.type, // type
+    obj.username, // username
+    obj.ping, // ping
+    obj.referrerPolicy, // referrer_policy
+    obj.text, // text
+  ];
+}
+
+export function extractCompactHTMLAreaElement(obj: HTMLAreaElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.alt, // alt
+    obj.coords, // coords
+    obj.download, // download
+    obj.hash, // hash
+    obj.host, // host
+    obj.hostname, // hostname
+    obj.href, // href
+    obj.origin, // origin
+    obj.password, // password
+    obj.pathname, // pathname
+    obj.port, // port
+    obj.protocol, // protocol
+    obj.rel, // rel
+    obj.search, // search
+    obj.shape, // shape
+    obj.target, // target
+    obj.username, // username
+    obj.ping, // ping
+    obj.referrerPolicy, // referrer_policy
+  ];
+}
+
+export function extractCompactHTMLAudioElement(obj: HTMLAudioElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.autoplay, // autoplay
+    obj.controls, // controls
+    obj.crossOrigin ?? null, // cross_origin
+    obj.currentSrc, // current_src
+    obj.currentTime, // current_time
+    obj.defaultMuted, // default_muted
+    obj.defaultPlaybackRate, // default_playback_rate
+    obj.duration, // duration
+    obj.ended, // ended
+    obj.loop, // loop
+    obj.muted, // muted
+    obj.networkState, // network_state
+    obj.paused, // paused
+    obj.playbackRate, // playback_rate
+    obj.preload, // preload
+    obj.readyState, // ready_state
+    obj.seeking, // seeking
+    obj.src, // src
+    obj.volume, // volume
+    obj.preservesPitch, // preserves_pitch
+  ];
+}
+
+export function extractCompactHTMLBaseElement(obj: HTMLBaseElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.href, // href
+    obj.target, // target
+  ];
+}
+
+export function extractCompactHTMLBodyElement(obj: HTMLBodyElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.aLink, // a_link
+    obj.background, // background
+    obj.bgColor, // bg_color
+    obj.link, // link
+    obj.text, // text
+    obj.vLink, // v_link
+  ];
+}
+
+export function extractCompactHTMLBRElement(obj: HTMLBRElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.clear, // clear
+  ];
+}
+
+export function extractCompactHTMLButtonElement(obj: HTMLButtonElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.disabled, // disabled
+    obj.name, // name
+    obj.type, // type
+    obj.value, // value
+    obj.formAction, // form_action
+    obj.formEnctype, // form_enctype
+    obj.formMethod, // form_method
+    obj.formNoValidate, // form_no_validate
+    obj.formTarget, // form_target
+    obj.popoverTargetAction, // popover_target_action
+  ];
+}
+
+export function extractCompactHTMLCiteElement(obj: HTMLElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+  ];
+}
+
+export function extractCompactHTMLDataElement(obj: HTMLDataElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.value, // value
+  ];
+}
+
+export function extractCompactHTMLDetailsElement(obj: HTMLDetailsElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.open, // open
+  ];
+}
+
+export function extractCompactHTMLDialogElement(obj: HTMLDialogElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.open, // open
+    obj.returnValue, // return_value
+  ];
+}
+
+export function extractCompactHTMLDivElement(obj: HTMLDivElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.align, // align
+  ];
+}
+
+export function extractCompactHTMLDListElement(obj: HTMLDListElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.compact, // compact
+  ];
+}
+
+export function extractCompactHTMLEmbedElement(obj: HTMLEmbedElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.height, // height
+    obj.src, // src
+    obj.type, // type
+    obj.width, // width
+    obj.align, // align
+    obj.name, // name
+  ];
+}
+
+export function extractCompactHTMLFieldSetElement(obj: HTMLFieldSetElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.disabled, // disabled
+    obj.name, // name
+    obj.type, // type
+    obj.validationMessage, // validation_message
+    obj.willValidate, // will_validate
+  ];
+}
+
+export function extractCompactHTMLFormElement(obj: HTMLFormElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.acceptCharset, // accept_charset
+    obj.action, // action
+    obj.autocomplete, // autocomplete
+    obj.encoding, // encoding
+    obj.enctype, // enctype
+    obj.length, // length
+    obj.method, // method
+    obj.name, // name
+    obj.noValidate, // no_validate
+    obj.target, // target
+    obj.rel, // rel
+  ];
+}
+
+export function extractCompactHTMLHeadElement(obj: HTMLHeadElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+  ];
+}
+
+export function extractCompactHTMLHeadingElement(obj: HTMLHeadingElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.align, // align
+  ];
+}
+
+export function extractCompactHTMLHRElement(obj: HTMLHRElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.align, // align
+    obj.color, // color
+    obj.noShade, // no_shade
+    obj.size, // size
+    obj.width, // width
+  ];
+}
+
+export function extractCompactHTMLHtmlElement(obj: HTMLHtmlElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.version, // version
+  ];
+}
+
+export function extractCompactHTMLIFrameElement(obj: HTMLIFrameElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.allow, // allow
+    obj.allowFullscreen, // allow_fullscreen
+    obj.height, // height
+    obj.name, // name
+    obj.referrerPolicy, // referrer_policy
+    obj.src, // src
+    obj.srcdoc, // srcdoc
+    obj.width, // width
+    obj.align, // align
+    obj.frameBorder, // frame_border
+    obj.longDesc, // long_desc
+    obj.marginHeight, // margin_height
+    obj.marginWidth, // margin_width
+    obj.scrolling, // scrolling
+    obj.sandbox, // sandbox
+  ];
+}
+
+export function extractCompactHTMLImageElement(obj: HTMLImageElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.alt, // alt
+    obj.crossOrigin ?? null, // cross_origin
+    obj.decoding, // decoding
+    obj.height, // height
+    obj.isMap, // is_map
+    obj.loading, // loading
+    obj.naturalHeight, // natural_height
+    obj.naturalWidth, // natural_width
+    obj.referrerPolicy, // referrer_policy
+    obj.sizes, // sizes
+    obj.src, // src
+    obj.srcset, // srcset
+    obj.useMap, // use_map
+    obj.width, // width
+    obj.align, // align
+    obj.border, // border
+    obj.complete, // complete
+    obj.hspace, // hspace
+    obj.longDesc, // long_desc
+    obj.lowsrc, // lowsrc
+    obj.name, // name
+    obj.vspace, // vspace
+    obj.x, // x
+    obj.y, // y
+    obj.fetchPriority, // fetch_priority
+  ];
+}
+
+export function extractCompactHTMLInputElement(obj: HTMLInputElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.accept, // accept
+    obj.alt, // alt
+    obj.autocomplete, // autocomplete
+    obj.checked, // checked
+    obj.defaultChecked, // default_checked
+    obj.defaultValue, // default_value
+    obj.dirName, // dir_name
+    obj.disabled, // disabled
+    obj.height, // height
+    obj.indeterminate, // indeterminate
+    obj.max, // max
+    obj.maxLength, // max_length
+    obj.min, // min
+    obj.minLength, // min_length
+    obj.multiple, // multiple
+    obj.name, // name
+    obj.pattern, // pattern
+    obj.placeholder, // placeholder
+    obj.readOnly, // read_only
+    obj.required, // required
+    obj.selectionDirection ?? null, // selection_direction
+    obj.selectionEnd ?? null, // selection_end
+    obj.selectionStart ?? null, // selection_start
+    obj.size, // size
+    obj.src, // src
+    obj.step, // step
+    obj.type, // type
+    obj.value, // value
+    obj.valueAsNumber ?? null, // value_as_number
+    obj.width, // width
+    obj.align, // align
+    obj.capture, // capture
+    obj.formAction, // form_action
+    obj.formEnctype, // form_enctype
+    obj.formMethod, // form_method
+    obj.formNoValidate, // form_no_validate
+    obj.formTarget, // form_target
+    obj.useMap, // use_map
+    obj.validationMessage, // validation_message
+    obj.willValidate, // will_validate
+    obj.popoverTargetAction, // popover_target_action
+  ];
+}
+
+export function extractCompactHTMLLabelElement(obj: HTMLLabelElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.htmlFor, // html_for
+  ];
+}
+
+export function extractCompactHTMLLiElement(obj: HTMLLIElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.value, // value
+    obj.type, // type
+  ];
+}
+
+export function extractCompactHTMLLinkElement(obj: HTMLLinkElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.as, // as_
+    obj.crossOrigin ?? null, // cross_origin
+    obj.disabled, // disabled
+    obj.fetchPriority, // fetch_priority
+    obj.href, // href
+    obj.hreflang, // hreflang
+    obj.imageSizes, // image_sizes
+    obj.imageSrcset, // image_srcset
+    obj.integrity, // integrity
+    obj.media, // media
+    obj.referrerPolicy, // referrer_policy
+    obj.rel, // rel
+    obj.type, // type
+    obj.charset, // charset
+    obj.rev, // rev
+    obj.target, // target
+    obj.sizes, // sizes
+  ];
+}
+
+export function extractCompactHTMLMapElement(obj: HTMLMapElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.name, // name
+  ];
+}
+
+export function extractCompactHTMLMenuElement(obj: HTMLMenuElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+  ];
+}
+
+export function extractCompactHTMLMetaElement(obj: HTMLMetaElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.content, // content
+    obj.httpEquiv, // http_equiv
+    obj.name, // name
+    obj.scheme, // scheme
+  ];
+}
+
+export function extractCompactHTMLMeterElement(obj: HTMLMeterElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.high, // high
+    obj.low, // low
+    obj.max, // max
+    obj.min, // min
+    obj.optimum, // optimum
+    obj.value, // value
+  ];
+}
+
+export function extractCompactHTMLModElement(obj: HTMLModElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.cite, // cite
+    obj.dateTime, // date_time
+  ];
+}
+
+export function extractCompactHTMLOListElement(obj: HTMLOListElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.reversed, // reversed
+    obj.start, // start
+    obj.type, // type
+    obj.compact, // compact
+  ];
+}
+
+export function extractCompactHTMLObjectElement(obj: HTMLObjectElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.data, // data
+    obj.height, // height
+    obj.name, // name
+    obj.type, // type
+    obj.useMap, // use_map
+    obj.width, // width
+    obj.align, // align
+    obj.archive, // archive
+    obj.border, // border
+    obj.code, // code
+    obj.codeBase, // code_base
+    obj.codeType, // code_type
+    obj.declare, // declare
+    obj.hspace, // hspace
+    obj.standby, // standby
+    obj.validationMessage, // validation_message
+    obj.vspace, // vspace
+    obj.willValidate, // will_validate
+  ];
+}
+
+export function extractCompactHTMLOptGroupElement(obj: HTMLOptGroupElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.disabled, // disabled
+    obj.label, // label
+  ];
+}
+
+export function extractCompactHTMLOptionElement(obj: HTMLOptionElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.defaultSelected, // default_selected
+    obj.disabled, // disabled
+    obj.index, // index
+    obj.label, // label
+    obj.selected, // selected
+    obj.text, // text
+    obj.value, // value
+  ];
+}
+
+export function extractCompactHTMLOutputElement(obj: HTMLOutputElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.defaultValue, // default_value
+    obj.name, // name
+    obj.type, // type
+    obj.value, // value
+    obj.htmlFor, // html_for
+    obj.validationMessage, // validation_message
+    obj.willValidate, // will_validate
+  ];
+}
+
+export function extractCompactHTMLParagraphElement(obj: HTMLParagraphElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.align, // align
+  ];
+}
+
+export function extractCompactHTMLPictureElement(obj: HTMLPictureElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+  ];
+}
+
+export function extractCompactHTMLPreElement(obj: HTMLPreElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.width, // width
+  ];
+}
+
+export function extractCompactHTMLProgressElement(obj: HTMLProgressElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.max, // max
+    obj.position, // position
+    obj.value, // value
+  ];
+}
+
+export function extractCompactHTMLQuoteElement(obj: HTMLQuoteElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.cite, // cite
+  ];
+}
+
+export function extractCompactHTMLScriptElement(obj: HTMLScriptElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.async, // async_
+    obj.crossOrigin ?? null, // cross_origin
+    obj.defer, // defer
+    obj.fetchPriority, // fetch_priority
+    obj.integrity, // integrity
+    obj.noModule, // no_module
+    obj.referrerPolicy, // referrer_policy
+    obj.src, // src
+    obj.text, // text
+    obj.type, // type
+    obj.charset, // charset
+    obj.event, // event
+    obj.htmlFor, // html_for
+  ];
+}
+
+export function extractCompactHTMLSelectElement(obj: HTMLSelectElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.autocomplete, // autocomplete
+    obj.disabled, // disabled
+    obj.length, // length
+    obj.multiple, // multiple
+    obj.name, // name
+    obj.required, // required
+    obj.selectedIndex, // selected_index
+    obj.size, // size
+    obj.type, // type
+    obj.value, // value
+    obj.validationMessage, // validation_message
+    obj.willValidate, // will_validate
+  ];
+}
+
+export function extractCompactHTMLSlotElement(obj: HTMLSlotElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.name, // name
+  ];
+}
+
+export function extractCompactHTMLSourceElement(obj: HTMLSourceElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.height, // height
+    obj.media, // media
+    obj.sizes, // sizes
+    obj.src, // src
+    obj.srcset, // srcset
+    obj.type, // type
+    obj.width, // width
+  ];
+}
+
+export function extractCompactHTMLSpanElement(obj: HTMLSpanElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+  ];
+}
+
+export function extractCompactHTMLStyleElement(obj: HTMLStyleElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.media, // media
+    obj.type, // type
+    obj.disabled, // disabled
+  ];
+}
+
+export function extractCompactHTMLTableCaptionElement(obj: HTMLTableCaptionElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.align, // align
+  ];
+}
+
+export function extractCompactHTMLTableCellElement(obj: HTMLTableCellElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.abbr, // abbr
+    obj.cellIndex, // cell_index
+    obj.colSpan, // col_span
+    obj.headers, // headers
+    obj.rowSpan, // row_span
+    obj.scope, // scope
+    obj.align, // align
+    obj.axis, // axis
+    obj.bgColor, // bg_color
+    obj.ch, // ch
+    obj.chOff, // ch_off
+    obj.height, // height
+    obj.noWrap, // no_wrap
+    obj.vAlign, // v_align
+    obj.width, // width
+  ];
+}
+
+export function extractCompactHTMLTableColElement(obj: HTMLTableColElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.span, // span
+    obj.align, // align
+    obj.ch, // ch
+    obj.chOff, // ch_off
+    obj.vAlign, // v_align
+    obj.width, // width
+  ];
+}
+
+export function extractCompactHTMLTableElement(obj: HTMLTableElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.align, // align
+    obj.bgColor, // bg_color
+    obj.border, // border
+    obj.cellPadding, // cell_padding
+    obj.cellSpacing, // cell_spacing
+    obj.frame, // frame
+    obj.rules, // rules
+    obj.summary, // summary
+    obj.width, // width
+  ];
+}
+
+export function extractCompactHTMLTableRowElement(obj: HTMLTableRowElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.rowIndex, // row_index
+    obj.sectionRowIndex, // section_row_index
+    obj.align, // align
+    obj.bgColor, // bg_color
+    obj.ch, // ch
+    obj.chOff, // ch_off
+    obj.vAlign, // v_align
+  ];
+}
+
+export function extractCompactHTMLTableSectionElement(obj: HTMLTableSectionElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.align, // align
+    obj.ch, // ch
+    obj.chOff, // ch_off
+    obj.vAlign, // v_align
+  ];
+}
+
+export function extractCompactHTMLTemplateElement(obj: HTMLTemplateElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+  ];
+}
+
+export function extractCompactHTMLTextAreaElement(obj: HTMLTextAreaElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.autocomplete, // autocomplete
+    obj.cols, // cols
+    obj.defaultValue, // default_value
+    obj.dirName, // dir_name
+    obj.disabled, // disabled
+    obj.maxLength, // max_length
+    obj.minLength, // min_length
+    obj.name, // name
+    obj.placeholder, // placeholder
+    obj.readOnly, // read_only
+    obj.required, // required
+    obj.rows, // rows
+    obj.selectionDirection ?? null, // selection_direction
+    obj.selectionEnd ?? null, // selection_end
+    obj.selectionStart ?? null, // selection_start
+    obj.value, // value
+    obj.wrap, // wrap
+    obj.textLength, // text_length
+    obj.validationMessage, // validation_message
+    obj.willValidate, // will_validate
+  ];
+}
+
+export function extractCompactHTMLTimeElement(obj: HTMLTimeElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.dateTime, // datetime
+  ];
+}
+
+export function extractCompactHTMLTitleElement(obj: HTMLTitleElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.text, // text
+  ];
+}
+
+export function extractCompactHTMLTrackElement(obj: HTMLTrackElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.default, // default
+    obj.kind, // kind
+    obj.label, // label
+    obj.readyState, // ready_state
+    obj.src, // src
+    obj.srclang, // srclang
+  ];
+}
+
+export function extractCompactHTMLUListElement(obj: HTMLUListElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.compact, // compact
+    obj.type, // type
+  ];
+}
+
+export function extractCompactHTMLVideoElement(obj: HTMLVideoElement) {
+  return [
+    obj.autofocus, // autofocus
+    obj.tabIndex, // tab_index
+    obj.nonce ?? null, // nonce
+    obj.id, // id
+    obj.className, // class_name
+    obj.tagName.toLowerCase(), // tag_name
+    obj.localName, // local_name
+    obj.clientHeight, // client_height
+    obj.clientLeft, // client_left
+    obj.clientTop, // client_top
+    obj.clientWidth, // client_width
+    obj.scrollHeight, // scroll_height
+    obj.scrollLeft, // scroll_left
+    obj.scrollTop, // scroll_top
+    obj.scrollWidth, // scroll_width
+    obj.slot, // slot
+    obj.accessKey, // access_key
+    obj.accessKeyLabel ?? null, // access_key_label
+    obj.autocapitalize, // autocapitalize
+    obj.dir, // dir
+    obj.draggable, // draggable
+    obj.hidden, // hidden
+    obj.inert, // inert
+    obj.lang, // lang
+    obj.offsetHeight, // offset_height
+    obj.offsetLeft, // offset_left
+    obj.offsetTop, // offset_top
+    obj.offsetWidth, // offset_width
+    obj.popover ?? null, // popover
+    obj.spellcheck, // spellcheck
+    obj.title, // title
+    obj.translate, // translate
+    obj.writingSuggestions, // writing_suggestions
+    obj.contentEditable, // content_editable
+    obj.enterKeyHint, // enter_key_hint
+    obj.isContentEditable, // is_content_editable
+    obj.inputMode, // input_mode
+    obj.autoplay, // autoplay
+    obj.controls, // controls
+    obj.crossOrigin ?? null, // cross_origin
+    obj.currentSrc, // current_src
+    obj.currentTime, // current_time
+    obj.defaultMuted, // default_muted
+    obj.defaultPlaybackRate, // default_playback_rate
+    obj.duration, // duration
+    obj.ended, // ended
+    obj.loop, // loop
+    obj.muted, // muted
+    obj.networkState, // network_state
+    obj.paused, // paused
+    obj.playbackRate, // playback_rate
+    obj.preload, // preload
+    obj.readyState, // ready_state
+    obj.seeking, // seeking
+    obj.src, // src
+    obj.volume, // volume
+    obj.preservesPitch, // preserves_pitch
+    obj.height, // height
+    obj.poster, // poster
+    obj.videoHeight, // video_height
+    obj.videoWidth, // video_width
+    obj.width, // width
+    obj.playsInline, // plays_inline
+  ];
+}
+
+export function extractCompactHTMLElement(elt: HTMLElement): object {
+  switch (elt.tagName) {
+    case "A":
+      return extractCompactHTMLAnchorElement(elt as HTMLAnchorElement);
+    case "AREA":
+      return extractCompactHTMLAreaElement(elt as HTMLAreaElement);
+    case "AUDIO":
+      return extractCompactHTMLAudioElement(elt as HTMLAudioElement);
+    case "BASE":
+      return extractCompactHTMLBaseElement(elt as HTMLBaseElement);
+    case "BODY":
+      return extractCompactHTMLBodyElement(elt as HTMLBodyElement);
+    case "BR":
+      return extractCompactHTMLBRElement(elt as HTMLBRElement);
+    case "BUTTON":
+      return extractCompactHTMLButtonElement(elt as HTMLButtonElement);
+    case "CITE":
+      return extractCompactHTMLCiteElement(elt as HTMLElement);
+    case "DATA":
+      return extractCompactHTMLDataElement(elt as HTMLDataElement);
+    case "DETAILS":
+      return extractCompactHTMLDetailsElement(elt as HTMLDetailsElement);
+    case "DIALOG":
+      return extractCompactHTMLDialogElement(elt as HTMLDialogElement);
+    case "DIV":
+      return extractCompactHTMLDivElement(elt as HTMLDivElement);
+    case "DL":
+      return extractCompactHTMLDListElement(elt as HTMLDListElement);
+    case "EMBED":
+      return extractCompactHTMLEmbedElement(elt as HTMLEmbedElement);
+    case "FIELDSET":
+      return extractCompactHTMLFieldSetElement(elt as HTMLFieldSetElement);
+    case "FORM":
+      return extractCompactHTMLFormElement(elt as HTMLFormElement);
+    case "HEAD":
+      return extractCompactHTMLHeadElement(elt as HTMLHeadElement);
+    case "H1":
+    case "H2":
+    case "H3":
+    case "H4":
+    case "H5":
+    case "H6":
+      return extractCompactHTMLHeadingElement(elt as HTMLHeadingElement);
+    case "HR":
+      return extractCompactHTMLHRElement(elt as HTMLHRElement);
+    case "HTML":
+      return extractCompactHTMLHtmlElement(elt as HTMLHtmlElement);
+    case "IFRAME":
+      return extractCompactHTMLIFrameElement(elt as HTMLIFrameElement);
+    case "IMG":
+      return extractCompactHTMLImageElement(elt as HTMLImageElement);
+    case "INPUT":
+      return extractCompactHTMLInputElement(elt as HTMLInputElement);
+    case "LABEL":
+      return extractCompactHTMLLabelElement(elt as HTMLLabelElement);
+    case "LI":
+      return extractCompactHTMLLiElement(elt as HTMLLIElement);
+    case "LINK":
+      return extractCompactHTMLLinkElement(elt as HTMLLinkElement);
+    case "MAP":
+      return extractCompactHTMLMapElement(elt as HTMLMapElement);
+    case "MENU":
+      return extractCompactHTMLMenuElement(elt as HTMLMenuElement);
+    case "META":
+      return extractCompactHTMLMetaElement(elt as HTMLMetaElement);
+    case "METER":
+      return extractCompactHTMLMeterElement(elt as HTMLMeterElement);
+    case "INS":
+    case "DEL":
+      return extractCompactHTMLModElement(elt as HTMLModElement);
+    case "OL":
+      return extractCompactHTMLOListElement(elt as HTMLOListElement);
+    case "OBJECT":
+      return extractCompactHTMLObjectElement(elt as HTMLObjectElement);
+    case "OPTGROUP":
+      return extractCompactHTMLOptGroupElement(elt as HTMLOptGroupElement);
+    case "OPTION":
+      return extractCompactHTMLOptionElement(elt as HTMLOptionElement);
+    case "OUTPUT":
+      return extractCompactHTMLOutputElement(elt as HTMLOutputElement);
+    case "P":
+      return extractCompactHTMLParagraphElement(elt as HTMLParagraphElement);
+    case "PICTURE":
+      return extractCompactHTMLPictureElement(elt as HTMLPictureElement);
+    case "PRE":
+      return extractCompactHTMLPreElement(elt as HTMLPreElement);
+    case "PROGRESS":
+      return extractCompactHTMLProgressElement(elt as HTMLProgressElement);
+    case "Q":
+    case "BLOCKQUOTE":
+      return extractCompactHTMLQuoteElement(elt as HTMLQuoteElement);
+    case "SCRIPT":
+      return extractCompactHTMLScriptElement(elt as HTMLScriptElement);
+    case "SELECT":
+      return extractCompactHTMLSelectElement(elt as HTMLSelectElement);
+    case "SLOT":
+      return extractCompactHTMLSlotElement(elt as HTMLSlotElement);
+    case "SOURCE":
+      return extractCompactHTMLSourceElement(elt as HTMLSourceElement);
+    case "SPAN":
+      return extractCompactHTMLSpanElement(elt as HTMLSpanElement);
+    case "STYLE":
+      return extractCompactHTMLStyleElement(elt as HTMLStyleElement);
+    case "CAPTION":
+      return extractCompactHTMLTableCaptionElement(elt as HTMLTableCaptionElement);
+    case "TD":
+    case "TH":
+      return extractCompactHTMLTableCellElement(elt as HTMLTableCellElement);
+    case "COL":
+    case "COLGROUP":
+      return extractCompactHTMLTableColElement(elt as HTMLTableColElement);
+    case "TABLE":
+      return extractCompactHTMLTableElement(elt as HTMLTableElement);
+    case "TR":
+      return extractCompactHTMLTableRowElement(elt as HTMLTableRowElement);
+    case "THEAD":
+    case "TBODY":
+    case "TFOOT":
+      return extractCompactHTMLTableSectionElement(elt as HTMLTableSectionElement);
+    case "TEMPLATE":
+      return extractCompactHTMLTemplateElement(elt as HTMLTemplateElement);
+    case "TEXTAREA":
+      return extractCompactHTMLTextAreaElement(elt as HTMLTextAreaElement);
+    case "TIME":
+      return extractCompactHTMLTimeElement(elt as HTMLTimeElement);
+    case "TITLE":
+      return extractCompactHTMLTitleElement(elt as HTMLTitleElement);
+    case "TRACK":
+      return extractCompactHTMLTrackElement(elt as HTMLTrackElement);
+    case "UL":
+      return extractCompactHTMLUListElement(elt as HTMLUListElement);
+    case "VIDEO":
+      return extractCompactHTMLVideoElement(elt as HTMLVideoElement);
+    default:
+      throw new Error(
+        `Unexpected HTML element tag: ${elt.tagName} (update reflex_experiment/elements.py)`
+      );
+  }
+}
+
+export function extractCompactSyntheticEvent(evt: React.SyntheticEvent) {
+  return { __compact__: ["36026b73", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactUIEvent(evt: React.UIEvent) {
+  return { __compact__: ["f286ec9f", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.detail, // detail
+  ] };
+}
+
+export function extractCompactDataTransfer(obj: DataTransfer) {
+  return [
+    obj.dropEffect, // drop_effect
+    obj.effectAllowed, // effect_allowed
+    Array.from(obj.items, (item0: any) => extractCompactDataTransferItem(item0 as DataTransferItem)), // items
+    Array.from(obj.types), // types
+  ];
+}
+
+export function extractCompactDataTransferItem(obj: DataTransferItem) {
+  return [
+    obj.kind, // kind
+    obj.type, // type
+  ];
+}
+
+export function extractCompactClipboardEvent(evt: React.ClipboardEvent) {
+  return { __compact__: ["66ae2aa1", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    extractCompactDataTransfer(evt.clipboardData as DataTransfer), // clipboard_data
+  ] };
+}
+
+export function extractCompactCompositionEvent(evt: React.CompositionEvent) {
+  return { __compact__: ["7ebb5be9", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.data, // data
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLElementBase(evt: React.FocusEvent) {
+  return { __compact__: ["108650af", [
+    extractCompactHTMLElementBase(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLMediaElement(evt: React.FocusEvent) {
+  return { __compact__: ["98ca6155", [
+    extractCompactHTMLMediaElement(evt.target as HTMLMediaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLAnchorElement(evt: React.FocusEvent) {
+  return { __compact__: ["3af6d7f9", [
+    extractCompactHTMLAnchorElement(evt.target as HTMLAnchorElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLAreaElement(evt: React.FocusEvent) {
+  return { __compact__: ["1e36c31a", [
+    extractCompactHTMLAreaElement(evt.target as HTMLAreaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLAudioElement(evt: React.FocusEvent) {
+  return { __compact__: ["db4b654d", [
+    extractCompactHTMLAudioElement(evt.target as HTMLAudioElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLBaseElement(evt: React.FocusEvent) {
+  return { __compact__: ["3a4d14e4", [
+    extractCompactHTMLBaseElement(evt.target as HTMLBaseElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLBodyElement(evt: React.FocusEvent) {
+  return { __compact__: ["579eac52", [
+    extractCompactHTMLBodyElement(evt.target as HTMLBodyElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLBRElement(evt: React.FocusEvent) {
+  return { __compact__: ["0aa3b138", [
+    extractCompactHTMLBRElement(evt.target as HTMLBRElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLButtonElement(evt: React.FocusEvent) {
+  return { __compact__: ["8fd24d3a", [
+    extractCompactHTMLButtonElement(evt.target as HTMLButtonElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLCiteElement(evt: React.FocusEvent) {
+  return { __compact__: ["3165b57f", [
+    extractCompactHTMLCiteElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLDataElement(evt: React.FocusEvent) {
+  return { __compact__: ["d32708a1", [
+    extractCompactHTMLDataElement(evt.target as HTMLDataElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLDetailsElement(evt: React.FocusEvent) {
+  return { __compact__: ["e9f265c7", [
+    extractCompactHTMLDetailsElement(evt.target as HTMLDetailsElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLDialogElement(evt: React.FocusEvent) {
+  return { __compact__: ["8c8c129a", [
+    extractCompactHTMLDialogElement(evt.target as HTMLDialogElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLDivElement(evt: React.FocusEvent) {
+  return { __compact__: ["a0b2a76b", [
+    extractCompactHTMLDivElement(evt.target as HTMLDivElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLDListElement(evt: React.FocusEvent) {
+  return { __compact__: ["fad142f7", [
+    extractCompactHTMLDListElement(evt.target as HTMLDListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLEmbedElement(evt: React.FocusEvent) {
+  return { __compact__: ["1039e090", [
+    extractCompactHTMLEmbedElement(evt.target as HTMLEmbedElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLFieldSetElement(evt: React.FocusEvent) {
+  return { __compact__: ["9cd054c3", [
+    extractCompactHTMLFieldSetElement(evt.target as HTMLFieldSetElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLFormElement(evt: React.FocusEvent) {
+  return { __compact__: ["45e333dc", [
+    extractCompactHTMLFormElement(evt.target as HTMLFormElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLHeadElement(evt: React.FocusEvent) {
+  return { __compact__: ["cb6e24cd", [
+    extractCompactHTMLHeadElement(evt.target as HTMLHeadElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLHeadingElement(evt: React.FocusEvent) {
+  return { __compact__: ["2cd20f0e", [
+    extractCompactHTMLHeadingElement(evt.target as HTMLHeadingElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLHRElement(evt: React.FocusEvent) {
+  return { __compact__: ["a21279d9", [
+    extractCompactHTMLHRElement(evt.target as HTMLHRElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLHtmlElement(evt: React.FocusEvent) {
+  return { __compact__: ["5785f6a0", [
+    extractCompactHTMLHtmlElement(evt.target as HTMLHtmlElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLIFrameElement(evt: React.FocusEvent) {
+  return { __compact__: ["1c015bf6", [
+    extractCompactHTMLIFrameElement(evt.target as HTMLIFrameElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLImageElement(evt: React.FocusEvent) {
+  return { __compact__: ["581b1653", [
+    extractCompactHTMLImageElement(evt.target as HTMLImageElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLInputElement(evt: React.FocusEvent) {
+  return { __compact__: ["bdb53d22", [
+    extractCompactHTMLInputElement(evt.target as HTMLInputElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLLabelElement(evt: React.FocusEvent) {
+  return { __compact__: ["325b805a", [
+    extractCompactHTMLLabelElement(evt.target as HTMLLabelElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLLiElement(evt: React.FocusEvent) {
+  return { __compact__: ["848a9dc9", [
+    extractCompactHTMLLiElement(evt.target as HTMLLIElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLLinkElement(evt: React.FocusEvent) {
+  return { __compact__: ["1caec1b5", [
+    extractCompactHTMLLinkElement(evt.target as HTMLLinkElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLMapElement(evt: React.FocusEvent) {
+  return { __compact__: ["4b6447aa", [
+    extractCompactHTMLMapElement(evt.target as HTMLMapElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLMenuElement(evt: React.FocusEvent) {
+  return { __compact__: ["f280051f", [
+    extractCompactHTMLMenuElement(evt.target as HTMLMenuElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLMetaElement(evt: React.FocusEvent) {
+  return { __compact__: ["a227d0b2", [
+    extractCompactHTMLMetaElement(evt.target as HTMLMetaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLMeterElement(evt: React.FocusEvent) {
+  return { __compact__: ["19d4a095", [
+    extractCompactHTMLMeterElement(evt.target as HTMLMeterElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLModElement(evt: React.FocusEvent) {
+  return { __compact__: ["adb19908", [
+    extractCompactHTMLModElement(evt.target as HTMLModElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLOListElement(evt: React.FocusEvent) {
+  return { __compact__: ["746aae43", [
+    extractCompactHTMLOListElement(evt.target as HTMLOListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLObjectElement(evt: React.FocusEvent) {
+  return { __compact__: ["b53eb0db", [
+    extractCompactHTMLObjectElement(evt.target as HTMLObjectElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLOptGroupElement(evt: React.FocusEvent) {
+  return { __compact__: ["a8dd6093", [
+    extractCompactHTMLOptGroupElement(evt.target as HTMLOptGroupElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLOptionElement(evt: React.FocusEvent) {
+  return { __compact__: ["aa22bc4a", [
+    extractCompactHTMLOptionElement(evt.target as HTMLOptionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLOutputElement(evt: React.FocusEvent) {
+  return { __compact__: ["85fb0d0f", [
+    extractCompactHTMLOutputElement(evt.target as HTMLOutputElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLParagraphElement(evt: React.FocusEvent) {
+  return { __compact__: ["7b9fdef7", [
+    extractCompactHTMLParagraphElement(evt.target as HTMLParagraphElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLPictureElement(evt: React.FocusEvent) {
+  return { __compact__: ["cec2e7c8", [
+    extractCompactHTMLPictureElement(evt.target as HTMLPictureElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLPreElement(evt: React.FocusEvent) {
+  return { __compact__: ["803d32f7", [
+    extractCompactHTMLPreElement(evt.target as HTMLPreElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLProgressElement(evt: React.FocusEvent) {
+  return { __compact__: ["32440dc5", [
+    extractCompactHTMLProgressElement(evt.target as HTMLProgressElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLQuoteElement(evt: React.FocusEvent) {
+  return { __compact__: ["7f42a567", [
+    extractCompactHTMLQuoteElement(evt.target as HTMLQuoteElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLScriptElement(evt: React.FocusEvent) {
+  return { __compact__: ["e54715c2", [
+    extractCompactHTMLScriptElement(evt.target as HTMLScriptElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLSelectElement(evt: React.FocusEvent) {
+  return { __compact__: ["3af07b5e", [
+    extractCompactHTMLSelectElement(evt.target as HTMLSelectElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLSlotElement(evt: React.FocusEvent) {
+  return { __compact__: ["a44559c8", [
+    extractCompactHTMLSlotElement(evt.target as HTMLSlotElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLSourceElement(evt: React.FocusEvent) {
+  return { __compact__: ["d909f9ae", [
+    extractCompactHTMLSourceElement(evt.target as HTMLSourceElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLSpanElement(evt: React.FocusEvent) {
+  return { __compact__: ["1622a983", [
+    extractCompactHTMLSpanElement(evt.target as HTMLSpanElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLStyleElement(evt: React.FocusEvent) {
+  return { __compact__: ["cf2a1794", [
+    extractCompactHTMLStyleElement(evt.target as HTMLStyleElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTableCaptionElement(evt: React.FocusEvent) {
+  return { __compact__: ["7b5d1712", [
+    extractCompactHTMLTableCaptionElement(evt.target as HTMLTableCaptionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTableCellElement(evt: React.FocusEvent) {
+  return { __compact__: ["51b9924e", [
+    extractCompactHTMLTableCellElement(evt.target as HTMLTableCellElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTableColElement(evt: React.FocusEvent) {
+  return { __compact__: ["4265a657", [
+    extractCompactHTMLTableColElement(evt.target as HTMLTableColElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTableElement(evt: React.FocusEvent) {
+  return { __compact__: ["f1feefe8", [
+    extractCompactHTMLTableElement(evt.target as HTMLTableElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTableRowElement(evt: React.FocusEvent) {
+  return { __compact__: ["cb7674e1", [
+    extractCompactHTMLTableRowElement(evt.target as HTMLTableRowElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTableSectionElement(evt: React.FocusEvent) {
+  return { __compact__: ["2181bd59", [
+    extractCompactHTMLTableSectionElement(evt.target as HTMLTableSectionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTemplateElement(evt: React.FocusEvent) {
+  return { __compact__: ["b06b1aea", [
+    extractCompactHTMLTemplateElement(evt.target as HTMLTemplateElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTextAreaElement(evt: React.FocusEvent) {
+  return { __compact__: ["37685914", [
+    extractCompactHTMLTextAreaElement(evt.target as HTMLTextAreaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTimeElement(evt: React.FocusEvent) {
+  return { __compact__: ["1ddeaafa", [
+    extractCompactHTMLTimeElement(evt.target as HTMLTimeElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTitleElement(evt: React.FocusEvent) {
+  return { __compact__: ["e9e2a72d", [
+    extractCompactHTMLTitleElement(evt.target as HTMLTitleElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLTrackElement(evt: React.FocusEvent) {
+  return { __compact__: ["35e391fa", [
+    extractCompactHTMLTrackElement(evt.target as HTMLTrackElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLUListElement(evt: React.FocusEvent) {
+  return { __compact__: ["038ac87d", [
+    extractCompactHTMLUListElement(evt.target as HTMLUListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFocusEvent_HTMLVideoElement(evt: React.FocusEvent) {
+  return { __compact__: ["7507c24b", [
+    extractCompactHTMLVideoElement(evt.target as HTMLVideoElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+  ] };
+}
+
+export function extractCompactFormEvent(evt: React.FormEvent) {
+  return { __compact__: ["36026b73", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLElementBase(evt: React.InvalidEvent) {
+  return { __compact__: ["b3854c4f", [
+    extractCompactHTMLElementBase(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLMediaElement(evt: React.InvalidEvent) {
+  return { __compact__: ["e13ef77b", [
+    extractCompactHTMLMediaElement(evt.target as HTMLMediaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLAnchorElement(evt: React.InvalidEvent) {
+  return { __compact__: ["af76334c", [
+    extractCompactHTMLAnchorElement(evt.target as HTMLAnchorElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLAreaElement(evt: React.InvalidEvent) {
+  return { __compact__: ["8c0ab82e", [
+    extractCompactHTMLAreaElement(evt.target as HTMLAreaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLAudioElement(evt: React.InvalidEvent) {
+  return { __compact__: ["3b587a72", [
+    extractCompactHTMLAudioElement(evt.target as HTMLAudioElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLBaseElement(evt: React.InvalidEvent) {
+  return { __compact__: ["c3c358bc", [
+    extractCompactHTMLBaseElement(evt.target as HTMLBaseElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLBodyElement(evt: React.InvalidEvent) {
+  return { __compact__: ["f21f4f6a", [
+    extractCompactHTMLBodyElement(evt.target as HTMLBodyElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLBRElement(evt: React.InvalidEvent) {
+  return { __compact__: ["c6dca738", [
+    extractCompactHTMLBRElement(evt.target as HTMLBRElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLButtonElement(evt: React.InvalidEvent) {
+  return { __compact__: ["e30ec666", [
+    extractCompactHTMLButtonElement(evt.target as HTMLButtonElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLCiteElement(evt: React.InvalidEvent) {
+  return { __compact__: ["64654713", [
+    extractCompactHTMLCiteElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLDataElement(evt: React.InvalidEvent) {
+  return { __compact__: ["34ab5892", [
+    extractCompactHTMLDataElement(evt.target as HTMLDataElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLDetailsElement(evt: React.InvalidEvent) {
+  return { __compact__: ["dd90907c", [
+    extractCompactHTMLDetailsElement(evt.target as HTMLDetailsElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLDialogElement(evt: React.InvalidEvent) {
+  return { __compact__: ["601e3e18", [
+    extractCompactHTMLDialogElement(evt.target as HTMLDialogElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLDivElement(evt: React.InvalidEvent) {
+  return { __compact__: ["999ecfa4", [
+    extractCompactHTMLDivElement(evt.target as HTMLDivElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLDListElement(evt: React.InvalidEvent) {
+  return { __compact__: ["e7e7834b", [
+    extractCompactHTMLDListElement(evt.target as HTMLDListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLEmbedElement(evt: React.InvalidEvent) {
+  return { __compact__: ["574d60d4", [
+    extractCompactHTMLEmbedElement(evt.target as HTMLEmbedElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLFieldSetElement(evt: React.InvalidEvent) {
+  return { __compact__: ["b04d73d7", [
+    extractCompactHTMLFieldSetElement(evt.target as HTMLFieldSetElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLFormElement(evt: React.InvalidEvent) {
+  return { __compact__: ["171259e7", [
+    extractCompactHTMLFormElement(evt.target as HTMLFormElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLHeadElement(evt: React.InvalidEvent) {
+  return { __compact__: ["2f3600e0", [
+    extractCompactHTMLHeadElement(evt.target as HTMLHeadElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLHeadingElement(evt: React.InvalidEvent) {
+  return { __compact__: ["0555b5b9", [
+    extractCompactHTMLHeadingElement(evt.target as HTMLHeadingElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLHRElement(evt: React.InvalidEvent) {
+  return { __compact__: ["f8d0a087", [
+    extractCompactHTMLHRElement(evt.target as HTMLHRElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLHtmlElement(evt: React.InvalidEvent) {
+  return { __compact__: ["8f2ff160", [
+    extractCompactHTMLHtmlElement(evt.target as HTMLHtmlElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLIFrameElement(evt: React.InvalidEvent) {
+  return { __compact__: ["5455d67b", [
+    extractCompactHTMLIFrameElement(evt.target as HTMLIFrameElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLImageElement(evt: React.InvalidEvent) {
+  return { __compact__: ["53bde7ec", [
+    extractCompactHTMLImageElement(evt.target as HTMLImageElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLInputElement(evt: React.InvalidEvent) {
+  return { __compact__: ["68c234a5", [
+    extractCompactHTMLInputElement(evt.target as HTMLInputElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLLabelElement(evt: React.InvalidEvent) {
+  return { __compact__: ["939387aa", [
+    extractCompactHTMLLabelElement(evt.target as HTMLLabelElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLLiElement(evt: React.InvalidEvent) {
+  return { __compact__: ["52ea38c5", [
+    extractCompactHTMLLiElement(evt.target as HTMLLIElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLLinkElement(evt: React.InvalidEvent) {
+  return { __compact__: ["51683ca2", [
+    extractCompactHTMLLinkElement(evt.target as HTMLLinkElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLMapElement(evt: React.InvalidEvent) {
+  return { __compact__: ["030f0223", [
+    extractCompactHTMLMapElement(evt.target as HTMLMapElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLMenuElement(evt: React.InvalidEvent) {
+  return { __compact__: ["b4d64da9", [
+    extractCompactHTMLMenuElement(evt.target as HTMLMenuElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLMetaElement(evt: React.InvalidEvent) {
+  return { __compact__: ["b1e16705", [
+    extractCompactHTMLMetaElement(evt.target as HTMLMetaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLMeterElement(evt: React.InvalidEvent) {
+  return { __compact__: ["abc82d09", [
+    extractCompactHTMLMeterElement(evt.target as HTMLMeterElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLModElement(evt: React.InvalidEvent) {
+  return { __compact__: ["44c13153", [
+    extractCompactHTMLModElement(evt.target as HTMLModElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLOListElement(evt: React.InvalidEvent) {
+  return { __compact__: ["15675ec8", [
+    extractCompactHTMLOListElement(evt.target as HTMLOListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLObjectElement(evt: React.InvalidEvent) {
+  return { __compact__: ["9906e37a", [
+    extractCompactHTMLObjectElement(evt.target as HTMLObjectElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLOptGroupElement(evt: React.InvalidEvent) {
+  return { __compact__: ["73fbb3bd", [
+    extractCompactHTMLOptGroupElement(evt.target as HTMLOptGroupElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLOptionElement(evt: React.InvalidEvent) {
+  return { __compact__: ["3afb8165", [
+    extractCompactHTMLOptionElement(evt.target as HTMLOptionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLOutputElement(evt: React.InvalidEvent) {
+  return { __compact__: ["db0785ed", [
+    extractCompactHTMLOutputElement(evt.target as HTMLOutputElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLParagraphElement(evt: React.InvalidEvent) {
+  return { __compact__: ["0b5db9d3", [
+    extractCompactHTMLParagraphElement(evt.target as HTMLParagraphElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLPictureElement(evt: React.InvalidEvent) {
+  return { __compact__: ["dca76d93", [
+    extractCompactHTMLPictureElement(evt.target as HTMLPictureElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLPreElement(evt: React.InvalidEvent) {
+  return { __compact__: ["899dbb41", [
+    extractCompactHTMLPreElement(evt.target as HTMLPreElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLProgressElement(evt: React.InvalidEvent) {
+  return { __compact__: ["8c18ca82", [
+    extractCompactHTMLProgressElement(evt.target as HTMLProgressElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLQuoteElement(evt: React.InvalidEvent) {
+  return { __compact__: ["13ed6d36", [
+    extractCompactHTMLQuoteElement(evt.target as HTMLQuoteElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLScriptElement(evt: React.InvalidEvent) {
+  return { __compact__: ["92f42aa6", [
+    extractCompactHTMLScriptElement(evt.target as HTMLScriptElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLSelectElement(evt: React.InvalidEvent) {
+  return { __compact__: ["d5216902", [
+    extractCompactHTMLSelectElement(evt.target as HTMLSelectElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLSlotElement(evt: React.InvalidEvent) {
+  return { __compact__: ["3ae6bee4", [
+    extractCompactHTMLSlotElement(evt.target as HTMLSlotElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLSourceElement(evt: React.InvalidEvent) {
+  return { __compact__: ["33da4b0d", [
+    extractCompactHTMLSourceElement(evt.target as HTMLSourceElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLSpanElement(evt: React.InvalidEvent) {
+  return { __compact__: ["bfa7e8b3", [
+    extractCompactHTMLSpanElement(evt.target as HTMLSpanElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLStyleElement(evt: React.InvalidEvent) {
+  return { __compact__: ["e7e7b03c", [
+    extractCompactHTMLStyleElement(evt.target as HTMLStyleElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTableCaptionElement(evt: React.InvalidEvent) {
+  return { __compact__: ["b1ddae10", [
+    extractCompactHTMLTableCaptionElement(evt.target as HTMLTableCaptionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTableCellElement(evt: React.InvalidEvent) {
+  return { __compact__: ["c61768ea", [
+    extractCompactHTMLTableCellElement(evt.target as HTMLTableCellElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTableColElement(evt: React.InvalidEvent) {
+  return { __compact__: ["25488b6c", [
+    extractCompactHTMLTableColElement(evt.target as HTMLTableColElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTableElement(evt: React.InvalidEvent) {
+  return { __compact__: ["25d5ddca", [
+    extractCompactHTMLTableElement(evt.target as HTMLTableElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTableRowElement(evt: React.InvalidEvent) {
+  return { __compact__: ["a6ac8c09", [
+    extractCompactHTMLTableRowElement(evt.target as HTMLTableRowElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTableSectionElement(evt: React.InvalidEvent) {
+  return { __compact__: ["61aa543c", [
+    extractCompactHTMLTableSectionElement(evt.target as HTMLTableSectionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTemplateElement(evt: React.InvalidEvent) {
+  return { __compact__: ["f2a979b2", [
+    extractCompactHTMLTemplateElement(evt.target as HTMLTemplateElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTextAreaElement(evt: React.InvalidEvent) {
+  return { __compact__: ["ed8dff31", [
+    extractCompactHTMLTextAreaElement(evt.target as HTMLTextAreaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTimeElement(evt: React.InvalidEvent) {
+  return { __compact__: ["8582dfef", [
+    extractCompactHTMLTimeElement(evt.target as HTMLTimeElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTitleElement(evt: React.InvalidEvent) {
+  return { __compact__: ["1761fa71", [
+    extractCompactHTMLTitleElement(evt.target as HTMLTitleElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLTrackElement(evt: React.InvalidEvent) {
+  return { __compact__: ["b4f1bde2", [
+    extractCompactHTMLTrackElement(evt.target as HTMLTrackElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLUListElement(evt: React.InvalidEvent) {
+  return { __compact__: ["3789263c", [
+    extractCompactHTMLUListElement(evt.target as HTMLUListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactInvalidEvent_HTMLVideoElement(evt: React.InvalidEvent) {
+  return { __compact__: ["4ec979d6", [
+    extractCompactHTMLVideoElement(evt.target as HTMLVideoElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLElementBase(evt: React.ChangeEvent) {
+  return { __compact__: ["b3854c4f", [
+    extractCompactHTMLElementBase(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLMediaElement(evt: React.ChangeEvent) {
+  return { __compact__: ["e13ef77b", [
+    extractCompactHTMLMediaElement(evt.target as HTMLMediaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLAnchorElement(evt: React.ChangeEvent) {
+  return { __compact__: ["af76334c", [
+    extractCompactHTMLAnchorElement(evt.target as HTMLAnchorElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLAreaElement(evt: React.ChangeEvent) {
+  return { __compact__: ["8c0ab82e", [
+    extractCompactHTMLAreaElement(evt.target as HTMLAreaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLAudioElement(evt: React.ChangeEvent) {
+  return { __compact__: ["3b587a72", [
+    extractCompactHTMLAudioElement(evt.target as HTMLAudioElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLBaseElement(evt: React.ChangeEvent) {
+  return { __compact__: ["c3c358bc", [
+    extractCompactHTMLBaseElement(evt.target as HTMLBaseElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLBodyElement(evt: React.ChangeEvent) {
+  return { __compact__: ["f21f4f6a", [
+    extractCompactHTMLBodyElement(evt.target as HTMLBodyElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLBRElement(evt: React.ChangeEvent) {
+  return { __compact__: ["c6dca738", [
+    extractCompactHTMLBRElement(evt.target as HTMLBRElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLButtonElement(evt: React.ChangeEvent) {
+  return { __compact__: ["e30ec666", [
+    extractCompactHTMLButtonElement(evt.target as HTMLButtonElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLCiteElement(evt: React.ChangeEvent) {
+  return { __compact__: ["64654713", [
+    extractCompactHTMLCiteElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLDataElement(evt: React.ChangeEvent) {
+  return { __compact__: ["34ab5892", [
+    extractCompactHTMLDataElement(evt.target as HTMLDataElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLDetailsElement(evt: React.ChangeEvent) {
+  return { __compact__: ["dd90907c", [
+    extractCompactHTMLDetailsElement(evt.target as HTMLDetailsElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLDialogElement(evt: React.ChangeEvent) {
+  return { __compact__: ["601e3e18", [
+    extractCompactHTMLDialogElement(evt.target as HTMLDialogElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLDivElement(evt: React.ChangeEvent) {
+  return { __compact__: ["999ecfa4", [
+    extractCompactHTMLDivElement(evt.target as HTMLDivElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLDListElement(evt: React.ChangeEvent) {
+  return { __compact__: ["e7e7834b", [
+    extractCompactHTMLDListElement(evt.target as HTMLDListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLEmbedElement(evt: React.ChangeEvent) {
+  return { __compact__: ["574d60d4", [
+    extractCompactHTMLEmbedElement(evt.target as HTMLEmbedElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLFieldSetElement(evt: React.ChangeEvent) {
+  return { __compact__: ["b04d73d7", [
+    extractCompactHTMLFieldSetElement(evt.target as HTMLFieldSetElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLFormElement(evt: React.ChangeEvent) {
+  return { __compact__: ["171259e7", [
+    extractCompactHTMLFormElement(evt.target as HTMLFormElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLHeadElement(evt: React.ChangeEvent) {
+  return { __compact__: ["2f3600e0", [
+    extractCompactHTMLHeadElement(evt.target as HTMLHeadElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLHeadingElement(evt: React.ChangeEvent) {
+  return { __compact__: ["0555b5b9", [
+    extractCompactHTMLHeadingElement(evt.target as HTMLHeadingElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLHRElement(evt: React.ChangeEvent) {
+  return { __compact__: ["f8d0a087", [
+    extractCompactHTMLHRElement(evt.target as HTMLHRElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLHtmlElement(evt: React.ChangeEvent) {
+  return { __compact__: ["8f2ff160", [
+    extractCompactHTMLHtmlElement(evt.target as HTMLHtmlElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLIFrameElement(evt: React.ChangeEvent) {
+  return { __compact__: ["5455d67b", [
+    extractCompactHTMLIFrameElement(evt.target as HTMLIFrameElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLImageElement(evt: React.ChangeEvent) {
+  return { __compact__: ["53bde7ec", [
+    extractCompactHTMLImageElement(evt.target as HTMLImageElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLInputElement(evt: React.ChangeEvent) {
+  return { __compact__: ["68c234a5", [
+    extractCompactHTMLInputElement(evt.target as HTMLInputElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLLabelElement(evt: React.ChangeEvent) {
+  return { __compact__: ["939387aa", [
+    extractCompactHTMLLabelElement(evt.target as HTMLLabelElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLLiElement(evt: React.ChangeEvent) {
+  return { __compact__: ["52ea38c5", [
+    extractCompactHTMLLiElement(evt.target as HTMLLIElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLLinkElement(evt: React.ChangeEvent) {
+  return { __compact__: ["51683ca2", [
+    extractCompactHTMLLinkElement(evt.target as HTMLLinkElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLMapElement(evt: React.ChangeEvent) {
+  return { __compact__: ["030f0223", [
+    extractCompactHTMLMapElement(evt.target as HTMLMapElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLMenuElement(evt: React.ChangeEvent) {
+  return { __compact__: ["b4d64da9", [
+    extractCompactHTMLMenuElement(evt.target as HTMLMenuElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLMetaElement(evt: React.ChangeEvent) {
+  return { __compact__: ["b1e16705", [
+    extractCompactHTMLMetaElement(evt.target as HTMLMetaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLMeterElement(evt: React.ChangeEvent) {
+  return { __compact__: ["abc82d09", [
+    extractCompactHTMLMeterElement(evt.target as HTMLMeterElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLModElement(evt: React.ChangeEvent) {
+  return { __compact__: ["44c13153", [
+    extractCompactHTMLModElement(evt.target as HTMLModElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLOListElement(evt: React.ChangeEvent) {
+  return { __compact__: ["15675ec8", [
+    extractCompactHTMLOListElement(evt.target as HTMLOListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLObjectElement(evt: React.ChangeEvent) {
+  return { __compact__: ["9906e37a", [
+    extractCompactHTMLObjectElement(evt.target as HTMLObjectElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLOptGroupElement(evt: React.ChangeEvent) {
+  return { __compact__: ["73fbb3bd", [
+    extractCompactHTMLOptGroupElement(evt.target as HTMLOptGroupElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLOptionElement(evt: React.ChangeEvent) {
+  return { __compact__: ["3afb8165", [
+    extractCompactHTMLOptionElement(evt.target as HTMLOptionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLOutputElement(evt: React.ChangeEvent) {
+  return { __compact__: ["db0785ed", [
+    extractCompactHTMLOutputElement(evt.target as HTMLOutputElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLParagraphElement(evt: React.ChangeEvent) {
+  return { __compact__: ["0b5db9d3", [
+    extractCompactHTMLParagraphElement(evt.target as HTMLParagraphElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLPictureElement(evt: React.ChangeEvent) {
+  return { __compact__: ["dca76d93", [
+    extractCompactHTMLPictureElement(evt.target as HTMLPictureElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLPreElement(evt: React.ChangeEvent) {
+  return { __compact__: ["899dbb41", [
+    extractCompactHTMLPreElement(evt.target as HTMLPreElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLProgressElement(evt: React.ChangeEvent) {
+  return { __compact__: ["8c18ca82", [
+    extractCompactHTMLProgressElement(evt.target as HTMLProgressElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLQuoteElement(evt: React.ChangeEvent) {
+  return { __compact__: ["13ed6d36", [
+    extractCompactHTMLQuoteElement(evt.target as HTMLQuoteElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLScriptElement(evt: React.ChangeEvent) {
+  return { __compact__: ["92f42aa6", [
+    extractCompactHTMLScriptElement(evt.target as HTMLScriptElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLSelectElement(evt: React.ChangeEvent) {
+  return { __compact__: ["d5216902", [
+    extractCompactHTMLSelectElement(evt.target as HTMLSelectElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLSlotElement(evt: React.ChangeEvent) {
+  return { __compact__: ["3ae6bee4", [
+    extractCompactHTMLSlotElement(evt.target as HTMLSlotElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLSourceElement(evt: React.ChangeEvent) {
+  return { __compact__: ["33da4b0d", [
+    extractCompactHTMLSourceElement(evt.target as HTMLSourceElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLSpanElement(evt: React.ChangeEvent) {
+  return { __compact__: ["bfa7e8b3", [
+    extractCompactHTMLSpanElement(evt.target as HTMLSpanElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLStyleElement(evt: React.ChangeEvent) {
+  return { __compact__: ["e7e7b03c", [
+    extractCompactHTMLStyleElement(evt.target as HTMLStyleElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTableCaptionElement(evt: React.ChangeEvent) {
+  return { __compact__: ["b1ddae10", [
+    extractCompactHTMLTableCaptionElement(evt.target as HTMLTableCaptionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTableCellElement(evt: React.ChangeEvent) {
+  return { __compact__: ["c61768ea", [
+    extractCompactHTMLTableCellElement(evt.target as HTMLTableCellElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTableColElement(evt: React.ChangeEvent) {
+  return { __compact__: ["25488b6c", [
+    extractCompactHTMLTableColElement(evt.target as HTMLTableColElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTableElement(evt: React.ChangeEvent) {
+  return { __compact__: ["25d5ddca", [
+    extractCompactHTMLTableElement(evt.target as HTMLTableElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTableRowElement(evt: React.ChangeEvent) {
+  return { __compact__: ["a6ac8c09", [
+    extractCompactHTMLTableRowElement(evt.target as HTMLTableRowElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTableSectionElement(evt: React.ChangeEvent) {
+  return { __compact__: ["61aa543c", [
+    extractCompactHTMLTableSectionElement(evt.target as HTMLTableSectionElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTemplateElement(evt: React.ChangeEvent) {
+  return { __compact__: ["f2a979b2", [
+    extractCompactHTMLTemplateElement(evt.target as HTMLTemplateElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTextAreaElement(evt: React.ChangeEvent) {
+  return { __compact__: ["ed8dff31", [
+    extractCompactHTMLTextAreaElement(evt.target as HTMLTextAreaElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTimeElement(evt: React.ChangeEvent) {
+  return { __compact__: ["8582dfef", [
+    extractCompactHTMLTimeElement(evt.target as HTMLTimeElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTitleElement(evt: React.ChangeEvent) {
+  return { __compact__: ["1761fa71", [
+    extractCompactHTMLTitleElement(evt.target as HTMLTitleElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLTrackElement(evt: React.ChangeEvent) {
+  return { __compact__: ["b4f1bde2", [
+    extractCompactHTMLTrackElement(evt.target as HTMLTrackElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLUListElement(evt: React.ChangeEvent) {
+  return { __compact__: ["3789263c", [
+    extractCompactHTMLUListElement(evt.target as HTMLUListElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactChangeEvent_HTMLVideoElement(evt: React.ChangeEvent) {
+  return { __compact__: ["4ec979d6", [
+    extractCompactHTMLVideoElement(evt.target as HTMLVideoElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+  ] };
+}
+
+export function extractCompactAnimationEvent(evt: React.AnimationEvent) {
+  return { __compact__: ["d1111e34", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.animationName, // animation_name
+    evt.elapsedTime, // elapsed_time
+    evt.pseudoElement, // pseudo_element
+  ] };
+}
+
+export function extractCompactToggleEvent(evt: React.ToggleEvent) {
+  return { __compact__: ["ecae522b", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.oldState, // old_state
+    evt.newState, // new_state
+  ] };
+}
+
+export function extractCompactTransitionEvent(evt: React.TransitionEvent) {
+  return { __compact__: ["50b683d8", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.elapsedTime, // elapsed_time
+    evt.propertyName, // property_name
+    evt.pseudoElement, // pseudo_element
+  ] };
+}
+
+export function extractCompactMouseEvent(evt: React.MouseEvent) {
+  return { __compact__: ["8312ee39", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.detail, // detail
+    evt.altKey, // alt_key
+    evt.button, // button
+    evt.buttons, // buttons
+    evt.clientX, // client_x
+    evt.clientY, // client_y
+    evt.ctrlKey, // ctrl_key
+    evt.metaKey, // meta_key
+    evt.movementX, // movement_x
+    evt.movementY, // movement_y
+    evt.pageX, // page_x
+    evt.pageY, // page_y
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+    evt.screenX, // screen_x
+    evt.screenY, // screen_y
+    evt.shiftKey, // shift_key
+  ] };
+}
+
+export function extractCompactKeyboardEvent(evt: React.KeyboardEvent) {
+  return { __compact__: ["04e62b4e", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.detail, // detail
+    evt.altKey, // alt_key
+    evt.ctrlKey, // ctrl_key
+    evt.code, // code
+    evt.key, // key
+    evt.locale, // locale
+    evt.location, // location
+    evt.metaKey, // meta_key
+    evt.repeat, // repeat
+    evt.shiftKey, // shift_key
+  ] };
+}
+
+export function extractCompactTouch(obj: Touch) {
+  return [
+    extractCompactHTMLElement(obj.target as HTMLElement), // target
+    obj.identifier, // identifier
+    obj.screenX, // screen_x
+    obj.screenY, // screen_y
+    obj.clientX, // client_x
+    obj.clientY, // client_y
+    obj.pageX, // page_x
+    obj.pageY, // page_y
+  ];
+}
+
+export function extractCompactTouchEvent(evt: React.TouchEvent) {
+  return { __compact__: ["3af423c7", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.detail, // detail
+    evt.altKey, // alt_key
+    Array.from(evt.changedTouches, (item0: any) => extractCompactTouch(item0 as Touch)), // changed_touches
+    evt.ctrlKey, // ctrl_key
+    evt.metaKey, // meta_key
+    evt.shiftKey, // shift_key
+    Array.from(evt.targetTouches, (item0: any) => extractCompactTouch(item0 as Touch)), // target_touches
+    Array.from(evt.touches, (item0: any) => extractCompactTouch(item0 as Touch)), // touches
+  ] };
+}
+
+export function extractCompactDragEvent(evt: React.DragEvent) {
+  return { __compact__: ["e2834a0e", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.detail, // detail
+    evt.altKey, // alt_key
+    evt.button, // button
+    evt.buttons, // buttons
+    evt.clientX, // client_x
+    evt.clientY, // client_y
+    evt.ctrlKey, // ctrl_key
+    evt.metaKey, // meta_key
+    evt.movementX, // movement_x
+    evt.movementY, // movement_y
+    evt.pageX, // page_x
+    evt.pageY, // page_y
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+    evt.screenX, // screen_x
+    evt.screenY, // screen_y
+    evt.shiftKey, // shift_key
+    extractCompactDataTransfer(evt.dataTransfer as DataTransfer), // data_transfer
+  ] };
+}
+
+export function extractCompactPointerEvent(evt: React.PointerEvent) {
+  return { __compact__: ["af8d5e70", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.detail, // detail
+    evt.altKey, // alt_key
+    evt.button, // button
+    evt.buttons, // buttons
+    evt.clientX, // client_x
+    evt.clientY, // client_y
+    evt.ctrlKey, // ctrl_key
+    evt.metaKey, // meta_key
+    evt.movementX, // movement_x
+    evt.movementY, // movement_y
+    evt.pageX, // page_x
+    evt.pageY, // page_y
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+    evt.screenX, // screen_x
+    evt.screenY, // screen_y
+    evt.shiftKey, // shift_key
+    evt.pointerId, // pointer_id
+    evt.pressure, // pressure
+    evt.tangentialPressure, // tangential_pressure
+    evt.tiltX, // tilt_x
+    evt.tiltY, // tilt_y
+    evt.twist, // twist
+    evt.width, // width
+    evt.height, // height
+    evt.pointerType, // pointer_type
+    evt.isPrimary, // is_primary
+  ] };
+}
+
+export function extractCompactWheelEvent(evt: React.WheelEvent) {
+  return { __compact__: ["ee1a6a2c", [
+    extractCompactHTMLElement(evt.target as HTMLElement), // target
+    evt.bubbles, // bubbles
+    evt.cancelable, // cancelable
+    evt.defaultPrevented, // default_prevented
+    evt.eventPhase, // event_phase
+    evt.isTrusted, // is_trusted
+    evt.timeStamp, // timestamp
+    evt.type, // type
+    evt.detail, // detail
+    evt.altKey, // alt_key
+    evt.button, // button
+    evt.buttons, // buttons
+    evt.clientX, // client_x
+    evt.clientY, // client_y
+    evt.ctrlKey, // ctrl_key
+    evt.metaKey, // meta_key
+    evt.movementX, // movement_x
+    evt.movementY, // movement_y
+    evt.pageX, // page_x
+    evt.pageY, // page_y
+    evt.relatedTarget ? extractCompactHTMLElement(evt.relatedTarget as HTMLElement) : null, // related_target
+    evt.screenX, // screen_x
+    evt.screenY, // screen_y
+    evt.shiftKey, // shift_key
+    evt.deltaMode, // delta_mode
+    evt.deltaX, // delta_x
+    evt.deltaY, // delta_y
+    evt.deltaZ, // delta_z
+  ] };
+}
@@ -0,0 +1,134 @@
+// Client-side scheduling of event chains, used by `reflex_experiment/events.py`.
+// The wrapped function is the whole `(_var) => addEvents(...)` chain, so events
+// that get dropped are never extracted nor sent to the backend.
+
+type EventChainFn = (...args: any[]) => void;
+
+type RateLimitMode = "throttle" | "debounce" | "coalesce";
+
+type RateLimiterState = {
+  last: number;
+  fn: EventChainFn;
+  args: any[];
+  pending: ReturnType<typeof setTimeout> | number | null;
+};
+
+// Client-side state is kept per element, so that the rows rendered by a
+// `foreach` (which share the same trigger and event chain) don't share it.
+// Triggers that aren't called with a DOM event fall back to the key alone.
+const elementStates = new WeakMap<object, Map<string, any>>();
+const globalStates = new Map<string, any>();
+
+function statesOf(event: any): Map<string, any> {
+  const element = event?.currentTarget;
+  if (element === null || typeof element !== "object") {
+    return globalStates;
+  }
+  let states = elementStates.get(element);
+  if (!states) {
+    states = new Map();
+    elementStates.set(element, states);
+  }
+  return states;
+}
+
+export function rateLimitEvent(
+  mode: RateLimitMode,
+  intervalMs: number,
+  key: string,
+  fn: EventChainFn
+): EventChainFn {
+  return (...args: any[]) => {
+    const states = statesOf(args[0]);
+    let state: RateLimiterState | undefined = states.get(key);
+    if (!state) {
+      state = { last: -Infinity, fn, args, pending: null };
+      states.set(key, state);
+    }
+    // Always run the latest event with the chain from the latest render
+    state.fn = fn;
+    state.args = args;
+    const flush = () => {
+      state.pending = null;
+      state.last = performance.now();
+      state.fn(...state.args);
+    };
+
+    switch (mode) {
+      case "throttle": {
+        // Leading call, then at most one trailing call per interval
+        const wait = state.last + intervalMs - performance.now();
+        if (wait <= 0 && state.pending === null) {
+          flush();
+        } else if (state.pending === null) {
+          state.pending = setTimeout(flush, wait);
+        }
+        break;
+      }
+      case "debounce": {
+        if (state.pending !== null) {
+          clearTimeout(state.pending as ReturnType<typeof setTimeout>);
+        }
+        state.pending = setTimeout(flush, intervalMs);
+        break;
+      }
+      case "coalesce": {
+        // Latest event wins, delivered once per animation frame
+        if (state.pending === null) {
+          state.pending = requestAnimationFrame(flush);
+        }
+        break;
+      }
+    }
+  };
+}
+
+type EventBatchState = {
+  events: any[];
+  fn: EventChainFn;
+  pending: ReturnType<typeof setTimeout> | number | null;
+};
+
+// Buffer already extracted event payloads and deliver them together, once per
+// animation frame (windowMs === null) or per time window. The buffer belongs to
+// the element the event was triggered on.
+export function batchEvent(
+  key: string,
+  event: unknown,
+  windowMs: number | null,
+  maxEvents: number | null,
+  payload: unknown,
+  fn: EventChainFn
+) {
+  const states = statesOf(event);
+  let batch: EventBatchState | undefined = states.get(key);
+  if (!batch) {
+    batch = { events: [], fn, pending: null };
+    states.set(key, batch);
+  }
+  batch.fn = fn;
+  batch.events.push(payload);
+
+  const flush = () => {
+    const events = batch.events;
+    batch.events = [];
+    batch.pending = null;
+    batch.fn(events);
+  };
+
+  if (maxEvents !== null && batch.events.length >= maxEvents) {
+    if (batch.pending !== null) {
+      if (windowMs === null) {
+        cancelAnimationFrame(batch.pending as number);
+      } else {
+        clearTimeout(batch.pending as ReturnType<typeof setTimeout>);
+      }
+    }
+    flush();
+  } else if (batch.pending === null) {
+    batch.pending =
+      windowMs === null
+        ? requestAnimationFrame(flush)
+        : setTimeout(flush, windowMs);
+  }
+}
@@ -1,872 +1,3040 @@
-/* === IMPORTANT === 
-/* The contents of this file
-*/
+// ------------------- DO NOT EDIT ----------------------
+// This file was generated by `reflex_experiment/extractor_generator.py`!
+// ------------------------------------------------------
 
-import { SyntheticEvent } from "react";
+import React from "react";
+import { snapshotElement } from "./snapshots";
 
-// used for untyped stuff, like nativeEvent
-export function cleanForSerialization(obj: unknown) {
-  const result = _cleanForSerializationRecursive(obj, new WeakSet());
-  return result;
+export function extractHTMLElementBase(obj: HTMLElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+  };
 }
 
-function _cleanForSerializationRecursive(obj: unknown, seen: WeakSet<WeakKey>) {
-  if (obj === null || typeof obj !== "object") {
-    return obj;
-  }
-  if (seen.has(obj)) {
-    return undefined; // handle circular refs
-  }
+export function extractHTMLMediaElement(obj: HTMLMediaElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    autoplay: obj.autoplay,
+    controls: obj.controls,
+    cross_origin: obj.crossOrigin ?? null,
+    current_src: obj.currentSrc,
+    current_time: obj.currentTime,
+    default_muted: obj.defaultMuted,
+    default_playback_rate: obj.defaultPlaybackRate,
+    duration: obj.duration,
+    ended: obj.ended,
+    loop: obj.loop,
+    muted: obj.muted,
+    network_state: obj.networkState,
+    paused: obj.paused,
+    playback_rate: obj.playbackRate,
+    preload: obj.preload,
+    ready_state: obj.readyState,
+    seeking: obj.seeking,
+    src: obj.src,
+    volume: obj.volume,
+    preserves_pitch: obj.preservesPitch,
+  };
+}
 
-  seen.add(obj);
+export function extractHTMLAnchorElement(obj: HTMLAnchorElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    hash: obj.hash,
+    host: obj.host,
+    hostname: obj.hostname,
+    href: obj.href,
+    origin: obj.origin,
+    password: obj.password,
+    pathname: obj.pathname,
+    port: obj.port,
+    protocol: obj.protocol,
+    search: obj.search,
+    target: obj.target,
+    download: obj.download,
+    rel: obj.rel,
+    hreflang: obj.hreflang,
+    type: obj.type,
+    username: obj.username,
+    ping: obj.ping,
+    referrer_policy: obj.referrerPolicy,
+    text: obj.text,
+  };
+}
 
-  if (Array.isArray(obj)) {
-    const cleanedArray = obj
-      .map((item) => _cleanForSerializationRecursive(item, seen))
-      .filter((item) => item !== undefined);
+export function extractHTMLAreaElement(obj: HTMLAreaElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    alt: obj.alt,
+    coords: obj.coords,
+    download: obj.download,
+    hash: obj.hash,
+    host: obj.host,
+    hostname: obj.hostname,
+    href: obj.href,
+    origin: obj.origin,
+    password: obj.password,
+    pathname: obj.pathname,
+    port: obj.port,
+    protocol: obj.protocol,
+    rel: obj.rel,
+    search: obj.search,
+    shape: obj.shape,
+    target: obj.target,
+    username: obj.username,
+    ping: obj.ping,
+    referrer_policy: obj.referrerPolicy,
+  };
+}
 
-    return cleanedArray;
-  }
+export function extractHTMLAudioElement(obj: HTMLAudioElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    autoplay: obj.autoplay,
+    controls: obj.controls,
+    cross_origin: obj.crossOrigin ?? null,
+    current_src: obj.currentSrc,
+    current_time: obj.currentTime,
+    default_muted: obj.defaultMuted,
+    default_playback_rate: obj.defaultPlaybackRate,
+    duration: obj.duration,
+    ended: obj.ended,
+    loop: obj.loop,
+    muted: obj.muted,
+    network_state: obj.networkState,
+    paused: obj.paused,
+    playback_rate: obj.playbackRate,
+    preload: obj.preload,
+    ready_state: obj.readyState,
+    seeking: obj.seeking,
+    src: obj.src,
+    volume: obj.volume,
+    preserves_pitch: obj.preservesPitch,
+  };
+}
 
-  const plainObject = {};
-
-  for (const key in obj) {
-    const value = obj[key];
-
-    if (typeof key !== "string") {
-      continue;
-    }
-    if (
-      typeof value === "function" ||
-      typeof value === "symbol" ||
-      typeof value === "undefined"
-    ) {
-      continue;
-    }
-
-    const cleanedValue = _cleanForSerializationRecursive(value, seen);
-    if (key === "target") {
-      console.log("Cleaned target value:", cleanedValue);
-    }
-    if (cleanedValue !== undefined) {
-      plainObject[key] = cleanedValue;
-    }
-  }
+export function extractHTMLBaseElement(obj: HTMLBaseElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    href: obj.href,
+    target: obj.target,
+  };
+}
 
-  return plainObject;
-}
-
-export function extractElement(elt: Element): object {
-  return {
-    id: elt.id,
-    class_name: elt.className,
-    tag_name: elt.tagName.toLowerCase(),
-    local_name: elt.localName,
-    client_height: elt.clientHeight,
-    client_left: elt.clientLeft,
-    client_top: elt.clientTop,
-    client_width: elt.clientWidth,
-    scroll_height: elt.scrollHeight,
-    scroll_left: elt.scrollLeft,
-    scroll_top: elt.scrollTop,
-    scroll_width: elt.scrollWidth,
-    slot: elt.slot,
-  };
-}
-
-export function extractHTMLOrSVGElement(elt: HTMLOrSVGElement) {
-  return {
-    autofocus: elt.autofocus,
-    tab_index: elt.tabIndex,
-    nonce: elt.nonce,
-  };
-}
-
-export function extractHTMLElementBase(elt: HTMLElement) {
-  return {
-    ...extractElement(elt),
-    ...extractHTMLOrSVGElement(elt),
-    access_key: elt.accessKey,
-    access_key_label: elt.accessKeyLabel,
-    autocapitalize: elt.autocapitalize,
-    dir: elt.dir,
-    draggable: elt.draggable,
-    hidden: elt.hidden,
-    inert: elt.inert,
-    lang: elt.lang,
-    offset_height: elt.offsetHeight,
-    offset_left: elt.offsetLeft,
-    offset_top: elt.offsetTop,
-    offset_width: elt.offsetWidth,
-    popover: elt.popover,
-    spellcheck: elt.spellcheck,
-    title: elt.title,
-    translate: elt.translate,
-    writing_suggestions: elt.writingSuggestions,
-    content_editable: elt.contentEditable,
-    enter_key_hint: elt.enterKeyHint,
-    is_content_editable: elt.isContentEditable,
-    input_mode: elt.inputMode,
-  };
-}
-
-export function extractHTMLAnchorElement(elt: HTMLAnchorElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    hash: elt.hash,
-    host: elt.host,
-    hostname: elt.hostname,
-    href: elt.href,
-    origin: elt.origin,
-    password: elt.password,
-    pathname: elt.pathname,
-    port: elt.port,
-    protocol: elt.protocol,
-    search: elt.search,
-    target: elt.target,
-    download: elt.download,
-    rel: elt.rel,
-    hreflang: elt.hreflang,
-    type: elt.type,
-    username: elt.username,
-    ping: elt.ping,
-    referrer_policy: elt.referrerPolicy,
-    text: elt.text,
-  };
-}
-
-export function extractHTMLAreaElement(elt: HTMLAreaElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    alt: elt.alt,
-    coords: elt.coords,
-    download: elt.download,
-    hash: elt.hash,
-    host: elt.host,
-    hostname: elt.hostname,
-    href: elt.href,
-    origin: elt.origin,
-    password: elt.password,
-    pathname: elt.pathname,
-    port: elt.port,
-    protocol: elt.protocol,
-    rel: elt.rel,
-    search: elt.search,
-    shape: elt.shape,
-    target: elt.target,
-    username: elt.username,
-    ping: elt.ping,
-    referrer_policy: elt.referrerPolicy,
-  };
-}
-
-export function extractHTMLMediaElement(elt: HTMLMediaElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    autoplay: elt.autoplay,
-    controls: elt.controls,
-    cross_origin: elt.crossOrigin,
-    current_src: elt.currentSrc,
-    current_time: elt.currentTime,
-    default_muted: elt.defaultMuted,
-    default_playback_rate: elt.defaultPlaybackRate,
-    duration: elt.duration,
-    ended: elt.ended,
-    loop: elt.loop,
-    muted: elt.muted,
-    network_state: elt.networkState,
-    paused: elt.paused,
-    playback_rate: elt.playbackRate,
-    preload: elt.preload,
-    ready_state: elt.readyState,
-    seeking: elt.seeking,
-    src: elt.src,
-    volume: elt.volume,
-    preserves_pitch: elt.preservesPitch,
-  };
-}
-
-export function extractHTMLAudioElement(elt: HTMLAudioElement) {
-  return {
-    ...extractHTMLMediaElement(elt),
-    // No additional properties for audio elements
-  };
-}
-
-export function extractHTMLButtonElement(elt: HTMLButtonElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    disabled: elt.disabled,
-    name: elt.name,
-    type: elt.type,
-    value: elt.value,
-    form_action: elt.formAction,
-    form_enctype: elt.formEnctype,
-    form_method: elt.formMethod,
-    form_no_validate: elt.formNoValidate,
-    form_target: elt.formTarget,
-    popover_target_action: elt.popoverTargetAction,
-  };
-}
-
-export function extractHTMLDataElement(elt: HTMLDataElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    value: elt.value,
-  };
-}
-
-export function extractHTMLEmbedElement(elt: HTMLEmbedElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    height: elt.height,
-    src: elt.src,
-    type: elt.type,
-    width: elt.width,
-    align: elt.align,
-    name: elt.name,
-  };
-}
-
-export function extractHTMLFieldSetElement(elt: HTMLFieldSetElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    disabled: elt.disabled,
-    name: elt.name,
-    type: elt.type,
-    validation_message: elt.validationMessage,
-    will_validate: elt.willValidate,
-  };
-}
-
-export function extractHTMLFormElement(elt: HTMLFormElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    accept_charset: elt.acceptCharset,
-    action: elt.action,
-    autocomplete: elt.autocomplete,
-    encoding: elt.encoding,
-    enctype: elt.enctype,
-    length: elt.length,
-    method: elt.method,
-    name: elt.name,
-    no_validate: elt.noValidate,
-    target: elt.target,
-    rel: elt.rel,
-  };
-}
-
-export function extractHTMLIFrameElement(elt: HTMLIFrameElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    allow: elt.allow,
-    allow_fullscreen: elt.allowFullscreen,
-    height: elt.height,
-    name: elt.name,
-    referrer_policy: elt.referrerPolicy,
-    src: elt.src,
-    srcdoc: elt.srcdoc,
-    width: elt.width,
-    align: elt.align,
-    frame_border: elt.frameBorder,
-    long_desc: elt.longDesc,
-    margin_height: elt.marginHeight,
-    margin_width: elt.marginWidth,
-    scrolling: elt.scrolling,
-    sandbox: elt.sandbox,
-  };
-}
-
-export function extractHTMLImageElement(elt: HTMLImageElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    alt: elt.alt,
-    cross_origin: elt.crossOrigin,
-    decoding: elt.decoding,
-    height: elt.height,
-    is_map: elt.isMap,
-    loading: elt.loading,
-    natural_height: elt.naturalHeight,
-    natural_width: elt.naturalWidth,
-    referrer_policy: elt.referrerPolicy,
-    sizes: elt.sizes,
-    src: elt.src,
-    srcset: elt.srcset,
-    use_map: elt.useMap,
-    width: elt.width,
-    align: elt.align,
-    border: elt.border,
-    complete: elt.complete,
-    hspace: elt.hspace,
-    long_desc: elt.longDesc,
-    lowsrc: elt.lowsrc,
-    name: elt.name,
-    vspace: elt.vspace,
-    x: elt.x,
-    y: elt.y,
-    fetch_priority: elt.fetchPriority,
-  };
-}
-
-export function extractHTMLInputElement(elt: HTMLInputElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    accept: elt.accept,
-    alt: elt.alt,
-    autocomplete: elt.autocomplete,
-    checked: elt.checked,
-    default_checked: elt.defaultChecked,
-    default_value: elt.defaultValue,
-    dir_name: elt.dirName,
-    disabled: elt.disabled,
-    height: elt.height,
-    indeterminate: elt.indeterminate,
-    max: elt.max,
-    max_length: elt.maxLength,
-    min: elt.min,
-    min_length: elt.minLength,
-    multiple: elt.multiple,
-    name: elt.name,
-    pattern: elt.pattern,
-    placeholder: elt.placeholder,
-    read_only: elt.readOnly,
-    required: elt.required,
-    selection_direction: elt.selectionDirection,
-    selection_end: elt.selectionEnd,
-    selection_start: elt.selectionStart,
-    size: elt.size,
-    src: elt.src,
-    step: elt.step,
-    type: elt.type,
-    value: elt.value,
-    value_as_number: elt.valueAsNumber,
-    width: elt.width,
-    align: elt.align,
-    capture: elt.capture,
-    form_action: elt.formAction,
-    form_enctype: elt.formEnctype,
-    form_method: elt.formMethod,
-    form_no_validate: elt.formNoValidate,
-    form_target: elt.formTarget,
-    use_map: elt.useMap,
-    validation_message: elt.validationMessage,
-    will_validate: elt.willValidate,
-    popover_target_action: elt.popoverTargetAction,
-  };
-}
-
-export function extractHTMLLabelElement(elt: HTMLLabelElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    html_for: elt.htmlFor,
-  };
-}
-
-export function extractHTMLLiElement(elt: HTMLLIElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    value: elt.value,
-    type: elt.type,
-  };
-}
-
-export function extractHTMLLinkElement(elt: HTMLLinkElement) {
-  return {
-    ...extractHTMLElementBase(elt),
-    as: elt.as,
-    cross_origin: elt.crossOrigin,
-    disabled: elt.disabled,
-    fetch_priority: elt.fetchPriority,
-    href: elt.href,
-    href_lang: elt.hreflang,
-    image_sizes: elt.imageSizes,
-    image_srcset: elt.imageSrcset,
-    integrity: elt.integrity,
-    media: elt.media,
-    referrer_policy: elt.referrerPolicy,
-    rel: elt.rel,
-    type: elt.type,
-    charset: elt.charset,
-    rev: elt.rev,
-    target: elt.target,
-    sizes: elt.sizes,
+export function extractHTMLBodyElement(obj: HTMLBodyElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    a_link: obj.aLink,
+    background: obj.background,
+    bg_color: obj.bgColor,
+    link: obj.link,
+    text: obj.text,
+    v_link: obj.vLink,
   };
 }
 
-export function extractHTMLMapElement(elt: HTMLMapElement) {
+export function extractHTMLBRElement(obj: HTMLBRElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    name: elt.name,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    clear: obj.clear,
   };
 }
 
-export function extractHTMLMeterElement(elt: HTMLMeterElement) {
+export function extractHTMLButtonElement(obj: HTMLButtonElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    high: elt.high,
-    low: elt.low,
-    max: elt.max,
-    min: elt.min,
-    optimum: elt.optimum,
-    value: elt.value,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    disabled: obj.disabled,
+    name: obj.name,
+    type: obj.type,
+    value: obj.value,
+    form_action: obj.formAction,
+    form_enctype: obj.formEnctype,
+    form_method: obj.formMethod,
+    form_no_validate: obj.formNoValidate,
+    form_target: obj.formTarget,
+    popover_target_action: obj.popoverTargetAction,
   };
 }
 
-export function extractHTMLModElement(elt: HTMLModElement) {
+export function extractHTMLCiteElement(obj: HTMLElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    cite: elt.cite,
-    dateTime: elt.dateTime,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
   };
 }
 
-export function extractHTMLOListElement(elt: HTMLOListElement) {
+export function extractHTMLDataElement(obj: HTMLDataElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    reversed: elt.reversed,
-    start: elt.start,
-    type: elt.type,
-    compact: elt.compact,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    value: obj.value,
   };
 }
 
-export function extractHTMLObjectElement(elt: HTMLObjectElement) {
+export function extractHTMLDetailsElement(obj: HTMLDetailsElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    data: elt.data,
-    // disabled: elt.disabled,
-    height: elt.height,
-    name: elt.name,
-    type: elt.type,
-    use_map: elt.useMap,
-    width: elt.width,
-    validation_message: elt.validationMessage,
-    will_validate: elt.willValidate,
-    align: elt.align,
-    archive: elt.archive,
-    border: elt.border,
-    code: elt.code,
-    code_base: elt.codeBase,
-    code_type: elt.codeType,
-    declare: elt.declare,
-    hspace: elt.hspace,
-    standby: elt.standby,
-    vspace: elt.vspace,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    open: obj.open,
   };
 }
 
-export function extractHTMLOptGroupElement(elt: HTMLOptGroupElement) {
+export function extractHTMLDialogElement(obj: HTMLDialogElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    disabled: elt.disabled,
-    label: elt.label,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    open: obj.open,
+    return_value: obj.returnValue,
   };
 }
 
-export function extractHTMLOptionElement(elt: HTMLOptionElement) {
+export function extractHTMLDivElement(obj: HTMLDivElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    default_selected: elt.defaultSelected,
-    disabled: elt.disabled,
-    index: elt.index,
-    label: elt.label,
-    selected: elt.selected,
-    text: elt.text,
-    value: elt.value,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    align: obj.align,
   };
 }
 
-export function extractHTMLOutputElement(elt: HTMLOutputElement) {
+export function extractHTMLDListElement(obj: HTMLDListElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    default_value: elt.defaultValue,
-    name: elt.name,
-    type: elt.type,
-    value: elt.value,
-    html_for: elt.htmlFor,
-    validation_message: elt.validationMessage,
-    will_validate: elt.willValidate,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    compact: obj.compact,
   };
 }
 
-export function extractHTMLProgressElement(elt: HTMLProgressElement) {
+export function extractHTMLEmbedElement(obj: HTMLEmbedElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    max: elt.max,
-    position: elt.position,
-    value: elt.value,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    height: obj.height,
+    src: obj.src,
+    type: obj.type,
+    width: obj.width,
+    align: obj.align,
+    name: obj.name,
   };
 }
 
-export function extractHTMLQuoteElement(elt: HTMLQuoteElement) {
+export function extractHTMLFieldSetElement(obj: HTMLFieldSetElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    cite: elt.cite,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    disabled: obj.disabled,
+    name: obj.name,
+    type: obj.type,
+    validation_message: obj.validationMessage,
+    will_validate: obj.willValidate,
   };
 }
 
-export function extractHTMLCiteElement(elt: HTMLElement) {
+export function extractHTMLFormElement(obj: HTMLFormElement) {
   return {
-    ...extractHTMLElementBase(elt),
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    accept_charset: obj.acceptCharset,
+    action: obj.action,
+    autocomplete: obj.autocomplete,
+    encoding: obj.encoding,
+    enctype: obj.enctype,
+    length: obj.length,
+    method: obj.method,
+    name: obj.name,
+    no_validate: obj.noValidate,
+    target: obj.target,
+    rel: obj.rel,
   };
 }
 
-export function extractHTMLScriptElement(elt: HTMLScriptElement) {
+export function extractHTMLHeadElement(obj: HTMLHeadElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    async_: elt.async,
-    cross_origin: elt.crossOrigin,
-    defer: elt.defer,
-    fetch_priority: elt.fetchPriority,
-    integrity: elt.integrity,
-    no_module: elt.noModule,
-    referrer_policy: elt.referrerPolicy,
-    src: elt.src,
-    text: elt.text,
-    type: elt.type,
-    charset: elt.charset,
-    event: (elt as any).event,
-    html_for: (elt as any).htmlFor,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
   };
 }
 
-export function extractHTMLSelectElement(elt: HTMLSelectElement) {
+export function extractHTMLHeadingElement(obj: HTMLHeadingElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    autocomplete: elt.autocomplete,
-    disabled: elt.disabled,
-    length: elt.length,
-    multiple: elt.multiple,
-    name: elt.name,
-    required: elt.required,
-    selected_index: elt.selectedIndex,
-    size: elt.size,
-    type: elt.type,
-    value: elt.value,
-    validation_message: elt.validationMessage,
-    will_validate: elt.willValidate,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    align: obj.align,
   };
 }
 
-export function extractHTMLSlotElement(elt: HTMLSlotElement) {
+export function extractHTMLHRElement(obj: HTMLHRElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    name: elt.name,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    align: obj.align,
+    color: obj.color,
+    no_shade: obj.noShade,
+    size: obj.size,
+    width: obj.width,
   };
 }
 
-export function extractHTMLSourceElement(elt: HTMLSourceElement) {
+export function extractHTMLHtmlElement(obj: HTMLHtmlElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    height: elt.height,
-    media: elt.media,
-    sizes: elt.sizes,
-    src: elt.src,
-    srcset: elt.srcset,
-    type: elt.type,
-    width: elt.width,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    version: obj.version,
   };
 }
 
-export function extractHTMLTableCaptionElement(elt: HTMLTableCaptionElement) {
+export function extractHTMLIFrameElement(obj: HTMLIFrameElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    align: elt.align,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    allow: obj.allow,
+    allow_fullscreen: obj.allowFullscreen,
+    height: obj.height,
+    name: obj.name,
+    referrer_policy: obj.referrerPolicy,
+    src: obj.src,
+    srcdoc: obj.srcdoc,
+    width: obj.width,
+    align: obj.align,
+    frame_border: obj.frameBorder,
+    long_desc: obj.longDesc,
+    margin_height: obj.marginHeight,
+    margin_width: obj.marginWidth,
+    scrolling: obj.scrolling,
+    sandbox: obj.sandbox,
   };
 }
 
-export function extractHTMLTableCellElement(elt: HTMLTableCellElement) {
+export function extractHTMLImageElement(obj: HTMLImageElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    abbr: elt.abbr,
-    cell_index: elt.cellIndex,
-    col_span: elt.colSpan,
-    headers: elt.headers,
-    row_span: elt.rowSpan,
-    scope: elt.scope,
-    align: elt.align,
-    axis: elt.axis,
-    bg_color: elt.bgColor,
-    ch: elt.ch,
-    ch_off: elt.chOff,
-    height: elt.height,
-    no_wrap: elt.noWrap,
-    v_align: elt.vAlign,
-    width: elt.width,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    alt: obj.alt,
+    cross_origin: obj.crossOrigin ?? null,
+    decoding: obj.decoding,
+    height: obj.height,
+    is_map: obj.isMap,
+    loading: obj.loading,
+    natural_height: obj.naturalHeight,
+    natural_width: obj.naturalWidth,
+    referrer_policy: obj.referrerPolicy,
+    sizes: obj.sizes,
+    src: obj.src,
+    srcset: obj.srcset,
+    use_map: obj.useMap,
+    width: obj.width,
+    align: obj.align,
+    border: obj.border,
+    complete: obj.complete,
+    hspace: obj.hspace,
+    long_desc: obj.longDesc,
+    lowsrc: obj.lowsrc,
+    name: obj.name,
+    vspace: obj.vspace,
+    x: obj.x,
+    y: obj.y,
+    fetch_priority: obj.fetchPriority,
   };
 }
 
-export function extractHTMLTableColElement(elt: HTMLTableColElement) {
+export function extractHTMLInputElement(obj: HTMLInputElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    span: elt.span,
-    align: elt.align,
-    ch: elt.ch,
-    ch_off: elt.chOff,
-    v_align: elt.vAlign,
-    width: elt.width,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    accept: obj.accept,
+    alt: obj.alt,
+    autocomplete: obj.autocomplete,
+    checked: obj.checked,
+    default_checked: obj.defaultChecked,
+    default_value: obj.defaultValue,
+    dir_name: obj.dirName,
+    disabled: obj.disabled,
+    height: obj.height,
+    indeterminate: obj.indeterminate,
+    max: obj.max,
+    max_length: obj.maxLength,
+    min: obj.min,
+    min_length: obj.minLength,
+    multiple: obj.multiple,
+    name: obj.name,
+    pattern: obj.pattern,
+    placeholder: obj.placeholder,
+    read_only: obj.readOnly,
+    required: obj.required,
+    selection_direction: obj.selectionDirection ?? null,
+    selection_end: obj.selectionEnd ?? null,
+    selection_start: obj.selectionStart ?? null,
+    size: obj.size,
+    src: obj.src,
+    step: obj.step,
+    type: obj.type,
+    value: obj.value,
+    value_as_number: obj.valueAsNumber ?? null,
+    width: obj.width,
+    align: obj.align,
+    capture: obj.capture,
+    form_action: obj.formAction,
+    form_enctype: obj.formEnctype,
+    form_method: obj.formMethod,
+    form_no_validate: obj.formNoValidate,
+    form_target: obj.formTarget,
+    use_map: obj.useMap,
+    validation_message: obj.validationMessage,
+    will_validate: obj.willValidate,
+    popover_target_action: obj.popoverTargetAction,
   };
 }
 
-export function extractHTMLTableElement(elt: HTMLTableElement) {
+export function extractHTMLLabelElement(obj: HTMLLabelElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    // caption: elt.caption ? extractHTMLTableCaptionElement(elt.caption) : null,
-    align: elt.align,
-    bg_color: elt.bgColor,
-    border: elt.border,
-    cell_padding: elt.cellPadding,
-    cell_spacing: elt.cellSpacing,
-    frame: elt.frame,
-    rules: elt.rules,
-    summary: elt.summary,
-    width: elt.width,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    html_for: obj.htmlFor,
   };
 }
 
-export function extractHTMLTableRowElement(elt: HTMLTableRowElement) {
+export function extractHTMLLiElement(obj: HTMLLIElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    row_index: elt.rowIndex,
-    section_row_index: elt.sectionRowIndex,
-    align: elt.align,
-    bg_color: elt.bgColor,
-    ch: elt.ch,
-    ch_off: elt.chOff,
-    v_align: elt.vAlign,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    value: obj.value,
+    type: obj.type,
   };
 }
 
-export function extractHTMLTableSectionElement(elt: HTMLTableSectionElement) {
+export function extractHTMLLinkElement(obj: HTMLLinkElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    align: elt.align,
-    ch: elt.ch,
-    ch_off: elt.chOff,
-    v_align: elt.vAlign,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    as_: obj.as,
+    cross_origin: obj.crossOrigin ?? null,
+    disabled: obj.disabled,
+    fetch_priority: obj.fetchPriority,
+    href: obj.href,
+    hreflang: obj.hreflang,
+    image_sizes: obj.imageSizes,
+    image_srcset: obj.imageSrcset,
+    integrity: obj.integrity,
+    media: obj.media,
+    referrer_policy: obj.referrerPolicy,
+    rel: obj.rel,
+    type: obj.type,
+    charset: obj.charset,
+    rev: obj.rev,
+    target: obj.target,
+    sizes: obj.sizes,
   };
 }
 
-export function extractHTMLTemplateElement(elt: HTMLTemplateElement) {
+export function extractHTMLMapElement(obj: HTMLMapElement) {
   return {
-    ...extractHTMLElementBase(elt),
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    name: obj.name,
   };
 }
 
-export function extractHTMLTextAreaElement(elt: HTMLTextAreaElement) {
+export function extractHTMLMenuElement(obj: HTMLMenuElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    autocomplete: elt.autocomplete,
-    cols: elt.cols,
-    default_value: elt.defaultValue,
-    dir_name: elt.dirName,
-    disabled: elt.disabled,
-    max_length: elt.maxLength,
-    min_length: elt.minLength,
-    name: elt.name,
-    placeholder: elt.placeholder,
-    read_only: elt.readOnly,
-    required: elt.required,
-    rows: elt.rows,
-    selection_direction: elt.selectionDirection,
-    selection_end: elt.selectionEnd,
-    selection_start: elt.selectionStart,
-    value: elt.value,
-    wrap: elt.wrap,
-    text_length: elt.textLength,
-    validation_message: elt.validationMessage,
-    will_validate: elt.willValidate,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
   };
 }
 
-export function extractHTMLTimeElement(elt: HTMLTimeElement) {
+export function extractHTMLMetaElement(obj: HTMLMetaElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    datetime: elt.dateTime,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    content: obj.content,
+    http_equiv: obj.httpEquiv,
+    name: obj.name,
+    scheme: obj.scheme,
   };
 }
 
-export function extractHTMLTrackElement(elt: HTMLTrackElement) {
+export function extractHTMLMeterElement(obj: HTMLMeterElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    default: elt.default,
-    kind: elt.kind,
-    label: elt.label,
-    ready_state: elt.readyState,
-    src: elt.src,
-    srclang: elt.srclang,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    high: obj.high,
+    low: obj.low,
+    max: obj.max,
+    min: obj.min,
+    optimum: obj.optimum,
+    value: obj.value,
   };
 }
 
-export function extractHTMLVideoElement(elt: HTMLVideoElement) {
+export function extractHTMLModElement(obj: HTMLModElement) {
   return {
-    ...extractHTMLMediaElement(elt),
-    height: elt.height,
-    poster: elt.poster,
-    video_height: elt.videoHeight,
-    video_width: elt.videoWidth,
-    width: elt.width,
-    plays_inline: elt.playsInline,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    cite: obj.cite,
+    date_time: obj.dateTime,
   };
 }
 
-export function extractHTMLBRElement(elt: HTMLBRElement) {
+export function extractHTMLOListElement(obj: HTMLOListElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    clear: elt.clear,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    reversed: obj.reversed,
+    start: obj.start,
+    type: obj.type,
+    compact: obj.compact,
   };
 }
 
-export function extractHTMLBaseElement(elt: HTMLBaseElement) {
+export function extractHTMLObjectElement(obj: HTMLObjectElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    href: elt.href,
-    target: elt.target,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    data: obj.data,
+    height: obj.height,
+    name: obj.name,
+    type: obj.type,
+    use_map: obj.useMap,
+    width: obj.width,
+    align: obj.align,
+    archive: obj.archive,
+    border: obj.border,
+    code: obj.code,
+    code_base: obj.codeBase,
+    code_type: obj.codeType,
+    declare: obj.declare,
+    hspace: obj.hspace,
+    standby: obj.standby,
+    validation_message: obj.validationMessage,
+    vspace: obj.vspace,
+    will_validate: obj.willValidate,
   };
 }
 
-export function extractHTMLBodyElement(elt: HTMLBodyElement) {
+export function extractHTMLOptGroupElement(obj: HTMLOptGroupElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    a_link: elt.aLink,
-    background: elt.background,
-    bg_color: elt.bgColor,
-    link: elt.link,
-    text: elt.text,
-    v_link: elt.vLink,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    disabled: obj.disabled,
+    label: obj.label,
   };
 }
 
-export function extractHTMLDListElement(elt: HTMLDListElement) {
+export function extractHTMLOptionElement(obj: HTMLOptionElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    compact: elt.compact,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    default_selected: obj.defaultSelected,
+    disabled: obj.disabled,
+    index: obj.index,
+    label: obj.label,
+    selected: obj.selected,
+    text: obj.text,
+    value: obj.value,
   };
 }
 
-export function extractHTMLDetailsElement(elt: HTMLDetailsElement) {
+export function extractHTMLOutputElement(obj: HTMLOutputElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    open: elt.open,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    default_value: obj.defaultValue,
+    name: obj.name,
+    type: obj.type,
+    value: obj.value,
+    html_for: obj.htmlFor,
+    validation_message: obj.validationMessage,
+    will_validate: obj.willValidate,
   };
 }
 
-export function extractHTMLDialogElement(elt: HTMLDialogElement) {
+export function extractHTMLParagraphElement(obj: HTMLParagraphElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    open: elt.open,
-    return_value: elt.returnValue,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    align: obj.align,
   };
 }
 
-export function extractHTMLDivElement(elt: HTMLDivElement) {
+export function extractHTMLPictureElement(obj: HTMLPictureElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    align: elt.align,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
   };
 }
 
-export function extractHTMLHeadElement(elt: HTMLHeadElement) {
+export function extractHTMLPreElement(obj: HTMLPreElement) {
   return {
-    ...extractHTMLElementBase(elt),
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    width: obj.width,
   };
 }
 
-export function extractHTMLHeadingElement(elt: HTMLHeadingElement) {
+export function extractHTMLProgressElement(obj: HTMLProgressElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    align: elt.align,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    max: obj.max,
+    position: obj.position,
+    value: obj.value,
   };
 }
 
-export function extractHTMLHRElement(elt: HTMLHRElement) {
+export function extractHTMLQuoteElement(obj: HTMLQuoteElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    align: elt.align,
-    color: elt.color,
-    no_shade: elt.noShade,
-    size: elt.size,
-    width: elt.width,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    cite: obj.cite,
   };
 }
 
-export function extractHTMLHtmlElement(elt: HTMLHtmlElement) {
+export function extractHTMLScriptElement(obj: HTMLScriptElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    version: elt.version,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    async_: obj.async,
+    cross_origin: obj.crossOrigin ?? null,
+    defer: obj.defer,
+    fetch_priority: obj.fetchPriority,
+    integrity: obj.integrity,
+    no_module: obj.noModule,
+    referrer_policy: obj.referrerPolicy,
+    src: obj.src,
+    text: obj.text,
+    type: obj.type,
+    charset: obj.charset,
+    event: obj.event,
+    html_for: obj.htmlFor,
   };
 }
 
-export function extractHTMLMenuElement(elt: HTMLMenuElement) {
+export function extractHTMLSelectElement(obj: HTMLSelectElement) {
   return {
-    ...extractHTMLElementBase(elt),
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    autocomplete: obj.autocomplete,
+    disabled: obj.disabled,
+    length: obj.length,
+    multiple: obj.multiple,
+    name: obj.name,
+    required: obj.required,
+    selected_index: obj.selectedIndex,
+    size: obj.size,
+    type: obj.type,
+    value: obj.value,
+    validation_message: obj.validationMessage,
+    will_validate: obj.willValidate,
   };
 }
 
-export function extractHTMLMetaElement(elt: HTMLMetaElement) {
+export function extractHTMLSlotElement(obj: HTMLSlotElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    content: elt.content,
-    http_equiv: elt.httpEquiv,
-    name: elt.name,
-    scheme: elt.scheme,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    name: obj.name,
   };
 }
 
-export function extractHTMLParagraphElement(elt: HTMLParagraphElement) {
+export function extractHTMLSourceElement(obj: HTMLSourceElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    align: elt.align,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    height: obj.height,
+    media: obj.media,
+    sizes: obj.sizes,
+    src: obj.src,
+    srcset: obj.srcset,
+    type: obj.type,
+    width: obj.width,
   };
 }
 
-export function extractHTMLPictureElement(elt: HTMLPictureElement) {
+export function extractHTMLSpanElement(obj: HTMLSpanElement) {
   return {
-    ...extractHTMLElementBase(elt),
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
   };
 }
 
-export function extractHTMLPreElement(elt: HTMLPreElement) {
+export function extractHTMLStyleElement(obj: HTMLStyleElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    width: elt.width,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    media: obj.media,
+    type: obj.type,
+    disabled: obj.disabled,
   };
 }
 
-export function extractHTMLSpanElement(elt: HTMLSpanElement) {
+export function extractHTMLTableCaptionElement(obj: HTMLTableCaptionElement) {
   return {
-    ...extractHTMLElementBase(elt),
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    align: obj.align,
   };
 }
 
-export function extractHTMLStyleElement(elt: HTMLStyleElement) {
+export function extractHTMLTableCellElement(obj: HTMLTableCellElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    media: elt.media,
-    type: elt.type,
-    disabled: elt.disabled,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    abbr: obj.abbr,
+    cell_index: obj.cellIndex,
+    col_span: obj.colSpan,
+    headers: obj.headers,
+    row_span: obj.rowSpan,
+    scope: obj.scope,
+    align: obj.align,
+    axis: obj.axis,
+    bg_color: obj.bgColor,
+    ch: obj.ch,
+    ch_off: obj.chOff,
+    height: obj.height,
+    no_wrap: obj.noWrap,
+    v_align: obj.vAlign,
+    width: obj.width,
   };
 }
 
-export function extractHTMLTitleElement(elt: HTMLTitleElement) {
+export function extractHTMLTableColElement(obj: HTMLTableColElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    text: elt.text,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    span: obj.span,
+    align: obj.align,
+    ch: obj.ch,
+    ch_off: obj.chOff,
+    v_align: obj.vAlign,
+    width: obj.width,
   };
 }
 
-export function extractHTMLUListElement(elt: HTMLUListElement) {
+export function extractHTMLTableElement(obj: HTMLTableElement) {
   return {
-    ...extractHTMLElementBase(elt),
-    compact: elt.compact,
-    type: elt.type,
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    align: obj.align,
+    bg_color: obj.bgColor,
+    border: obj.border,
+    cell_padding: obj.cellPadding,
+    cell_spacing: obj.cellSpacing,
+    frame: obj.frame,
+    rules: obj.rules,
+    summary: obj.summary,
+    width: obj.width,
   };
 }
 
-export function extractHTMLElement(elt: HTMLElement): object {
-  const tagName = elt.tagName.toUpperCase();
+export function extractHTMLTableRowElement(obj: HTMLTableRowElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    row_index: obj.rowIndex,
+    section_row_index: obj.sectionRowIndex,
+    align: obj.align,
+    bg_color: obj.bgColor,
+    ch: obj.ch,
+    ch_off: obj.chOff,
+    v_align: obj.vAlign,
+  };
+}
+
+export function extractHTMLTableSectionElement(obj: HTMLTableSectionElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    align: obj.align,
+    ch: obj.ch,
+    ch_off: obj.chOff,
+    v_align: obj.vAlign,
+  };
+}
+
+export function extractHTMLTemplateElement(obj: HTMLTemplateElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+  };
+}
+
+export function extractHTMLTextAreaElement(obj: HTMLTextAreaElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    autocomplete: obj.autocomplete,
+    cols: obj.cols,
+    default_value: obj.defaultValue,
+    dir_name: obj.dirName,
+    disabled: obj.disabled,
+    max_length: obj.maxLength,
+    min_length: obj.minLength,
+    name: obj.name,
+    placeholder: obj.placeholder,
+    read_only: obj.readOnly,
+    required: obj.required,
+    rows: obj.rows,
+    selection_direction: obj.selectionDirection ?? null,
+    selection_end: obj.selectionEnd ?? null,
+    selection_start: obj.selectionStart ?? null,
+    value: obj.value,
+    wrap: obj.wrap,
+    text_length: obj.textLength,
+    validation_message: obj.validationMessage,
+    will_validate: obj.willValidate,
+  };
+}
+
+export function extractHTMLTimeElement(obj: HTMLTimeElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    datetime: obj.dateTime,
+  };
+}
+
+export function extractHTMLTitleElement(obj: HTMLTitleElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    text: obj.text,
+  };
+}
+
+export function extractHTMLTrackElement(obj: HTMLTrackElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    default: obj.default,
+    kind: obj.kind,
+    label: obj.label,
+    ready_state: obj.readyState,
+    src: obj.src,
+    srclang: obj.srclang,
+  };
+}
+
+export function extractHTMLUListElement(obj: HTMLUListElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    compact: obj.compact,
+    type: obj.type,
+  };
+}
+
+export function extractHTMLVideoElement(obj: HTMLVideoElement) {
+  return {
+    autofocus: obj.autofocus,
+    tab_index: obj.tabIndex,
+    nonce: obj.nonce ?? null,
+    id: obj.id,
+    class_name: obj.className,
+    tag_name: obj.tagName.toLowerCase(),
+    local_name: obj.localName,
+    client_height: obj.clientHeight,
+    client_left: obj.clientLeft,
+    client_top: obj.clientTop,
+    client_width: obj.clientWidth,
+    scroll_height: obj.scrollHeight,
+    scroll_left: obj.scrollLeft,
+    scroll_top: obj.scrollTop,
+    scroll_width: obj.scrollWidth,
+    slot: obj.slot,
+    access_key: obj.accessKey,
+    access_key_label: obj.accessKeyLabel ?? null,
+    autocapitalize: obj.autocapitalize,
+    dir: obj.dir,
+    draggable: obj.draggable,
+    hidden: obj.hidden,
+    inert: obj.inert,
+    lang: obj.lang,
+    offset_height: obj.offsetHeight,
+    offset_left: obj.offsetLeft,
+    offset_top: obj.offsetTop,
+    offset_width: obj.offsetWidth,
+    popover: obj.popover ?? null,
+    spellcheck: obj.spellcheck,
+    title: obj.title,
+    translate: obj.translate,
+    writing_suggestions: obj.writingSuggestions,
+    content_editable: obj.contentEditable,
+    enter_key_hint: obj.enterKeyHint,
+    is_content_editable: obj.isContentEditable,
+    input_mode: obj.inputMode,
+    autoplay: obj.autoplay,
+    controls: obj.controls,
+    cross_origin: obj.crossOrigin ?? null,
+    current_src: obj.currentSrc,
+    current_time: obj.currentTime,
+    default_muted: obj.defaultMuted,
+    default_playback_rate: obj.defaultPlaybackRate,
+    duration: obj.duration,
+    ended: obj.ended,
+    loop: obj.loop,
+    muted: obj.muted,
+    network_state: obj.networkState,
+    paused: obj.paused,
+    playback_rate: obj.playbackRate,
+    preload: obj.preload,
+    ready_state: obj.readyState,
+    seeking: obj.seeking,
+    src: obj.src,
+    volume: obj.volume,
+    preserves_pitch: obj.preservesPitch,
+    height: obj.height,
+    poster: obj.poster,
+    video_height: obj.videoHeight,
+    video_width: obj.videoWidth,
+    width: obj.width,
+    plays_inline: obj.playsInline,
+  };
+}
 
-  switch (tagName) {
+export function extractHTMLElement(elt: HTMLElement): object {
+  switch (elt.tagName) {
     case "A":
       return extractHTMLAnchorElement(elt as HTMLAnchorElement);
     case "AREA":
@@ -875,24 +3043,14 @@ export function extractHTMLElement(elt: HTMLElement): object {
       return extractHTMLAudioElement(elt as HTMLAudioElement);
     case "BASE":
       return extractHTMLBaseElement(elt as HTMLBaseElement);
-    case "BLOCKQUOTE":
-    case "Q":
-      return extractHTMLQuoteElement(elt as HTMLQuoteElement);
     case "BODY":
       return extractHTMLBodyElement(elt as HTMLBodyElement);
     case "BR":
       return extractHTMLBRElement(elt as HTMLBRElement);
     case "BUTTON":
       return extractHTMLButtonElement(elt as HTMLButtonElement);
-    case "CANVAS": // Placeholder - no specific function yet
-      return extractHTMLElementBase(elt);
-    case "CAPTION":
-      return extractHTMLTableCaptionElement(elt as HTMLTableCaptionElement);
     case "CITE":
-      return extractHTMLCiteElement(elt); // Uses base HTMLElement
-    case "COL":
-    case "COLGROUP":
-      return extractHTMLTableColElement(elt as HTMLTableColElement);
+      return extractHTMLCiteElement(elt as HTMLElement);
     case "DATA":
       return extractHTMLDataElement(elt as HTMLDataElement);
     case "DETAILS":
@@ -909,6 +3067,8 @@ export function extractHTMLElement(elt: HTMLElement): object {
       return extractHTMLFieldSetElement(elt as HTMLFieldSetElement);
     case "FORM":
       return extractHTMLFormElement(elt as HTMLFormElement);
+    case "HEAD":
+      return extractHTMLHeadElement(elt as HTMLHeadElement);
     case "H1":
     case "H2":
     case "H3":
@@ -916,8 +3076,6 @@ export function extractHTMLElement(elt: HTMLElement): object {
     case "H5":
     case "H6":
       return extractHTMLHeadingElement(elt as HTMLHeadingElement);
-    case "HEAD":
-      return extractHTMLHeadElement(elt as HTMLHeadElement);
     case "HR":
       return extractHTMLHRElement(elt as HTMLHRElement);
     case "HTML":
@@ -945,10 +3103,10 @@ export function extractHTMLElement(elt: HTMLElement): object {
     case "INS":
     case "DEL":
       return extractHTMLModElement(elt as HTMLModElement);
-    case "OBJECT":
-      return extractHTMLObjectElement(elt as HTMLObjectElement);
     case "OL":
       return extractHTMLOListElement(elt as HTMLOListElement);
+    case "OBJECT":
+      return extractHTMLObjectElement(elt as HTMLObjectElement);
     case "OPTGROUP":
       return extractHTMLOptGroupElement(elt as HTMLOptGroupElement);
     case "OPTION":
@@ -963,6 +3121,9 @@ export function extractHTMLElement(elt: HTMLElement): object {
       return extractHTMLPreElement(elt as HTMLPreElement);
     case "PROGRESS":
       return extractHTMLProgressElement(elt as HTMLProgressElement);
+    case "Q":
+    case "BLOCKQUOTE":
+      return extractHTMLQuoteElement(elt as HTMLQuoteElement);
     case "SCRIPT":
       return extractHTMLScriptElement(elt as HTMLScriptElement);
     case "SELECT":
@@ -975,15 +3136,22 @@ export function extractHTMLElement(elt: HTMLElement): object {
       return extractHTMLSpanElement(elt as HTMLSpanElement);
     case "STYLE":
       return extractHTMLStyleElement(elt as HTMLStyleElement);
+    case "CAPTION":
+      return extractHTMLTableCaptionElement(elt as HTMLTableCaptionElement);
+    case "TD":
+    case "TH":
+      return extractHTMLTableCellElement(elt as HTMLTableCellElement);
+    case "COL":
+    case "COLGROUP":
+      return extractHTMLTableColElement(elt as HTMLTableColElement);
     case "TABLE":
       return extractHTMLTableElement(elt as HTMLTableElement);
-    case "TBODY":
+    case "TR":
+      return extractHTMLTableRowElement(elt as HTMLTableRowElement);
     case "THEAD":
+    case "TBODY":
     case "TFOOT":
       return extractHTMLTableSectionElement(elt as HTMLTableSectionElement);
-    case "TD":
-    case "TH":
-      return extractHTMLTableCellElement(elt as HTMLTableCellElement);
     case "TEMPLATE":
       return extractHTMLTemplateElement(elt as HTMLTemplateElement);
     case "TEXTAREA":
@@ -992,29 +3160,22 @@ export function extractHTMLElement(elt: HTMLElement): object {
       return extractHTMLTimeElement(elt as HTMLTimeElement);
     case "TITLE":
       return extractHTMLTitleElement(elt as HTMLTitleElement);
-    case "TR":
-      return extractHTMLTableRowElement(elt as HTMLTableRowElement);
     case "TRACK":
       return extractHTMLTrackElement(elt as HTMLTrackElement);
     case "UL":
       return extractHTMLUListElement(elt as HTMLUListElement);
     case "VIDEO":
       return extractHTMLVideoElement(elt as HTMLVideoElement);
-    // Add other tag names as needed
     default:
       throw new Error(
-        `Unexpected HTML element tag: ${elt.tagName} (update .web/custom/serialize.ts)`
+        `Unexpected HTML element tag: ${elt.tagName} (update reflex_experiment/elements.py)`
       );
   }
 }
 
-export function extractSyntheticEvent(evt: React.SyntheticEvent) {
+export function extractSyntheticEvent(evt: React.SyntheticEvent, snapshots = false) {
   return {
-    // Very slow right now, to investigate
-    // nativeEvent: cleanForSerialization(evt.nativeEvent),
-    // use extractHTMLElement in every place where a HTMLElement or generic TElement type is used
-    target: extractHTMLElement(evt.target as HTMLElement), // I think this is true for all or purposes
-    // currentTarget is often not available in Reflex event handlers
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
     bubbles: evt.bubbles,
     cancelable: evt.cancelable,
     default_prevented: evt.defaultPrevented,
@@ -1025,203 +3186,2788 @@ export function extractSyntheticEvent(evt: React.SyntheticEvent) {
   };
 }
 
-export function extractUIEvent(evt: React.UIEvent) {
-  return { ...extractSyntheticEvent(evt), detail: evt.detail };
+export function extractUIEvent(evt: React.UIEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    detail: evt.detail,
+  };
 }
 
-export function extractMouseEvent(evt: React.MouseEvent) {
+export function extractDataTransfer(obj: DataTransfer, snapshots = false) {
   return {
-    ...extractUIEvent(evt),
+    drop_effect: obj.dropEffect,
+    effect_allowed: obj.effectAllowed,
+    items: Array.from(obj.items, (item0: any) => extractDataTransferItem(item0 as DataTransferItem, snapshots)),
+    types: Array.from(obj.types),
+  };
+}
 
-    alt_key: evt.altKey,
-    button: evt.button,
-    buttons: evt.buttons,
-    client_x: evt.clientX,
-    client_y: evt.clientY,
-    ctrl_key: evt.ctrlKey,
-    meta_key: evt.metaKey,
-    movement_x: evt.movementX,
-    movement_y: evt.movementY,
-    page_x: evt.pageX,
-    page_y: evt.pageY,
-    related_target: evt.relatedTarget
-      ? extractHTMLElement(evt.relatedTarget as HTMLElement)
-      : null,
-    screen_x: evt.screenX,
-    screen_y: evt.screenY,
-    shift_key: evt.shiftKey,
+export function extractDataTransferItem(obj: DataTransferItem, snapshots = false) {
+  return {
+    kind: obj.kind,
+    type: obj.type,
   };
 }
 
-export function extractClipboardEvent(evt: React.ClipboardEvent) {
+export function extractClipboardEvent(evt: React.ClipboardEvent, snapshots = false) {
   return {
-    ...extractSyntheticEvent(evt),
-    clipboard_data: extractDataTransfer(evt.clipboardData),
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    clipboard_data: extractDataTransfer(evt.clipboardData as DataTransfer, snapshots),
   };
 }
 
-export function extractCompositionEvent(evt: React.CompositionEvent) {
+export function extractCompositionEvent(evt: React.CompositionEvent, snapshots = false) {
   return {
-    ...extractSyntheticEvent(evt),
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
     data: evt.data,
   };
 }
 
-export function extractDragEvent(evt: React.DragEvent) {
+export function extractFocusEvent_HTMLElementBase(evt: React.FocusEvent, snapshots = false) {
   return {
-    ...extractMouseEvent(evt),
-    data_transfer: extractDataTransfer(evt.dataTransfer),
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElementBase) : extractHTMLElementBase(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
   };
 }
 
-export function extractPointerEvent(evt: React.PointerEvent) {
+export function extractFocusEvent_HTMLMediaElement(evt: React.FocusEvent, snapshots = false) {
   return {
-    ...extractMouseEvent(evt),
-    pointer_id: evt.pointerId,
-    pressure: evt.pressure,
-    tangential_pressure: evt.tangentialPressure,
-    tilt_x: evt.tiltX,
-    tilt_y: evt.tiltY,
-    twist: evt.twist,
-    width: evt.width,
-    height: evt.height,
-    pointer_type: evt.pointerType,
-    is_primary: evt.isPrimary,
+    target: (snapshots ? snapshotElement(evt.target as HTMLMediaElement, extractHTMLMediaElement) : extractHTMLMediaElement(evt.target as HTMLMediaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
   };
 }
 
-export function extractFocusEvent(evt: React.FocusEvent) {
+export function extractFocusEvent_HTMLAnchorElement(evt: React.FocusEvent, snapshots = false) {
   return {
-    ...extractSyntheticEvent(evt),
-    // target: extractHTMLElement(evt.target as HTMLElement),
-    related_target: evt.relatedTarget
-      ? extractHTMLElement(evt.relatedTarget as HTMLElement)
-      : null,
+    target: (snapshots ? snapshotElement(evt.target as HTMLAnchorElement, extractHTMLAnchorElement) : extractHTMLAnchorElement(evt.target as HTMLAnchorElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
   };
 }
 
-export function extractFormEvent(evt: React.FormEvent) {
-  return extractSyntheticEvent(evt);
+export function extractFocusEvent_HTMLAreaElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLAreaElement, extractHTMLAreaElement) : extractHTMLAreaElement(evt.target as HTMLAreaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
 }
 
-export function extractInvalidEvent(evt: React.InvalidEvent) {
-  return extractSyntheticEvent(evt);
+export function extractFocusEvent_HTMLAudioElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLAudioElement, extractHTMLAudioElement) : extractHTMLAudioElement(evt.target as HTMLAudioElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
 }
 
-export function extractChangeEvent(evt: React.ChangeEvent) {
-  return extractFormEvent(evt);
+export function extractFocusEvent_HTMLBaseElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLBaseElement, extractHTMLBaseElement) : extractHTMLBaseElement(evt.target as HTMLBaseElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
 }
 
-export function extractKeyboardEvent(evt: React.KeyboardEvent) {
+export function extractFocusEvent_HTMLBodyElement(evt: React.FocusEvent, snapshots = false) {
   return {
-    ...extractUIEvent(evt),
-    alt_key: evt.altKey,
-    ctrl_key: evt.ctrlKey,
-    code: evt.code,
-    key: evt.key,
-    locale: evt.locale,
-    location: evt.location,
-    meta_key: evt.metaKey,
-    repeat: evt.repeat,
-    shift_key: evt.shiftKey,
+    target: (snapshots ? snapshotElement(evt.target as HTMLBodyElement, extractHTMLBodyElement) : extractHTMLBodyElement(evt.target as HTMLBodyElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
   };
 }
 
-export function extractTouchEvent(evt: React.TouchEvent) {
+export function extractFocusEvent_HTMLBRElement(evt: React.FocusEvent, snapshots = false) {
   return {
-    ...extractUIEvent(evt),
-    alt_key: evt.altKey,
-    changed_touches: Array.from(evt.changedTouches).map((touch) => ({
-      target: extractHTMLElement(touch.target as HTMLElement),
-      identifier: touch.identifier,
-      screen_x: touch.screenX,
-      screen_y: touch.screenY,
-      client_x: touch.clientX,
-      client_y: touch.clientY,
-      page_x: touch.pageX,
-      page_y: touch.pageY,
-    })),
-    ctrl_key: evt.ctrlKey,
-    meta_key: evt.metaKey,
-    shift_key: evt.shiftKey,
-    target_touches: Array.from(evt.targetTouches).map((touch) => ({
-      target: extractHTMLElement(touch.target as HTMLElement),
-      identifier: touch.identifier,
-      screen_x: touch.screenX,
-      screen_y: touch.screenY,
-      client_x: touch.clientX,
-      client_y: touch.clientY,
-      page_x: touch.pageX,
-      page_y: touch.pageY,
-    })),
-    touches: Array.from(evt.touches).map((touch) => ({
-      target: extractHTMLElement(touch.target as HTMLElement),
-      identifier: touch.identifier,
-      screen_x: touch.screenX,
-      screen_y: touch.screenY,
-      client_x: touch.clientX,
-      client_y: touch.clientY,
-      page_x: touch.pageX,
-      page_y: touch.pageY,
-    })),
-  };
-}
-
-export function extractWheelEvent(evt: React.WheelEvent) {
-  return {
-    ...extractMouseEvent(evt),
-    delta_mode: evt.deltaMode,
-    delta_x: evt.deltaX,
-    delta_y: evt.deltaY,
-    delta_z: evt.deltaZ,
+    target: (snapshots ? snapshotElement(evt.target as HTMLBRElement, extractHTMLBRElement) : extractHTMLBRElement(evt.target as HTMLBRElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
   };
 }
 
-export function extractAnimationEvent(evt: React.AnimationEvent) {
+export function extractFocusEvent_HTMLButtonElement(evt: React.FocusEvent, snapshots = false) {
   return {
-    ...extractSyntheticEvent(evt),
-    animation_name: evt.animationName,
-    elapsed_time: evt.elapsedTime,
-    pseudo_element: evt.pseudoElement,
+    target: (snapshots ? snapshotElement(evt.target as HTMLButtonElement, extractHTMLButtonElement) : extractHTMLButtonElement(evt.target as HTMLButtonElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
   };
 }
 
-export function extractToggleEvent(evt: React.ToggleEvent) {
+export function extractFocusEvent_HTMLCiteElement(evt: React.FocusEvent, snapshots = false) {
   return {
-    ...extractSyntheticEvent(evt),
-    old_state: evt.oldState,
-    new_state: evt.newState,
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLCiteElement) : extractHTMLCiteElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
   };
 }
 
-export function extractTransitionEvent(evt: React.TransitionEvent) {
+export function extractFocusEvent_HTMLDataElement(evt: React.FocusEvent, snapshots = false) {
   return {
-    ...extractSyntheticEvent(evt),
-    elapsed_time: evt.elapsedTime,
-    property_name: evt.propertyName,
-    pseudo_element: evt.pseudoElement,
+    target: (snapshots ? snapshotElement(evt.target as HTMLDataElement, extractHTMLDataElement) : extractHTMLDataElement(evt.target as HTMLDataElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
   };
 }
 
-// Helper function to extract DataTransfer properties
-function extractDataTransfer(dt: DataTransfer | null): object | null {
-  if (!dt) {
-    return null;
-  }
-  const items = [];
-  if (dt.items) {
-    for (let i = 0; i < dt.items.length; i++) {
-      const item = dt.items[i];
-      items.push({
-        kind: item.kind,
-        type: item.type,
-      });
-    }
-  }
+export function extractFocusEvent_HTMLDetailsElement(evt: React.FocusEvent, snapshots = false) {
   return {
-    drop_effect: dt.dropEffect,
-    effect_allowed: dt.effectAllowed,
-    items: items,
-    types: Array.from(dt.types || []),
+    target: (snapshots ? snapshotElement(evt.target as HTMLDetailsElement, extractHTMLDetailsElement) : extractHTMLDetailsElement(evt.target as HTMLDetailsElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLDialogElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDialogElement, extractHTMLDialogElement) : extractHTMLDialogElement(evt.target as HTMLDialogElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLDivElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDivElement, extractHTMLDivElement) : extractHTMLDivElement(evt.target as HTMLDivElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLDListElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDListElement, extractHTMLDListElement) : extractHTMLDListElement(evt.target as HTMLDListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLEmbedElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLEmbedElement, extractHTMLEmbedElement) : extractHTMLEmbedElement(evt.target as HTMLEmbedElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLFieldSetElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLFieldSetElement, extractHTMLFieldSetElement) : extractHTMLFieldSetElement(evt.target as HTMLFieldSetElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLFormElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLFormElement, extractHTMLFormElement) : extractHTMLFormElement(evt.target as HTMLFormElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLHeadElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHeadElement, extractHTMLHeadElement) : extractHTMLHeadElement(evt.target as HTMLHeadElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLHeadingElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHeadingElement, extractHTMLHeadingElement) : extractHTMLHeadingElement(evt.target as HTMLHeadingElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLHRElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHRElement, extractHTMLHRElement) : extractHTMLHRElement(evt.target as HTMLHRElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLHtmlElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHtmlElement, extractHTMLHtmlElement) : extractHTMLHtmlElement(evt.target as HTMLHtmlElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLIFrameElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLIFrameElement, extractHTMLIFrameElement) : extractHTMLIFrameElement(evt.target as HTMLIFrameElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLImageElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLImageElement, extractHTMLImageElement) : extractHTMLImageElement(evt.target as HTMLImageElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLInputElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLInputElement, extractHTMLInputElement) : extractHTMLInputElement(evt.target as HTMLInputElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLLabelElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLabelElement, extractHTMLLabelElement) : extractHTMLLabelElement(evt.target as HTMLLabelElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLLiElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLIElement, extractHTMLLiElement) : extractHTMLLiElement(evt.target as HTMLLIElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLLinkElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLinkElement, extractHTMLLinkElement) : extractHTMLLinkElement(evt.target as HTMLLinkElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLMapElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMapElement, extractHTMLMapElement) : extractHTMLMapElement(evt.target as HTMLMapElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLMenuElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMenuElement, extractHTMLMenuElement) : extractHTMLMenuElement(evt.target as HTMLMenuElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLMetaElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMetaElement, extractHTMLMetaElement) : extractHTMLMetaElement(evt.target as HTMLMetaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLMeterElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMeterElement, extractHTMLMeterElement) : extractHTMLMeterElement(evt.target as HTMLMeterElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLModElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLModElement, extractHTMLModElement) : extractHTMLModElement(evt.target as HTMLModElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLOListElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOListElement, extractHTMLOListElement) : extractHTMLOListElement(evt.target as HTMLOListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLObjectElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLObjectElement, extractHTMLObjectElement) : extractHTMLObjectElement(evt.target as HTMLObjectElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLOptGroupElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOptGroupElement, extractHTMLOptGroupElement) : extractHTMLOptGroupElement(evt.target as HTMLOptGroupElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLOptionElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOptionElement, extractHTMLOptionElement) : extractHTMLOptionElement(evt.target as HTMLOptionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLOutputElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOutputElement, extractHTMLOutputElement) : extractHTMLOutputElement(evt.target as HTMLOutputElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLParagraphElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLParagraphElement, extractHTMLParagraphElement) : extractHTMLParagraphElement(evt.target as HTMLParagraphElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLPictureElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLPictureElement, extractHTMLPictureElement) : extractHTMLPictureElement(evt.target as HTMLPictureElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLPreElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLPreElement, extractHTMLPreElement) : extractHTMLPreElement(evt.target as HTMLPreElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLProgressElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLProgressElement, extractHTMLProgressElement) : extractHTMLProgressElement(evt.target as HTMLProgressElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLQuoteElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLQuoteElement, extractHTMLQuoteElement) : extractHTMLQuoteElement(evt.target as HTMLQuoteElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLScriptElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLScriptElement, extractHTMLScriptElement) : extractHTMLScriptElement(evt.target as HTMLScriptElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLSelectElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSelectElement, extractHTMLSelectElement) : extractHTMLSelectElement(evt.target as HTMLSelectElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLSlotElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSlotElement, extractHTMLSlotElement) : extractHTMLSlotElement(evt.target as HTMLSlotElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLSourceElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSourceElement, extractHTMLSourceElement) : extractHTMLSourceElement(evt.target as HTMLSourceElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLSpanElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSpanElement, extractHTMLSpanElement) : extractHTMLSpanElement(evt.target as HTMLSpanElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLStyleElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLStyleElement, extractHTMLStyleElement) : extractHTMLStyleElement(evt.target as HTMLStyleElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTableCaptionElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableCaptionElement, extractHTMLTableCaptionElement) : extractHTMLTableCaptionElement(evt.target as HTMLTableCaptionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTableCellElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableCellElement, extractHTMLTableCellElement) : extractHTMLTableCellElement(evt.target as HTMLTableCellElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTableColElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableColElement, extractHTMLTableColElement) : extractHTMLTableColElement(evt.target as HTMLTableColElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTableElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableElement, extractHTMLTableElement) : extractHTMLTableElement(evt.target as HTMLTableElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTableRowElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableRowElement, extractHTMLTableRowElement) : extractHTMLTableRowElement(evt.target as HTMLTableRowElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTableSectionElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableSectionElement, extractHTMLTableSectionElement) : extractHTMLTableSectionElement(evt.target as HTMLTableSectionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTemplateElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTemplateElement, extractHTMLTemplateElement) : extractHTMLTemplateElement(evt.target as HTMLTemplateElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTextAreaElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTextAreaElement, extractHTMLTextAreaElement) : extractHTMLTextAreaElement(evt.target as HTMLTextAreaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTimeElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTimeElement, extractHTMLTimeElement) : extractHTMLTimeElement(evt.target as HTMLTimeElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTitleElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTitleElement, extractHTMLTitleElement) : extractHTMLTitleElement(evt.target as HTMLTitleElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLTrackElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTrackElement, extractHTMLTrackElement) : extractHTMLTrackElement(evt.target as HTMLTrackElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLUListElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLUListElement, extractHTMLUListElement) : extractHTMLUListElement(evt.target as HTMLUListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFocusEvent_HTMLVideoElement(evt: React.FocusEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLVideoElement, extractHTMLVideoElement) : extractHTMLVideoElement(evt.target as HTMLVideoElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+  };
+}
+
+export function extractFormEvent(evt: React.FormEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLElementBase(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElementBase) : extractHTMLElementBase(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLMediaElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMediaElement, extractHTMLMediaElement) : extractHTMLMediaElement(evt.target as HTMLMediaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLAnchorElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLAnchorElement, extractHTMLAnchorElement) : extractHTMLAnchorElement(evt.target as HTMLAnchorElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLAreaElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLAreaElement, extractHTMLAreaElement) : extractHTMLAreaElement(evt.target as HTMLAreaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLAudioElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLAudioElement, extractHTMLAudioElement) : extractHTMLAudioElement(evt.target as HTMLAudioElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLBaseElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLBaseElement, extractHTMLBaseElement) : extractHTMLBaseElement(evt.target as HTMLBaseElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLBodyElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLBodyElement, extractHTMLBodyElement) : extractHTMLBodyElement(evt.target as HTMLBodyElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLBRElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLBRElement, extractHTMLBRElement) : extractHTMLBRElement(evt.target as HTMLBRElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLButtonElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLButtonElement, extractHTMLButtonElement) : extractHTMLButtonElement(evt.target as HTMLButtonElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLCiteElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLCiteElement) : extractHTMLCiteElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLDataElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDataElement, extractHTMLDataElement) : extractHTMLDataElement(evt.target as HTMLDataElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLDetailsElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDetailsElement, extractHTMLDetailsElement) : extractHTMLDetailsElement(evt.target as HTMLDetailsElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLDialogElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDialogElement, extractHTMLDialogElement) : extractHTMLDialogElement(evt.target as HTMLDialogElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLDivElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDivElement, extractHTMLDivElement) : extractHTMLDivElement(evt.target as HTMLDivElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLDListElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDListElement, extractHTMLDListElement) : extractHTMLDListElement(evt.target as HTMLDListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLEmbedElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLEmbedElement, extractHTMLEmbedElement) : extractHTMLEmbedElement(evt.target as HTMLEmbedElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLFieldSetElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLFieldSetElement, extractHTMLFieldSetElement) : extractHTMLFieldSetElement(evt.target as HTMLFieldSetElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLFormElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLFormElement, extractHTMLFormElement) : extractHTMLFormElement(evt.target as HTMLFormElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLHeadElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHeadElement, extractHTMLHeadElement) : extractHTMLHeadElement(evt.target as HTMLHeadElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLHeadingElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHeadingElement, extractHTMLHeadingElement) : extractHTMLHeadingElement(evt.target as HTMLHeadingElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLHRElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHRElement, extractHTMLHRElement) : extractHTMLHRElement(evt.target as HTMLHRElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLHtmlElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHtmlElement, extractHTMLHtmlElement) : extractHTMLHtmlElement(evt.target as HTMLHtmlElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLIFrameElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLIFrameElement, extractHTMLIFrameElement) : extractHTMLIFrameElement(evt.target as HTMLIFrameElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLImageElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLImageElement, extractHTMLImageElement) : extractHTMLImageElement(evt.target as HTMLImageElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLInputElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLInputElement, extractHTMLInputElement) : extractHTMLInputElement(evt.target as HTMLInputElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLLabelElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLabelElement, extractHTMLLabelElement) : extractHTMLLabelElement(evt.target as HTMLLabelElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLLiElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLIElement, extractHTMLLiElement) : extractHTMLLiElement(evt.target as HTMLLIElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLLinkElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLinkElement, extractHTMLLinkElement) : extractHTMLLinkElement(evt.target as HTMLLinkElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLMapElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMapElement, extractHTMLMapElement) : extractHTMLMapElement(evt.target as HTMLMapElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLMenuElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMenuElement, extractHTMLMenuElement) : extractHTMLMenuElement(evt.target as HTMLMenuElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLMetaElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMetaElement, extractHTMLMetaElement) : extractHTMLMetaElement(evt.target as HTMLMetaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLMeterElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMeterElement, extractHTMLMeterElement) : extractHTMLMeterElement(evt.target as HTMLMeterElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLModElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLModElement, extractHTMLModElement) : extractHTMLModElement(evt.target as HTMLModElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLOListElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOListElement, extractHTMLOListElement) : extractHTMLOListElement(evt.target as HTMLOListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLObjectElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLObjectElement, extractHTMLObjectElement) : extractHTMLObjectElement(evt.target as HTMLObjectElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLOptGroupElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOptGroupElement, extractHTMLOptGroupElement) : extractHTMLOptGroupElement(evt.target as HTMLOptGroupElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLOptionElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOptionElement, extractHTMLOptionElement) : extractHTMLOptionElement(evt.target as HTMLOptionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLOutputElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOutputElement, extractHTMLOutputElement) : extractHTMLOutputElement(evt.target as HTMLOutputElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLParagraphElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLParagraphElement, extractHTMLParagraphElement) : extractHTMLParagraphElement(evt.target as HTMLParagraphElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLPictureElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLPictureElement, extractHTMLPictureElement) : extractHTMLPictureElement(evt.target as HTMLPictureElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLPreElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLPreElement, extractHTMLPreElement) : extractHTMLPreElement(evt.target as HTMLPreElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLProgressElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLProgressElement, extractHTMLProgressElement) : extractHTMLProgressElement(evt.target as HTMLProgressElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLQuoteElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLQuoteElement, extractHTMLQuoteElement) : extractHTMLQuoteElement(evt.target as HTMLQuoteElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLScriptElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLScriptElement, extractHTMLScriptElement) : extractHTMLScriptElement(evt.target as HTMLScriptElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLSelectElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSelectElement, extractHTMLSelectElement) : extractHTMLSelectElement(evt.target as HTMLSelectElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLSlotElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSlotElement, extractHTMLSlotElement) : extractHTMLSlotElement(evt.target as HTMLSlotElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLSourceElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSourceElement, extractHTMLSourceElement) : extractHTMLSourceElement(evt.target as HTMLSourceElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLSpanElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSpanElement, extractHTMLSpanElement) : extractHTMLSpanElement(evt.target as HTMLSpanElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLStyleElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLStyleElement, extractHTMLStyleElement) : extractHTMLStyleElement(evt.target as HTMLStyleElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTableCaptionElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableCaptionElement, extractHTMLTableCaptionElement) : extractHTMLTableCaptionElement(evt.target as HTMLTableCaptionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTableCellElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableCellElement, extractHTMLTableCellElement) : extractHTMLTableCellElement(evt.target as HTMLTableCellElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTableColElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableColElement, extractHTMLTableColElement) : extractHTMLTableColElement(evt.target as HTMLTableColElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTableElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableElement, extractHTMLTableElement) : extractHTMLTableElement(evt.target as HTMLTableElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTableRowElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableRowElement, extractHTMLTableRowElement) : extractHTMLTableRowElement(evt.target as HTMLTableRowElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTableSectionElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableSectionElement, extractHTMLTableSectionElement) : extractHTMLTableSectionElement(evt.target as HTMLTableSectionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTemplateElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTemplateElement, extractHTMLTemplateElement) : extractHTMLTemplateElement(evt.target as HTMLTemplateElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTextAreaElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTextAreaElement, extractHTMLTextAreaElement) : extractHTMLTextAreaElement(evt.target as HTMLTextAreaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTimeElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTimeElement, extractHTMLTimeElement) : extractHTMLTimeElement(evt.target as HTMLTimeElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTitleElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTitleElement, extractHTMLTitleElement) : extractHTMLTitleElement(evt.target as HTMLTitleElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLTrackElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTrackElement, extractHTMLTrackElement) : extractHTMLTrackElement(evt.target as HTMLTrackElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLUListElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLUListElement, extractHTMLUListElement) : extractHTMLUListElement(evt.target as HTMLUListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractInvalidEvent_HTMLVideoElement(evt: React.InvalidEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLVideoElement, extractHTMLVideoElement) : extractHTMLVideoElement(evt.target as HTMLVideoElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLElementBase(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElementBase) : extractHTMLElementBase(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLMediaElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMediaElement, extractHTMLMediaElement) : extractHTMLMediaElement(evt.target as HTMLMediaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLAnchorElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLAnchorElement, extractHTMLAnchorElement) : extractHTMLAnchorElement(evt.target as HTMLAnchorElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLAreaElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLAreaElement, extractHTMLAreaElement) : extractHTMLAreaElement(evt.target as HTMLAreaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLAudioElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLAudioElement, extractHTMLAudioElement) : extractHTMLAudioElement(evt.target as HTMLAudioElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLBaseElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLBaseElement, extractHTMLBaseElement) : extractHTMLBaseElement(evt.target as HTMLBaseElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLBodyElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLBodyElement, extractHTMLBodyElement) : extractHTMLBodyElement(evt.target as HTMLBodyElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLBRElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLBRElement, extractHTMLBRElement) : extractHTMLBRElement(evt.target as HTMLBRElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLButtonElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLButtonElement, extractHTMLButtonElement) : extractHTMLButtonElement(evt.target as HTMLButtonElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLCiteElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLCiteElement) : extractHTMLCiteElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLDataElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDataElement, extractHTMLDataElement) : extractHTMLDataElement(evt.target as HTMLDataElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLDetailsElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDetailsElement, extractHTMLDetailsElement) : extractHTMLDetailsElement(evt.target as HTMLDetailsElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLDialogElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDialogElement, extractHTMLDialogElement) : extractHTMLDialogElement(evt.target as HTMLDialogElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLDivElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDivElement, extractHTMLDivElement) : extractHTMLDivElement(evt.target as HTMLDivElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLDListElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLDListElement, extractHTMLDListElement) : extractHTMLDListElement(evt.target as HTMLDListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLEmbedElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLEmbedElement, extractHTMLEmbedElement) : extractHTMLEmbedElement(evt.target as HTMLEmbedElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLFieldSetElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLFieldSetElement, extractHTMLFieldSetElement) : extractHTMLFieldSetElement(evt.target as HTMLFieldSetElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLFormElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLFormElement, extractHTMLFormElement) : extractHTMLFormElement(evt.target as HTMLFormElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLHeadElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHeadElement, extractHTMLHeadElement) : extractHTMLHeadElement(evt.target as HTMLHeadElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLHeadingElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHeadingElement, extractHTMLHeadingElement) : extractHTMLHeadingElement(evt.target as HTMLHeadingElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLHRElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHRElement, extractHTMLHRElement) : extractHTMLHRElement(evt.target as HTMLHRElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLHtmlElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLHtmlElement, extractHTMLHtmlElement) : extractHTMLHtmlElement(evt.target as HTMLHtmlElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLIFrameElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLIFrameElement, extractHTMLIFrameElement) : extractHTMLIFrameElement(evt.target as HTMLIFrameElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLImageElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLImageElement, extractHTMLImageElement) : extractHTMLImageElement(evt.target as HTMLImageElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLInputElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLInputElement, extractHTMLInputElement) : extractHTMLInputElement(evt.target as HTMLInputElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLLabelElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLabelElement, extractHTMLLabelElement) : extractHTMLLabelElement(evt.target as HTMLLabelElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLLiElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLIElement, extractHTMLLiElement) : extractHTMLLiElement(evt.target as HTMLLIElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLLinkElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLLinkElement, extractHTMLLinkElement) : extractHTMLLinkElement(evt.target as HTMLLinkElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLMapElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMapElement, extractHTMLMapElement) : extractHTMLMapElement(evt.target as HTMLMapElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLMenuElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMenuElement, extractHTMLMenuElement) : extractHTMLMenuElement(evt.target as HTMLMenuElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLMetaElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMetaElement, extractHTMLMetaElement) : extractHTMLMetaElement(evt.target as HTMLMetaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLMeterElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLMeterElement, extractHTMLMeterElement) : extractHTMLMeterElement(evt.target as HTMLMeterElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLModElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLModElement, extractHTMLModElement) : extractHTMLModElement(evt.target as HTMLModElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLOListElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOListElement, extractHTMLOListElement) : extractHTMLOListElement(evt.target as HTMLOListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLObjectElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLObjectElement, extractHTMLObjectElement) : extractHTMLObjectElement(evt.target as HTMLObjectElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLOptGroupElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOptGroupElement, extractHTMLOptGroupElement) : extractHTMLOptGroupElement(evt.target as HTMLOptGroupElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLOptionElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOptionElement, extractHTMLOptionElement) : extractHTMLOptionElement(evt.target as HTMLOptionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLOutputElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLOutputElement, extractHTMLOutputElement) : extractHTMLOutputElement(evt.target as HTMLOutputElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLParagraphElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLParagraphElement, extractHTMLParagraphElement) : extractHTMLParagraphElement(evt.target as HTMLParagraphElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLPictureElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLPictureElement, extractHTMLPictureElement) : extractHTMLPictureElement(evt.target as HTMLPictureElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLPreElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLPreElement, extractHTMLPreElement) : extractHTMLPreElement(evt.target as HTMLPreElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLProgressElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLProgressElement, extractHTMLProgressElement) : extractHTMLProgressElement(evt.target as HTMLProgressElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLQuoteElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLQuoteElement, extractHTMLQuoteElement) : extractHTMLQuoteElement(evt.target as HTMLQuoteElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLScriptElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLScriptElement, extractHTMLScriptElement) : extractHTMLScriptElement(evt.target as HTMLScriptElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLSelectElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSelectElement, extractHTMLSelectElement) : extractHTMLSelectElement(evt.target as HTMLSelectElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLSlotElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSlotElement, extractHTMLSlotElement) : extractHTMLSlotElement(evt.target as HTMLSlotElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLSourceElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSourceElement, extractHTMLSourceElement) : extractHTMLSourceElement(evt.target as HTMLSourceElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLSpanElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLSpanElement, extractHTMLSpanElement) : extractHTMLSpanElement(evt.target as HTMLSpanElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLStyleElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLStyleElement, extractHTMLStyleElement) : extractHTMLStyleElement(evt.target as HTMLStyleElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTableCaptionElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableCaptionElement, extractHTMLTableCaptionElement) : extractHTMLTableCaptionElement(evt.target as HTMLTableCaptionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTableCellElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableCellElement, extractHTMLTableCellElement) : extractHTMLTableCellElement(evt.target as HTMLTableCellElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTableColElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableColElement, extractHTMLTableColElement) : extractHTMLTableColElement(evt.target as HTMLTableColElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTableElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableElement, extractHTMLTableElement) : extractHTMLTableElement(evt.target as HTMLTableElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTableRowElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableRowElement, extractHTMLTableRowElement) : extractHTMLTableRowElement(evt.target as HTMLTableRowElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTableSectionElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTableSectionElement, extractHTMLTableSectionElement) : extractHTMLTableSectionElement(evt.target as HTMLTableSectionElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTemplateElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTemplateElement, extractHTMLTemplateElement) : extractHTMLTemplateElement(evt.target as HTMLTemplateElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTextAreaElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTextAreaElement, extractHTMLTextAreaElement) : extractHTMLTextAreaElement(evt.target as HTMLTextAreaElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTimeElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTimeElement, extractHTMLTimeElement) : extractHTMLTimeElement(evt.target as HTMLTimeElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTitleElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTitleElement, extractHTMLTitleElement) : extractHTMLTitleElement(evt.target as HTMLTitleElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLTrackElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLTrackElement, extractHTMLTrackElement) : extractHTMLTrackElement(evt.target as HTMLTrackElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLUListElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLUListElement, extractHTMLUListElement) : extractHTMLUListElement(evt.target as HTMLUListElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractChangeEvent_HTMLVideoElement(evt: React.ChangeEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLVideoElement, extractHTMLVideoElement) : extractHTMLVideoElement(evt.target as HTMLVideoElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+  };
+}
+
+export function extractAnimationEvent(evt: React.AnimationEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    animation_name: evt.animationName,
+    elapsed_time: evt.elapsedTime,
+    pseudo_element: evt.pseudoElement,
+  };
+}
+
+export function extractToggleEvent(evt: React.ToggleEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    old_state: evt.oldState,
+    new_state: evt.newState,
+  };
+}
+
+export function extractTransitionEvent(evt: React.TransitionEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    elapsed_time: evt.elapsedTime,
+    property_name: evt.propertyName,
+    pseudo_element: evt.pseudoElement,
+  };
+}
+
+export function extractMouseEvent(evt: React.MouseEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    detail: evt.detail,
+    alt_key: evt.altKey,
+    button: evt.button,
+    buttons: evt.buttons,
+    client_x: evt.clientX,
+    client_y: evt.clientY,
+    ctrl_key: evt.ctrlKey,
+    meta_key: evt.metaKey,
+    movement_x: evt.movementX,
+    movement_y: evt.movementY,
+    page_x: evt.pageX,
+    page_y: evt.pageY,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+    screen_x: evt.screenX,
+    screen_y: evt.screenY,
+    shift_key: evt.shiftKey,
+  };
+}
+
+export function extractKeyboardEvent(evt: React.KeyboardEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    detail: evt.detail,
+    alt_key: evt.altKey,
+    ctrl_key: evt.ctrlKey,
+    code: evt.code,
+    key: evt.key,
+    locale: evt.locale,
+    location: evt.location,
+    meta_key: evt.metaKey,
+    repeat: evt.repeat,
+    shift_key: evt.shiftKey,
+  };
+}
+
+export function extractTouch(obj: Touch, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(obj.target as HTMLElement, extractHTMLElement) : extractHTMLElement(obj.target as HTMLElement)),
+    identifier: obj.identifier,
+    screen_x: obj.screenX,
+    screen_y: obj.screenY,
+    client_x: obj.clientX,
+    client_y: obj.clientY,
+    page_x: obj.pageX,
+    page_y: obj.pageY,
+  };
+}
+
+export function extractTouchEvent(evt: React.TouchEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    detail: evt.detail,
+    alt_key: evt.altKey,
+    changed_touches: Array.from(evt.changedTouches, (item0: any) => extractTouch(item0 as Touch, snapshots)),
+    ctrl_key: evt.ctrlKey,
+    meta_key: evt.metaKey,
+    shift_key: evt.shiftKey,
+    target_touches: Array.from(evt.targetTouches, (item0: any) => extractTouch(item0 as Touch, snapshots)),
+    touches: Array.from(evt.touches, (item0: any) => extractTouch(item0 as Touch, snapshots)),
+  };
+}
+
+export function extractDragEvent(evt: React.DragEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    detail: evt.detail,
+    alt_key: evt.altKey,
+    button: evt.button,
+    buttons: evt.buttons,
+    client_x: evt.clientX,
+    client_y: evt.clientY,
+    ctrl_key: evt.ctrlKey,
+    meta_key: evt.metaKey,
+    movement_x: evt.movementX,
+    movement_y: evt.movementY,
+    page_x: evt.pageX,
+    page_y: evt.pageY,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+    screen_x: evt.screenX,
+    screen_y: evt.screenY,
+    shift_key: evt.shiftKey,
+    data_transfer: extractDataTransfer(evt.dataTransfer as DataTransfer, snapshots),
+  };
+}
+
+export function extractPointerEvent(evt: React.PointerEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    detail: evt.detail,
+    alt_key: evt.altKey,
+    button: evt.button,
+    buttons: evt.buttons,
+    client_x: evt.clientX,
+    client_y: evt.clientY,
+    ctrl_key: evt.ctrlKey,
+    meta_key: evt.metaKey,
+    movement_x: evt.movementX,
+    movement_y: evt.movementY,
+    page_x: evt.pageX,
+    page_y: evt.pageY,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+    screen_x: evt.screenX,
+    screen_y: evt.screenY,
+    shift_key: evt.shiftKey,
+    pointer_id: evt.pointerId,
+    pressure: evt.pressure,
+    tangential_pressure: evt.tangentialPressure,
+    tilt_x: evt.tiltX,
+    tilt_y: evt.tiltY,
+    twist: evt.twist,
+    width: evt.width,
+    height: evt.height,
+    pointer_type: evt.pointerType,
+    is_primary: evt.isPrimary,
+  };
+}
+
+export function extractWheelEvent(evt: React.WheelEvent, snapshots = false) {
+  return {
+    target: (snapshots ? snapshotElement(evt.target as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.target as HTMLElement)),
+    bubbles: evt.bubbles,
+    cancelable: evt.cancelable,
+    default_prevented: evt.defaultPrevented,
+    event_phase: evt.eventPhase,
+    is_trusted: evt.isTrusted,
+    timestamp: evt.timeStamp,
+    type: evt.type,
+    detail: evt.detail,
+    alt_key: evt.altKey,
+    button: evt.button,
+    buttons: evt.buttons,
+    client_x: evt.clientX,
+    client_y: evt.clientY,
+    ctrl_key: evt.ctrlKey,
+    meta_key: evt.metaKey,
+    movement_x: evt.movementX,
+    movement_y: evt.movementY,
+    page_x: evt.pageX,
+    page_y: evt.pageY,
+    related_target: evt.relatedTarget ? (snapshots ? snapshotElement(evt.relatedTarget as HTMLElement, extractHTMLElement) : extractHTMLElement(evt.relatedTarget as HTMLElement)) : null,
+    screen_x: evt.screenX,
+    screen_y: evt.screenY,
+    shift_key: evt.shiftKey,
+    delta_mode: evt.deltaMode,
+    delta_x: evt.deltaX,
+    delta_y: evt.deltaY,
+    delta_z: evt.deltaZ,
   };
 }
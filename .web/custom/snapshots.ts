@@ -0,0 +1,95 @@
+// Delta-encoded element snapshots, used by the extractors of `serialize.ts` when
+// `set_element_snapshots` is enabled (see `reflex_experiment/snapshots.py`).
+// The first extraction of an element sends all its fields along with a new
+// snapshot id, the following ones only the fields that changed since, along
+// with the version of the snapshot they apply to.
+
+type Snapshot = {
+  id: string;
+  fields: Record<string, unknown>;
+  // Deltas sent since the snapshot was sent in full
+  deltas: number;
+};
+
+// Send a full snapshot again every so often, in case the backend evicted it
+const MAX_DELTAS = 50;
+
+// Snapshots that can be expanded back when the backend doesn't know them
+const MAX_EXPANDABLE = 1024;
+
+// Snapshot ids are unique across page loads
+const sessionId = Math.random().toString(36).slice(2, 10);
+let nextSnapshot = 0;
+
+const snapshots = new WeakMap<Element, Snapshot>();
+const snapshotsById = new Map<string, Snapshot>();
+
+export function snapshotElement<T extends HTMLElement>(
+  elt: T,
+  extract: (elt: T) => object
+): object {
+  const fields = extract(elt) as Record<string, unknown>;
+  const previous = snapshots.get(elt);
+  if (!previous || previous.deltas >= MAX_DELTAS) {
+    const id = `${sessionId}-${nextSnapshot++}`;
+    const snapshot = { id, fields, deltas: 0 };
+    snapshots.set(elt, snapshot);
+    if (previous) {
+      snapshotsById.delete(previous.id);
+    }
+    snapshotsById.set(id, snapshot);
+    if (snapshotsById.size > MAX_EXPANDABLE) {
+      snapshotsById.delete(snapshotsById.keys().next().value!);
+    }
+    return { ...fields, __snapshot__: id };
+  }
+
+  const delta: Record<string, unknown> = {
+    __delta__: previous.id,
+    __version__: previous.deltas,
+  };
+  for (const key in fields) {
+    if (!Object.is(fields[key], previous.fields[key])) {
+      delta[key] = fields[key];
+    }
+  }
+  previous.fields = fields;
+  previous.deltas++;
+  return delta;
+}
+
+// Replace the deltas of a payload by full snapshots, for the backend to resend
+// an event whose snapshot version it doesn't have (see `SnapshotMiddleware`). The
+// fields missing from a delta are the latest extracted ones. Returns null if one
+// of the snapshots was dropped here too, the event is then lost.
+function expandElementSnapshots(value: unknown): unknown {
+  if (Array.isArray(value)) {
+    const items = value.map(expandElementSnapshots);
+    return items.includes(null) ? null : items;
+  }
+  if (value === null || typeof value !== "object") {
+    return value;
+  }
+  const expanded: Record<string, unknown> = {};
+  for (const [key, item] of Object.entries(value)) {
+    const expandedItem = expandElementSnapshots(item);
+    if (expandedItem === null && item !== null) {
+      return null;
+    }
+    expanded[key] = expandedItem;
+  }
+  if (!("__delta__" in expanded)) {
+    return expanded;
+  }
+  const { __delta__: id, __version__: _, ...changes } = expanded;
+  const snapshot = snapshotsById.get(id as string);
+  if (!snapshot) {
+    return null;
+  }
+  // The backend will only know the fields sent here, start over from them
+  snapshot.deltas = MAX_DELTAS;
+  return { ...snapshot.fields, ...changes, __snapshot__: id };
+}
+
+// Called from the scripts sent by the backend, outside of any module
+(globalThis as any).expandElementSnapshots = expandElementSnapshots;
@@ -4,3 +4,55 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
 }
+
+// used for untyped stuff, like nativeEvent
+export function cleanForSerialization(obj: unknown) {
+  const result = _cleanForSerializationRecursive(obj, new WeakSet());
+  return result;
+}
+
+function _cleanForSerializationRecursive(obj: unknown, seen: WeakSet<WeakKey>) {
+  if (obj === null || typeof obj !== "object") {
+    return obj;
+  }
+  if (seen.has(obj)) {
+    return undefined; // handle circular refs
+  }
+
+  seen.add(obj);
+
+  if (Array.isArray(obj)) {
+    const cleanedArray = obj
+      .map((item) => _cleanForSerializationRecursive(item, seen))
+      .filter((item) => item !== undefined);
+
+    return cleanedArray;
+  }
+
+  const plainObject = {};
+
+  for (const key in obj) {
+    const value = obj[key];
+
+    if (typeof key !== "string") {
+      continue;
+    }
+    if (
+      typeof value === "function" ||
+      typeof value === "symbol" ||
+      typeof value === "undefined"
+    ) {
+      continue;
+    }
+
+    const cleanedValue = _cleanForSerializationRecursive(value, seen);
+    if (key === "target") {
+      console.log("Cleaned target value:", cleanedValue);
+    }
+    if (cleanedValue !== undefined) {
+      plainObject[key] = cleanedValue;
+    }
+  }
+
+  return plainObject;
+}
@@ -0,0 +1,154 @@
+"""Binary encoding of numeric event payloads, see `binary_encoded` in events.py.
+
+Pointer, wheel and touch streams are mostly numbers, which JSON formats as text
+in the browser and parses back in Python. Models made only of `float`, `int` and
+`bool` fields (usually a `Projection` of the event), plus lists of such models
+(like the `touches` of a `TouchEvent`), are instead sent as an `ArrayBuffer`
+holding one packed little-endian struct per sample:
+
+    [scalar fields, in model order]
+    for each list field: [count: uint16] [count * item struct]
+
+The payload is `{"__binary__": [schema_id, buffer]}`, Socket.IO ships the
+buffer as a binary attachment. It is decoded with `struct` in decoders.py.
+
+`int` fields are packed as signed 32-bit integers, larger values wrap around
+silently (`DataView.setInt32` keeps their low 32 bits). That's enough for the
+integer fields of the events (buttons, pointer ids, touch identifiers, ...),
+but not for arbitrary integers.
+"""
+
+import struct
+from dataclasses import dataclass
+from functools import cache
+from typing import get_args, get_origin
+
+from pydantic.v1 import BaseModel
+from reflex.vars import ObjectVar, Var
+
+from reflex_experiment.helpers import (
+    _add_converter_function,
+    _create_converter_call,
+    assert_is_concrete_model,
+    get_js_property,
+    get_schema_id,
+    is_pydantic_model,
+)
+
+# Key of the payloads in the binary encoding
+BINARY_KEY = "__binary__"
+
+# Struct code and `DataView` type of each supported field type, `int` wraps
+# around outside of the Int32 range
+BINARY_TYPES = {
+    float: ("d", "Float64"),
+    int: ("i", "Int32"),
+    bool: ("?", "Uint8"),
+}
+
+LIST_COUNT = struct.Struct("<H")
+
+
+@dataclass(frozen=True)
+class BinaryLayout:
+    """Position of the fields of a model in its binary encoding."""
+
+    # Scalar fields, packed in `struct`
+    names: tuple[str, ...]
+    aliases: tuple[str, ...]
+    types: tuple[type, ...]
+    struct: struct.Struct
+    # List fields, as (name, alias, item model, item layout), after the scalars
+    lists: tuple[tuple[str, str, type[BaseModel], "BinaryLayout"], ...]
+
+    def offsets(self) -> list[int]:
+        codes = [BINARY_TYPES[type_][0] for type_ in self.types]
+        return [struct.calcsize("<" + "".join(codes[:i])) for i in range(len(codes))]
+
+
+@cache
+def get_binary_layout(model: type[BaseModel]) -> BinaryLayout:
+    """Binary layout of `model`, raises a `TypeError` if a field can't be packed."""
+    assert_is_concrete_model(model)
+    names, aliases, types, lists = [], [], [], []
+    for name, field in model.__fields__.items():
+        type_ = field.outer_type_
+        item = get_args(type_)[0] if get_origin(type_) is list else None
+        if field.allow_none:
+            pass  # no null in a struct
+        elif type_ in BINARY_TYPES:
+            names.append(name)
+            aliases.append(field.alias)
+            types.append(type_)
+            continue
+        elif is_pydantic_model(item):
+            item_layout = get_binary_layout(item)
+            if not item_layout.lists:
+                lists.append((name, field.alias, item, item_layout))
+                continue
+        raise TypeError(
+            f"Cannot binary encode {model.__name__}.{name}: only "
+            "non-null float, int and bool fields and lists of models made of "
+            "them are supported, use a Projection to select them"
+        )
+    codes = "".join(BINARY_TYPES[type_][0] for type_ in types)
+    return BinaryLayout(
+        tuple(names),
+        tuple(aliases),
+        tuple(types),
+        struct.Struct(f"<{codes}"),
+        tuple(lists),
+    )
+
+
+def _js_writes(layout: BinaryLayout, obj: str, offset: str) -> list[str]:
+    """JS statements writing the scalar fields of `obj` at `offset` of `view`."""
+    obj_var = Var(_js_expr=obj).to(ObjectVar)
+    lines = []
+    for alias, type_, position in zip(layout.aliases, layout.types, layout.offsets()):
+        value = str(get_js_property(obj_var, alias))
+        if type_ is bool:
+            value = f"{value} ? 1 : 0"
+        at = f"{offset} + {position}" if offset != "0" else str(position)
+        lines.append(f"view.set{BINARY_TYPES[type_][1]}({at}, {value}, true);")
+    return lines
+
+
+@cache
+def _register_binary_converter(model: type[BaseModel]) -> str:
+    layout = get_binary_layout(model)
+    obj_var = Var(_js_expr="obj").to(ObjectVar)
+    size = [str(layout.struct.size)]
+    lines = []
+    for index, (_, alias, _, item_layout) in enumerate(layout.lists):
+        # `TouchList` and the like aren't arrays
+        array_like = str(get_js_property(obj_var, alias))
+        lines.append(f"const list{index} = Array.from({array_like});")
+        size.append(
+            f"{LIST_COUNT.size} + list{index}.length * {item_layout.struct.size}"
+        )
+    lines.append(f"const view = new DataView(new ArrayBuffer({' + '.join(size)}));")
+    lines.extend(_js_writes(layout, "obj", "0"))
+    if layout.lists:
+        lines.append(f"let offset = {layout.struct.size};")
+    for index, (_, _, _, item_layout) in enumerate(layout.lists):
+        lines.append(f"view.setUint16(offset, list{index}.length, true);")
+        lines.append(f"offset += {LIST_COUNT.size};")
+        lines.append(f"for (const item of list{index}) {{")
+        lines.extend(f"  {line}" for line in _js_writes(item_layout, "item", "offset"))
+        lines.append(f"  offset += {item_layout.struct.size};")
+        lines.append("}")
+    lines.append(f'return {{ {BINARY_KEY}: ["{get_schema_id(model)}", view.buffer] }};')
+    body = "".join(f"  {line}\n" for line in lines)
+    return _add_converter_function(
+        f"Binary{model.__name__}",
+        lambda fn_name: f"export function {fn_name}(obj: any) {{\n{body}}}\n",
+        body,
+        None,
+    )
+
+
+@cache
+def create_binary_converter(model: type[BaseModel]):
+    """Creates a lambda packing a Var (the DOM event) to the binary encoding of `model`."""
+    return _create_converter_call(_register_binary_converter(model))
@@ -1,20 +1,56 @@
 import reflex as rx
 from typing import Sequence
+from weakref import WeakKeyDictionary
 from reflex.components.component import DEFAULT_TRIGGERS
 from reflex.utils import types
 from pydantic.v1 import Field
 
+from reflex_experiment.helpers import get_called_converters, write_converters
+
+# Event triggers only depend on the component class, see `get_event_triggers`
+_event_triggers: WeakKeyDictionary[
+    type, dict[str, types.ArgsSpec | Sequence[types.ArgsSpec]]
+] = WeakKeyDictionary()
+
 
 class ComponentBase(rx.Component):
     # defined in rx.Component,  reincluded as our pyi_generator includes
     # rx.Component
     key: rx.Var[str | None] = Field(default=None)
 
+    def _post_init(self, *args, **kwargs):
+        # Triggers defined through `make_event_handler` can specialize their
+        # payload to the handler bound to them (see `bind_event_trigger`)
+        triggers = self.get_event_triggers()
+        for key, value in kwargs.items():
+            bind = getattr(triggers.get(key), "bind", None)
+            if bind is not None:
+                kwargs[key] = bind(value, key)
+        super()._post_init(*args, **kwargs)
+
+    def add_imports(self) -> dict:
+        # Only collected when compiling the frontend, the converters called by
+        # the triggers are written along with the pages importing them
+        write_converters(get_called_converters(self.event_triggers.values()))
+        return {}
+
     def get_event_triggers(
         self,
     ) -> dict[str, types.ArgsSpec | Sequence[types.ArgsSpec]]:
-        """Override to only return non-default triggers."""
+        """Override to only return non-default triggers.
 
+        Computed once per class by `_get_event_triggers`, the returned dict is
+        shared by all instances and must not be modified.
+        """
+        cls = type(self)
+        triggers = _event_triggers.get(cls)
+        if triggers is None:
+            triggers = _event_triggers[cls] = self._get_event_triggers()
+        return triggers
+
+    def _get_event_triggers(
+        self,
+    ) -> dict[str, types.ArgsSpec | Sequence[types.ArgsSpec]]:
         triggers = super().get_event_triggers()
         triggers = {k: v for k, v in triggers.items() if DEFAULT_TRIGGERS.get(k) != v}
         return triggers
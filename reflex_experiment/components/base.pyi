@@ -3,10 +3,7 @@
 # ------------------- DO NOT EDIT ----------------------
 # This file was generated by `reflex/utils/pyi_generator.py`!
 # ------------------------------------------------------
-from typing import (
-    Sequence,
-    overload,
-)
+from typing import Sequence, overload
 from reflex.vars.base import Var
 import reflex as rx
 from reflex.utils import types
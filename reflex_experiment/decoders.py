@@ -0,0 +1,440 @@
+"""Validation-free decoding of event payloads.
+
+The payloads received by event handlers are produced by our own generated
+extractors (see extractor_generator.py), so they already have the shape of the
+models they're parsed into. In trusted mode, `TrustedModel` subclasses skip
+Pydantic's validation and are built by decoders compiled once per model: nested
+models are instantiated directly, and element unions dispatch on `tag_name`
+instead of trying up to 60 element models in turn. The decoder of the model an
+event handler receives is compiled when binding it to a component (see
+`bind_event_trigger`).
+
+The only coercion kept is `int` / `float`, as JS numbers don't distinguish them.
+
+Payloads can also use the compact encoding of the extractors (see
+`set_compact_payloads`): `{"__compact__": [schema_id, values]}`, where `values`
+holds the fields in the order of the model and nested models are arrays of their
+own fields. Both encodings, and the binary one of binary.py, are decoded by the
+same models, in either mode.
+"""
+
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Callable, Type, Union, get_args, get_origin
+
+from pydantic.v1 import BaseModel
+from pydantic.v1.fields import ModelField
+
+from reflex_experiment.binary import (
+    BINARY_KEY,
+    BINARY_TYPES,
+    LIST_COUNT,
+    get_binary_layout,
+)
+from reflex_experiment.helpers import (
+    assert_is_concrete_model,
+    find_discriminator,
+    get_discriminated_cases,
+    get_schema_id,
+    is_pydantic_model,
+)
+from reflex_experiment.metrics import current_measurement
+
+Decoder = Callable[[Any], Any]
+
+_trusted_payloads = False
+
+
+def set_trusted_payloads(enabled: bool = True):
+    """Build `TrustedModel` instances without validating their payload.
+
+    Only enable this when all payloads come from the generated extractors, a
+    malformed payload results in a model holding unchecked values.
+    """
+    global _trusted_payloads
+    _trusted_payloads = enabled
+
+
+def trusted_payloads() -> bool:
+    return _trusted_payloads
+
+
+_compact_payloads = False
+
+# Key of the payloads in the compact encoding
+COMPACT_KEY = "__compact__"
+
+
+def set_compact_payloads(enabled: bool = True):
+    """Send the payloads of DOM events as positional arrays instead of objects.
+
+    Applies to the triggers bound after the call, so enable it before compiling
+    the app. The object encoding is easier to debug in the browser devtools.
+    """
+    global _compact_payloads
+    _compact_payloads = enabled
+
+
+def compact_payloads() -> bool:
+    return _compact_payloads
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _create_union_decoder(field_name: str, models: dict[Any, type[BaseModel]]):
+    decoders = {
+        literal: create_model_decoder(model) for literal, model in models.items()
+    }
+
+    # Position of the discriminator in the compact encoding
+    positions = {
+        [field.alias for field in model.__fields__.values()].index(field_name)
+        for model in models.values()
+    }
+    position = positions.pop() if len(positions) == 1 else None
+
+    def decode_union(value: Any) -> Any:
+        if isinstance(value, list):
+            if position is None:
+                raise ValueError(
+                    f"{field_name} isn't at the same position in all union members"
+                )
+            return decoders[value[position]](value)
+        if not isinstance(value, dict):
+            return value  # already a model instance
+        return decoders[value[field_name]](value)
+
+    return decode_union
+
+
+@cache
+def _create_value_decoder(type_: Type) -> Decoder:
+    """Creates a function decoding a JSON value to `type_`."""
+    if type_ is int or type_ is float:
+        return type_
+
+    if is_pydantic_model(type_):
+        return create_model_decoder(type_)
+
+    origin = get_origin(type_)
+    args = get_args(type_)
+
+    if (origin is Union or origin is UnionType) and NoneType in args:
+        inner = _create_value_decoder(
+            Union[tuple(arg for arg in args if arg is not NoneType)]  # type: ignore
+        )
+        return lambda value: None if value is None else inner(value)
+
+    # Unions of models, like `HTMLElement`, dispatch on their literal field
+    if (origin is Union or origin is UnionType) and all(
+        is_pydantic_model(arg) for arg in args
+    ):
+        discriminator = find_discriminator(args)
+        if discriminator is None:
+            raise ValueError(f"Cannot decode non-discriminated union {type_}")
+        return _create_union_decoder(
+            discriminator, dict(get_discriminated_cases(args, discriminator))
+        )
+
+    if origin is list or origin is tuple:
+        item_decoder = _create_value_decoder(args[0])
+        if item_decoder is _identity:
+            return origin
+        return lambda value: origin(item_decoder(item) for item in value)
+
+    # Literals, unions of primitives and dicts of primitives are stored as is
+    return _identity
+
+
+def _create_field_decoder(field: ModelField) -> Decoder:
+    """Creates a function decoding the (non-null) JSON value of a Pydantic field."""
+    # Checked first, the outer type of optional discriminated unions includes `None`
+    if field.discriminator_key is not None:
+        return _create_union_decoder(
+            field.discriminator_alias,  # type: ignore
+            {
+                literal: sub_field.type_
+                for literal, sub_field in field.sub_fields_mapping.items()  # type: ignore
+            },
+        )
+    return _create_value_decoder(field.outer_type_)
+
+
+IMMUTABLE_DEFAULTS = (int, float, str, bool, bytes, tuple, frozenset, NoneType)
+
+
+def _decode_expression(
+    field: ModelField, value: str, index: int, namespace: dict
+) -> str:
+    """Python expression decoding the `value` expression of `field`."""
+    decoder = _create_field_decoder(field)
+    if decoder is _identity:
+        return value
+    if decoder is int or decoder is float:
+        fn = decoder.__name__
+    else:
+        fn = f"decode{index}"
+        namespace[fn] = decoder
+    if field.allow_none:
+        return f"None if (v := {value}) is None else {fn}(v)"
+    return f"{fn}({value})"
+
+
+def _field_expression(field: ModelField, index: int, namespace: dict) -> str:
+    """Python expression decoding `field` from the `data` payload."""
+    alias = repr(field.alias)
+    if field.required:
+        value = f"data[{alias}]"
+    elif field.default_factory is None and isinstance(
+        field.default, IMMUTABLE_DEFAULTS
+    ):
+        namespace[f"default{index}"] = field.default
+        value = f"data.get({alias}, default{index})"
+    else:
+        namespace[f"field{index}"] = field
+        value = f"(data[{alias}] if {alias} in data else field{index}.get_default())"
+    return _decode_expression(field, value, index, namespace)
+
+
+def _compile_values_decoder(
+    model: type[BaseModel], param: str, items: list[str], namespace: dict
+) -> Callable:
+    source = "\n".join(
+        [f"def decode_values({param}):", "    return {", *items, "    }"]
+    )
+    exec(compile(source, f"<decoder of {model.__name__}>", "exec"), namespace)
+    return namespace["decode_values"]
+
+
+_values_decoders: dict[type[BaseModel], Callable[[dict], dict]] = {}
+
+
+def create_values_decoder(model: type[BaseModel]) -> Callable[[dict], dict]:
+    """Creates a function decoding a payload to the `__dict__` of a `model` instance.
+
+    The function is generated as a single dict literal, so fields sent as is
+    don't cost a function call and nested models a single one.
+    """
+    if model in _values_decoders:
+        return _values_decoders[model]
+
+    assert_is_concrete_model(model)
+    # Registered before compiling the fields, in case of recursive models
+    _values_decoders[model] = lambda data: _values_decoders[model](data)
+
+    namespace: dict[str, Any] = {}
+    items = [
+        f"        {name!r}: {_field_expression(field, index, namespace)},"
+        for index, (name, field) in enumerate(model.__fields__.items())
+    ]
+    _values_decoders[model] = _compile_values_decoder(model, "data", items, namespace)
+    return _values_decoders[model]
+
+
+_compact_values_decoders: dict[type[BaseModel], Callable[[list], dict]] = {}
+
+
+def create_compact_values_decoder(model: type[BaseModel]) -> Callable[[list], dict]:
+    """Creates a function decoding the positional `values` of a compact payload
+    to the `__dict__` of a `model` instance."""
+    if model in _compact_values_decoders:
+        return _compact_values_decoders[model]
+
+    assert_is_concrete_model(model)
+    _compact_values_decoders[model] = lambda values: _compact_values_decoders[model](
+        values
+    )
+
+    namespace: dict[str, Any] = {}
+    items = [
+        f"        {name!r}: {_decode_expression(field, f'values[{index}]', index, namespace)},"
+        for index, (name, field) in enumerate(model.__fields__.items())
+    ]
+    _compact_values_decoders[model] = _compile_values_decoder(
+        model, "values", items, namespace
+    )
+    return _compact_values_decoders[model]
+
+
+def _check_schema_id(model: type[BaseModel], schema_id: str):
+    if schema_id != get_schema_id(model):
+        raise ValueError(
+            f"Received a payload of schema {schema_id} for {model.__name__} "
+            f"(schema {get_schema_id(model)}), the frontend is out of date"
+        )
+
+
+def decode_compact_payload(model: type[BaseModel], payload: list) -> dict:
+    """Decode the `[schema_id, values]` of a compact payload to the `__dict__` of
+    a `model` instance."""
+    schema_id, values = payload
+    _check_schema_id(model, schema_id)
+    decode_values = _compact_values_decoders.get(
+        model
+    ) or create_compact_values_decoder(model)
+    return decode_values(values)
+
+
+def decode_binary_payload(model: type[BaseModel], payload: list) -> dict:
+    """Decode the `[schema_id, buffer]` of a binary payload (see binary.py) to the
+    `__dict__` of a `model` instance."""
+    schema_id, buffer = payload
+    _check_schema_id(model, schema_id)
+    layout = get_binary_layout(model)
+    view = memoryview(buffer)
+    values = dict(zip(layout.names, layout.struct.unpack_from(view)))
+    offset = layout.struct.size
+    for name, _, item_model, item_layout in layout.lists:
+        (count,) = LIST_COUNT.unpack_from(view, offset)
+        offset += LIST_COUNT.size
+        end = offset + count * item_layout.struct.size
+        decode_item = create_model_decoder(item_model)
+        values[name] = [
+            decode_item(dict(zip(item_layout.aliases, row)))
+            for row in item_layout.struct.iter_unpack(view[offset:end])
+        ]
+        offset = end
+    return {name: values[name] for name in model.__fields__}
+
+
+def _decode_encoded_payload(model: type[BaseModel], data: dict) -> dict | None:
+    """The `__dict__` decoded from a compact or binary payload, None for objects."""
+    if COMPACT_KEY in data:
+        return decode_compact_payload(model, data[COMPACT_KEY])
+    if BINARY_KEY in data:
+        return decode_binary_payload(model, data[BINARY_KEY])
+    return None
+
+
+# NumPy dtype of the columns of each supported field type
+COLUMN_DTYPES = {float: "float64", int: "int64", bool: "bool"}
+
+
+def get_column_types(model: type[BaseModel]) -> dict[str, type]:
+    """Type of each column of a `ColumnarBatch` of `model`, raises a `TypeError`
+    if a field can't be stored in a NumPy array."""
+    columns = {}
+    for name, field in model.__fields__.items():
+        if field.allow_none or field.outer_type_ not in COLUMN_DTYPES:
+            raise TypeError(
+                f"Cannot store {model.__name__}.{name} in a column: only non-null "
+                "float, int and bool fields are supported, use a Projection to select them"
+            )
+        columns[name] = field.outer_type_
+    return columns
+
+
+def decode_columns(model: type[BaseModel], payloads: list) -> dict[str, Any]:
+    """Decode a batch of `model` payloads to one NumPy array per field, without
+    building the models.
+
+    Binary payloads are decoded at once by viewing their concatenated buffers
+    as a structured array, the columns are then read-only views of it.
+    """
+    import numpy as np
+
+    columns = get_column_types(model)
+    count = len(payloads)
+    if count and BINARY_KEY in payloads[0]:
+        layout = get_binary_layout(model)
+        for schema_id, _ in (payload[BINARY_KEY] for payload in payloads):
+            _check_schema_id(model, schema_id)
+        dtype = np.dtype(
+            [
+                (name, "<" + BINARY_TYPES[type_][0].replace("?", "b1"))
+                for name, type_ in zip(layout.names, layout.types)
+            ]
+        )
+        buffer = b"".join(payload[BINARY_KEY][1] for payload in payloads)
+        records = np.frombuffer(buffer, dtype=dtype)
+        return {name: records[name] for name in columns}
+
+    if count and COMPACT_KEY in payloads[0]:
+        for schema_id, _ in (payload[COMPACT_KEY] for payload in payloads):
+            _check_schema_id(model, schema_id)
+        rows = [payload[COMPACT_KEY][1] for payload in payloads]
+        return {
+            name: np.fromiter(
+                (row[index] for row in rows), COLUMN_DTYPES[type_], count=count
+            )
+            for index, (name, type_) in enumerate(columns.items())
+        }
+
+    return {
+        name: np.fromiter(
+            (payload[model.__fields__[name].alias] for payload in payloads),
+            COLUMN_DTYPES[type_],
+            count=count,
+        )
+        for name, type_ in columns.items()
+    }
+
+
+@cache
+def create_model_decoder(model: type[BaseModel]) -> Decoder:
+    """Creates a function building a `model` instance from a payload, without validation."""
+    decode_values = create_values_decoder(model)
+    new = model.__new__
+    has_private_attributes = bool(model.__private_attributes__)
+
+    decode_compact_values = create_compact_values_decoder(model)
+    all_fields = set(model.__fields__)
+
+    def decode_model(data: Any) -> Any:
+        if isinstance(data, list):
+            values, fields_set = decode_compact_values(data), set(all_fields)
+        elif not isinstance(data, dict):
+            return data  # already a model instance
+        elif (values := _decode_encoded_payload(model, data)) is not None:
+            fields_set = set(all_fields)
+        else:
+            values = decode_values(data)
+            fields_set = set(data).intersection(model.__fields__)
+        instance = new(model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        if has_private_attributes:
+            instance._init_private_attributes()
+        return instance
+
+    return decode_model
+
+
+class TrustedModel(BaseModel):
+    """Model built without validation when trusted payloads are enabled."""
+
+    def __init__(__pydantic_self__, **data: Any) -> None:
+        measurement = current_measurement()
+        if measurement is None or measurement.decoding:
+            __pydantic_self__._decode(data)
+        else:
+            # Outermost model of an instrumented payload (see metrics.py)
+            with measurement.decode():
+                __pydantic_self__._decode(data)
+
+    def _decode(__pydantic_self__, data: dict[str, Any]) -> None:
+        model = type(__pydantic_self__)
+        values = _decode_encoded_payload(model, data)
+        if values is not None:
+            if not _trusted_payloads:
+                # Validated like the object encoding, from the decoded values
+                super().__init__(
+                    **{
+                        name: value.dict() if isinstance(value, BaseModel) else value
+                        for name, value in values.items()
+                    }
+                )
+                return
+            fields_set = set(model.__fields__)
+        elif not _trusted_payloads:
+            super().__init__(**data)
+            return
+        else:
+            decode_values = _values_decoders.get(model) or create_values_decoder(model)
+            values = decode_values(data)
+            fields_set = set(data).intersection(model.__fields__)
+        object.__setattr__(__pydantic_self__, "__dict__", values)
+        object.__setattr__(__pydantic_self__, "__fields_set__", fields_set)
+        __pydantic_self__._init_private_attributes()
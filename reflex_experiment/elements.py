@@ -958,6 +958,15 @@ class HTMLUListElement(HTMLElementBase):
     type: str
 
 
+class HTMLElementStub(BaseModel):
+    """Cheap identity of an element, extracted without reading any layout
+    property (see `Light` in events.py)."""
+
+    id: str
+    tag_name: str
+    value: Optional[str] = None  # only for form elements and the like
+
+
 HTMLElement = Union[
     HTMLAnchorElement,
     HTMLAreaElement,
@@ -4,23 +4,53 @@
 # - We can only serialize data
 # - This makes the EventTarget type effectively empty
 
+import inspect
+import json
+from dataclasses import dataclass, replace
 from functools import cache
+from hashlib import md5
+from types import NoneType, UnionType
 from typing import (
+    Any,
     Callable,
+    ClassVar,
     Literal,
     Generic,
     TypeVar,
     Optional,
+    Sequence,
     TypedDict,
+    Union,
     cast,
+    get_args,
+    get_origin,
+    get_type_hints,
 )
 import reflex as rx
-from reflex.vars import var_operation, var_operation_return, VarData
+from reflex.event import EventChain, EventHandler, EventSpec, parse_args_spec
+from reflex.vars import LiteralVar, Var, var_operation, var_operation_return, VarData
+from reflex.utils import types
 from reflex.utils.imports import ImportVar
-from pydantic.v1 import BaseModel, Field
+from pydantic.v1 import BaseModel, Field, create_model
 from pydantic.v1.generics import GenericModel
 
+from reflex_experiment.binary import create_binary_converter
 from reflex_experiment.components.base import ComponentBase
+from reflex_experiment.decoders import (
+    TrustedModel,
+    compact_payloads,
+    create_model_decoder,
+    decode_columns,
+    get_column_types,
+    trusted_payloads,
+)
+from reflex_experiment.helpers import (
+    ModelFieldVars,
+    _create_model_converter,
+    is_pydantic_model,
+)
+from reflex_experiment.metrics import TRIGGER_KEY, current_measurement, trigger_metrics
+from reflex_experiment.snapshots import element_snapshots
 
 # Import base element type and specific elements if needed for defaults or bounds
 from .elements import (
@@ -28,6 +58,7 @@ from .elements import (
     HTMLElementField,
     HTMLElement,
     HTMLElementBase,
+    HTMLElementStub,
     HTMLInputElement,
     HTMLSelectElement,
     HTMLTextAreaElement,  # Import the Union type
@@ -76,7 +107,7 @@ class Touch(BaseModel):
 
 
 # Base SyntheticEvent using rx.Base and Generic
-class SyntheticEvent(GenericModel, Generic[TElement]):
+class SyntheticEvent(TrustedModel, GenericModel, Generic[TElement]):
     # nativeEvent: Any # Omitted
     # current_target: TElement  # element on which the event listener is registered
     target: HTMLElement  # target of the event (may be a child)
@@ -235,274 +266,965 @@ class TransitionEvent(SyntheticEvent, Generic[TElement]):
     pseudo_element: str
 
 
-def build_event_operation(fn: str):
+def _common_model_base(models: tuple[type[BaseModel], ...]) -> type[BaseModel]:
+    """Find the closest model shared by all `models`."""
+    return next(
+        base
+        for base in models[0].__mro__
+        if is_pydantic_model(base) and all(issubclass(model, base) for model in models)
+    )
+
+
+class _FlatUnionProjection(TrustedModel):
+    class Config:
+        # Keep a `value` that is a number on some elements and a string on others
+        smart_union = True
+
+
+def _project_union(models: tuple[type[BaseModel], ...], tree: dict) -> type[BaseModel]:
+    """Flatten the selected fields of a union of models (like `HTMLElement`) into
+    a single model. Fields missing from some members are optional."""
+    base = _common_model_base(models)
+    fields = {}
+    for name, subtree in tree.items():
+        declared = [
+            model.__fields__[name] for model in models if name in model.__fields__
+        ]
+        if not declared:
+            raise TypeError(
+                f"No member of the {base.__name__} union has a field '{name}'"
+            )
+        types = tuple(dict.fromkeys(field.outer_type_ for field in declared))
+        type_ = types[0] if len(types) == 1 else Union[types]  # type: ignore
+        if subtree:
+            type_ = _project_type(type_, subtree)
+        if len(declared) == len(models) and all(field.required for field in declared):
+            fields[name] = (type_, ...)
+        else:
+            fields[name] = (Optional[type_], None)
+
+    projection = create_model(
+        f"{base.__name__}[{', '.join(tree)}]",
+        __base__=_FlatUnionProjection,
+        **fields,
+    )
+    projection.__projection_of__ = base
+    return projection
+
+
+def _project_type(type_: Any, tree: dict) -> Any:
+    """Narrow a field type to the selected sub-fields."""
+    if is_pydantic_model(type_):
+        return _project_model(type_, tree)
+    origin = get_origin(type_)
+    args = get_args(type_)
+    if origin is list:
+        return list[_project_type(args[0], tree)]
+    if origin is Union or origin is UnionType:
+        # Discriminated unions (like `HTMLElement`) are flattened into one model
+        models = tuple(arg for arg in args if arg is not NoneType)
+        if all(map(is_pydantic_model, models)):
+            projected = (
+                _project_model(models[0], tree)
+                if len(models) == 1
+                else _project_union(models, tree)
+            )
+            return Optional[projected] if len(models) < len(args) else projected
+    raise TypeError(f"Cannot select sub-fields {sorted(tree)} of {type_}")
+
+
+def _project_model(model: type[BaseModel], tree: dict) -> type[BaseModel]:
+    fields = {}
+    for name, subtree in tree.items():
+        if name not in model.__fields__:
+            raise TypeError(f"{model.__name__} has no field '{name}'")
+        field = model.__fields__[name]
+        type_ = (
+            _project_type(field.outer_type_, subtree) if subtree else field.outer_type_
+        )
+        fields[name] = (type_, ...) if field.required else (Optional[type_], None)
+
+    projection = create_model(
+        f"{model.__name__}[{', '.join(tree)}]", __base__=TrustedModel, **fields
+    )
+    projection.__projection_of__ = model
+    return projection
+
+
+@cache
+def project(model: type[BaseModel], *fields: str) -> type[BaseModel]:
+    """
+    Create a narrowed version of `model` that only contains the selected fields.
+    Nested fields are selected using dots, e.g. `"target.value"`.
+
+    Event handlers annotated with a projection only receive the selected fields.
+    """
+    tree: dict = {}
+    for path in fields:
+        node = tree
+        for name in path.split("."):
+            node = node.setdefault(name, {})
+    return _project_model(model, tree)
+
+
+class Projection:
+    """
+    Annotate an event handler argument with `Projection[MouseEvent[HTMLButtonElement], "client_x", "client_y"]`
+    to only extract and send the selected fields of the event.
+    """
+
+    @classmethod
+    def __class_getitem__(cls, args: tuple):
+        return project(*args)
+
+
+def _light_type(type_: Any) -> Any:
+    """Replace elements by `HTMLElementStub` within a field type."""
+    if is_pydantic_model(type_):
+        if issubclass(type_, HTMLElementBase):
+            return HTMLElementStub
+        return light(type_)
+    origin = get_origin(type_)
+    if origin is list:
+        return list[_light_type(get_args(type_)[0])]
+    if origin is Union or origin is UnionType:
+        # All the elements of the `HTMLElement` union collapse into a single stub
+        return Union[tuple(_light_type(arg) for arg in get_args(type_))]
+    return type_
+
+
+@cache
+def light(model: type[BaseModel]) -> type[BaseModel]:
+    """
+    Create a variant of `model` where every element (`target`, `related_target`,
+    the target of each `Touch`) is reduced to a `HTMLElementStub`.
+
+    Extracting a full element reads layout properties like `offsetTop`, which
+    forces the browser to compute the layout on every event. Use a `Projection`
+    instead if the handler needs some of those.
+    """
+    fields = {}
+    changed = False
+    for name, field in model.__fields__.items():
+        type_ = _light_type(field.outer_type_)
+        changed |= type_ != field.outer_type_
+        fields[name] = (type_, ...) if field.required else (Optional[type_], None)
+    if not changed:
+        return model
+
+    light_model = create_model(
+        f"Light{model.__name__}", __base__=TrustedModel, **fields
+    )
+    light_model.__projection_of__ = model
+    return light_model
+
+
+class Light:
+    """
+    Annotate an event handler argument with `Light[MouseEvent[HTMLButtonElement]]`
+    to receive the event with `HTMLElementStub` targets.
+    """
+
+    @classmethod
+    def __class_getitem__(cls, model: type[BaseModel]):
+        return light(model)
+
+
+LightTouch = light(Touch)
+
+
+def _get_payload_annotation(value: EventHandler | EventSpec) -> Any:
+    """Get the annotation of the handler argument receiving the event payload."""
+    handler = value.handler if isinstance(value, EventSpec) else value
+    args = inspect.getfullargspec(handler.fn).args
+    # Skip `self` for state handlers and any argument already bound in an EventSpec
+    index = bool(handler.state_full_name)
+    if isinstance(value, EventSpec):
+        index += len(value.args)
+    if index >= len(args):
+        return None
+    try:
+        return get_type_hints(handler.fn).get(args[index])
+    except NameError:
+        return None
+
+
+def _get_projection(
+    value: Any, key: str, event_model: type[BaseModel], batched: bool = False
+) -> type[BaseModel] | None:
+    """Get the projection the bound handler asks for, if any."""
+    if not isinstance(value, (EventHandler, EventSpec)):
+        return None
+
+    annotation = _get_payload_annotation(value)
+    if batched:
+        annotation = _get_batch_model(annotation) or annotation
+    source = getattr(annotation, "__projection_of__", None)
+    if source is None:
+        return None
+    if not issubclass(event_model, source):
+        raise TypeError(
+            f"Event handler for {key} expects a projection of {source.__name__}, "
+            f"but {key} provides {event_model.__name__}"
+        )
+    return annotation
+
+
+@cache
+def make_binary_event_handler(model: type[BaseModel]):
+    """Args spec packing the fields of `model` in its binary encoding."""
+    converter = create_binary_converter(model)
+
+    def handle_binary_event(var: rx.Var) -> tuple[rx.Var[model]]:  # type: ignore
+        return (converter(var.to(dict)).to(model),)
+
+    return handle_binary_event
+
+
+@cache
+def make_projected_event_handler(projection: type[BaseModel]):
+    """Args spec extracting only the fields of a projection."""
+    converter = _create_model_converter(projection)
+
+    def handle_projected_event(var: rx.Var) -> tuple[rx.Var[projection]]:  # type: ignore
+        return (converter(var.to(dict)).to(projection),)
+
+    return handle_projected_event
+
+
+TEvent = TypeVar("TEvent", bound=BaseModel)
+
+
+class EventBatch(TrustedModel, GenericModel, Generic[TEvent]):
+    """Events buffered on the client and delivered together, see `batched`.
+
+    Behaves like a (read-only) list of events.
+    """
+
+    events: list[TEvent]
+
+    def __iter__(self):  # type: ignore
+        return iter(self.events)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __getitem__(self, index):
+        return self.events[index]
+
+
+class ColumnarBatch(BaseModel):
+    """Events of a batch as one NumPy array per field, see `batched`.
+
+    Annotate the handler argument with `ColumnarBatch[Projection[PointerEvent, "client_x", "client_y"]]`
+    to receive `batch.client_x`, `batch.client_y` (or `batch["client_x"]`) as
+    arrays, without building a model per event. The event fields must be
+    numbers or booleans. Requires NumPy (the `columnar` extra).
+    """
+
+    __event_model__: ClassVar[type[BaseModel]]
+
+    def __init__(__pydantic_self__, **data: Any) -> None:
+        model = __pydantic_self__.__event_model__
+        measurement = current_measurement()
+        if measurement is None:
+            columns = decode_columns(model, data["events"])
+        else:
+            with measurement.decode():
+                columns = decode_columns(model, data["events"])
+        object.__setattr__(__pydantic_self__, "__dict__", columns)
+        object.__setattr__(__pydantic_self__, "__fields_set__", set())
+
+    @classmethod
+    def __class_getitem__(cls, model: type[BaseModel]):
+        return columnar_batch(model)
+
+    @property
+    def columns(self) -> dict[str, Any]:
+        return self.__dict__
+
+    def __len__(self) -> int:
+        return len(next(iter(self.__dict__.values()), ()))
+
+    def __getitem__(self, name: str):
+        return self.__dict__[name]
+
+
+@cache
+def columnar_batch(model: type[BaseModel]) -> type[ColumnarBatch]:
+    # Fail when declaring the handler rather than on its first event
+    get_column_types(model)
+    try:
+        import numpy  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "ColumnarBatch requires NumPy, install it with `pip install reflex-experiment[columnar]`"
+        ) from e
+    batch = create_model(f"ColumnarBatch[{model.__name__}]", __base__=ColumnarBatch)
+    batch.__event_model__ = model
+    return batch
+
+
+def _get_batch_model(annotation: Any) -> type[BaseModel] | None:
+    """The event model of a batch annotation, if it is one."""
+    if not is_pydantic_model(annotation):
+        return None
+    if issubclass(annotation, EventBatch):
+        return annotation.__fields__["events"].type_
+    if issubclass(annotation, ColumnarBatch):
+        return annotation.__event_model__
+    return None
+
+
+@cache
+def make_batch_event_handler(
+    event_model: type[BaseModel], batch_type: type[BaseModel] = EventBatch
+):
+    """Args spec for the chain receiving a batch of `event_model` payloads."""
+
+    def handle_event_batch(batch: rx.Var) -> tuple[rx.Var[batch_type[event_model]]]:  # type: ignore
+        return (Var.create({"events": batch}).to(batch_type[event_model]),)  # type: ignore
+
+    return handle_event_batch
+
+
+@cache
+def make_tagged_event_handler(args_spec: Callable, key: str):
+    """`args_spec`, with its payload tagged with the trigger and event type for
+    the trigger metrics (see metrics.py)."""
+    return_type = get_type_hints(args_spec)["return"]
+    (payload_type,) = get_args(return_type)
+    (event_model,) = get_args(payload_type)
+    tag = json.dumps([key, event_model.__name__])
+
+    def handle_tagged_event(var: rx.Var) -> return_type:  # type: ignore
+        (payload,) = args_spec(var)
+        return (
+            Var(
+                _js_expr=f'({{...{payload}, "{TRIGGER_KEY}": {tag}}})',
+                _var_type=event_model,
+                _var_data=payload._get_all_var_data(),
+            ),
+        )
+
+    return handle_tagged_event
+
+
+def _tag_trigger(args_spec: Callable, key: str) -> Callable:
+    return make_tagged_event_handler(args_spec, key) if trigger_metrics() else args_spec
+
+
+def _chain_key(key: str, chain_var: rx.Var) -> str:
+    # Identifies the binding within the client-side state of each element, so
+    # the rows of a `foreach` (same trigger, same chain) each get their own
+    return f"{key}_{md5(str(chain_var).encode()).hexdigest()[:8]}"
+
+
+RateLimitMode = Literal["throttle", "debounce", "coalesce"]
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Client-side rate policy, applied before the event is extracted."""
+
+    mode: RateLimitMode
+    interval_ms: float = 0
+
+    def wrap(self, chain: EventChain | rx.Var, key: str) -> rx.Var:
+        chain_var = LiteralVar.create(chain)
+        return Var(
+            _js_expr=f'rateLimitEvent("{self.mode}", {self.interval_ms}, "{_chain_key(key, chain_var)}", {chain_var})',
+            _var_type=EventChain,
+            _var_data=VarData.merge(
+                chain_var._get_all_var_data(),
+                VarData(imports={"$/custom/events": [ImportVar(tag="rateLimitEvent")]}),
+            ),
+        ).guess_type()
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Client-side guard, events failing it are dropped before being extracted."""
+
+    predicates: tuple[Callable[[Any], Any], ...]
+
+    def wrap(
+        self, chain: EventChain | rx.Var, key: str, event_model: type[BaseModel]
+    ) -> rx.Var:
+        chain_var = LiteralVar.create(chain)
+        fields = ModelFieldVars((event_model,), Var(_js_expr="_var"))
+        conditions = []
+        for predicate in self.predicates:
+            condition = predicate(fields)
+            if not isinstance(condition, Var):
+                raise TypeError(
+                    f"Event filter of {key} must return a Var built from the "
+                    f"event fields, got {condition!r}"
+                )
+            conditions.append(condition)
+        guard = " && ".join(f"({condition})" for condition in conditions)
+        return Var(
+            _js_expr=f"((_var) => {guard} ? ({chain_var})(_var) : undefined)",
+            _var_type=EventChain,
+            _var_data=VarData.merge(
+                chain_var._get_all_var_data(),
+                *(condition._get_all_var_data() for condition in conditions),
+            ),
+        ).guess_type()
+
+
+@dataclass(frozen=True)
+class Batch:
+    """Client-side batching, events are delivered per animation frame or time window."""
+
+    window_ms: float | None = None
+    max_events: int | None = None
+
+    def wrap(
+        self,
+        handler: Any,
+        key: str,
+        args_spec: Callable,
+        event_model: type[BaseModel],
+    ) -> rx.Var:
+        annotation = (
+            _get_payload_annotation(handler)
+            if isinstance(handler, (EventHandler, EventSpec))
+            else None
+        )
+        batch_type = (
+            ColumnarBatch
+            if is_pydantic_model(annotation) and issubclass(annotation, ColumnarBatch)
+            else EventBatch
+        )
+        chain = EventChain.create(
+            value=handler,
+            args_spec=_tag_trigger(
+                make_batch_event_handler(event_model, batch_type), key
+            ),
+            key=key,
+        )
+        chain_var = LiteralVar.create(chain)
+        # Extract each event as it happens, the DOM event is gone by the time we flush
+        (payload,) = parse_args_spec(args_spec)
+        options = f"{json.dumps(self.window_ms)}, {json.dumps(self.max_events)}"
+        return Var(
+            _js_expr=f'((_var) => batchEvent("{_chain_key(key, chain_var)}", _var, {options}, {payload}, {chain_var}))',
+            _var_type=EventChain,
+            _var_data=VarData.merge(
+                chain_var._get_all_var_data(),
+                payload._get_all_var_data(),
+                VarData(imports={"$/custom/events": [ImportVar(tag="batchEvent")]}),
+            ),
+        ).guess_type()
+
+
+@dataclass(frozen=True)
+class EventBinding:
+    """An event handler (or chain) bound to a trigger with extra client-side options."""
+
+    handler: Any
+    rate_limit: RateLimit | None = None
+    batch: Batch | None = None
+    binary: bool = False
+    filter: EventFilter | None = None
+
+
+def _with_options(handler: Any, **options) -> EventBinding:
+    if isinstance(handler, EventBinding):
+        return replace(handler, **options)
+    return EventBinding(handler, **options)
+
+
+def throttled(handler: Any, hz: float) -> EventBinding:
+    """Send at most `hz` events per second (the last event of a burst is always sent)."""
+    if not hz > 0:
+        raise ValueError(f"throttled expects a positive rate, got {hz} Hz")
+    return _with_options(handler, rate_limit=RateLimit("throttle", 1000 / hz))
+
+
+def debounced(handler: Any, ms: float) -> EventBinding:
+    """Only send the last event once no event happened for `ms` milliseconds."""
+    if not ms >= 0:
+        raise ValueError(f"debounced expects a non-negative delay, got {ms} ms")
+    return _with_options(handler, rate_limit=RateLimit("debounce", ms))
+
+
+def coalesced(handler: Any) -> EventBinding:
+    """Only send the latest event of each animation frame."""
+    return _with_options(handler, rate_limit=RateLimit("coalesce"))
+
+
+def batched(
+    handler: Any, window_ms: float | None = None, max_events: int | None = None
+) -> EventBinding:
+    """
+    Buffer events on the client and send them together, once per animation
+    frame or every `window_ms` milliseconds (or as soon as `max_events` are buffered).
+
+    The handler receives an `EventBatch` of the trigger's event type, e.g.
+    `EventBatch[PointerEvent[HTMLDivElement]]`, or of a projection of it. Annotate
+    it with a `ColumnarBatch` of a projection to receive NumPy arrays instead.
+    """
+    return _with_options(handler, batch=Batch(window_ms, max_events))
+
+
+def binary_encoded(handler: Any) -> EventBinding:
+    """
+    Send the payload as a packed struct instead of JSON (see binary.py).
+
+    The handler must receive a model made of numbers and booleans (and lists of
+    such models), usually a `Projection` of the pointer, wheel or touch event,
+    e.g. `batched(binary_encoded(State.draw))` with
+    `def draw(self, evts: EventBatch[Projection[PointerEvent, "client_x", "client_y", "pressure"]])`.
+    """
+    return _with_options(handler, binary=True)
+
+
+def filtered(handler: Any, predicate: Callable[[Any], Any]) -> EventBinding:
+    """Only send the events for which `predicate` holds, checked in the browser.
+
+    `predicate` receives the fields of the trigger's event model as Vars and
+    returns a boolean Var, e.g. `filtered(State.submit, lambda evt: evt.key == "Enter")`
+    or `lambda evt: (evt.button == 0) & ~evt.ctrl_key`. Filters of the same
+    binding must all hold.
+    """
+    previous = handler.filter if isinstance(handler, EventBinding) else None
+    predicates = (previous.predicates if previous else ()) + (predicate,)
+    return _with_options(handler, filter=EventFilter(predicates))
+
+
+def _compile_payload_decoder(value: Any) -> None:
+    """Compile the decoder of the model the bound handler receives, if any.
+
+    That's the projection, light model or batch the handler is annotated with,
+    rather than the full `event[element]` model of the trigger.
+    """
+    if not isinstance(value, (EventHandler, EventSpec)):
+        return
+    annotation = _get_payload_annotation(value)
+    if is_pydantic_model(annotation) and issubclass(annotation, TrustedModel):
+        create_model_decoder(annotation)
+
+
+# Event actions of Reflex applied on the client after extracting the payload
+DROPPING_EVENT_ACTIONS = ("throttle", "debounce", "temporal")
+
+
+def _receives_snapshots(value: Any, batched: bool = False) -> bool:
+    """Whether the bound handler can receive its elements as snapshots.
+
+    The client commits to a snapshot when extracting the payload, so the backend
+    must decode every payload it extracts: the handler has to take an event
+    model, and Reflex must not drop its events after their extraction.
+    """
+    if not isinstance(value, (EventHandler, EventSpec)):
+        return False
+    if any(action in value.event_actions for action in DROPPING_EVENT_ACTIONS):
+        return False
+    annotation = _get_payload_annotation(value)
+    if batched:
+        annotation = _get_batch_model(annotation)
+    return is_pydantic_model(annotation) and issubclass(annotation, SyntheticEvent)
+
+
+def bind_event_trigger(
+    value: Any,
+    key: str,
+    args_spec: Callable,
+    event_model: type[BaseModel],
+    snapshot_args_spec: Callable | None = None,
+) -> EventChain | rx.Var | Any:
+    """Specialize a trigger to the handler and options bound to it.
+
+    `snapshot_args_spec` extracts the elements as snapshots (see snapshots.py),
+    and is only used for the handlers that can receive them.
+
+    Returns the value untouched if there's nothing to specialize, Reflex will
+    then create the event chain from the trigger's default args spec.
+    """
+    binding = value if isinstance(value, EventBinding) else EventBinding(value)
+    if trusted_payloads():
+        # Compiled along with the component rather than on its first event
+        _compile_payload_decoder(binding.handler)
+    batched = binding.batch is not None
+    projection = _get_projection(binding.handler, key, event_model, batched=batched)
+    snapshots = (
+        snapshot_args_spec is not None
+        and projection is None
+        and not binding.binary
+        and _receives_snapshots(binding.handler, batched)
+    )
+    if (
+        binding.handler is value
+        and projection is None
+        and not snapshots
+        and not trigger_metrics()
+    ):
+        return value
+
+    if binding.binary:
+        args_spec = make_binary_event_handler(projection or event_model)
+    elif projection is not None:
+        args_spec = make_projected_event_handler(projection)
+    elif snapshots:
+        args_spec = snapshot_args_spec
+    if binding.batch is not None:
+        chain = binding.batch.wrap(
+            binding.handler, key, args_spec, projection or event_model
+        )
+    else:
+        chain = EventChain.create(
+            value=binding.handler, args_spec=_tag_trigger(args_spec, key), key=key
+        )
+    if binding.rate_limit is not None:
+        chain = binding.rate_limit.wrap(chain, key)
+    if binding.filter is not None:
+        # Before rate limiting, so that dropped events don't delay the others
+        chain = binding.filter.wrap(chain, key, event_model)
+    return chain
+
+
+def is_element_specific(event: type[SyntheticEvent]) -> bool:
+    """Whether the fields of `event` depend on its element type parameter."""
+    return any(
+        isinstance(field.outer_type_, TypeVar) for field in event.__fields__.values()
+    )
+
+
+def get_extractor_name(
+    event: type[SyntheticEvent], element: type[HTMLElementBase], compact: bool = False
+):
+    """Name of the JS function extracting `event[element]` (see extractor_generator.py)."""
+    prefix = "extractCompact" if compact else "extract"
+    if is_element_specific(event):
+        return f"{prefix}{event.__name__}_{element.__name__}"
+    return f"{prefix}{event.__name__}"
+
+
+def build_event_operation(
+    js_fn: str, module: str = "$/custom/serialize", snapshots: bool = False
+):
     @var_operation
     def handle_event_operation(var: rx.Var):
-        """Applies the custom cleanForSerialization JS function to the input Var."""
-        js_fn = "extract" + fn
-        custom_import = {"$/custom/serialize": [ImportVar(tag=js_fn)]}
+        """Applies the generated `js_fn` extractor to the input Var."""
+        custom_import = {module: [ImportVar(tag=js_fn)]}
         return var_operation_return(
-            js_expression=f"{js_fn}({var})",
+            js_expression=f"{js_fn}({var}, true)" if snapshots else f"{js_fn}({var})",
             var_data=VarData(imports=custom_import),
         )
 
     return handle_event_operation
 
 
-TType = TypeVar("TType", bound=type)
+@cache
+def make_event_handler(
+    event: type[SyntheticEvent],
+    element: type[HTMLElementBase],
+    compact: bool = False,
+    snapshots: bool = False,
+):
+    op = build_event_operation(
+        get_extractor_name(event, element, compact),
+        "$/custom/compact" if compact else "$/custom/serialize",
+        # Not supported by the compact extractors
+        snapshots=snapshots and not compact,
+    )
+    return_type = event[element]
 
+    def handle_event(var: rx.Var) -> tuple[rx.Var[return_type]]:  # type: ignore
+        return (op(var),)
 
-def make_event_handler(fn: str, return_type: TType):  # type: ignore
-    op = build_event_operation(fn)
+    # Picked up by `ComponentBase` to specialize the payload to the bound handler
+    def bind(value: Any, key: str):
+        snapshot_args_spec = (
+            make_event_handler(event, element, compact, snapshots=True)
+            if element_snapshots() and not compact and not snapshots
+            else None
+        )
+        return bind_event_trigger(
+            value, key, handle_event, return_type, snapshot_args_spec
+        )
 
-    def handle_event(var: rx.Var) -> tuple[rx.Var[return_type]]:
-        return (op(var),)
+    handle_event.bind = bind
 
     return handle_event
 
 
+class LazyEventHandler:
+    """`make_event_handler(event, element)`, only built once Reflex inspects or
+    calls it (or a handler is bound to the trigger).
+
+    Parametrizing the event model is by far the most expensive part of defining
+    the `DOMEvents` of an element, while most triggers of most elements are
+    never used.
+    """
+
+    def __init__(self, event: type[SyntheticEvent], element: type[HTMLElementBase]):
+        self.event = event
+        self.element = element
+
+    # Followed by `inspect.signature` and `get_type_hints`
+    @property
+    def __wrapped__(self):
+        return make_event_handler(self.event, self.element, compact_payloads())
+
+    @property
+    def __annotations__(self):  # type: ignore
+        return self.__wrapped__.__annotations__
+
+    # `inspect.getfullargspec` doesn't follow `__wrapped__`
+    @property
+    def __signature__(self):
+        return inspect.signature(self.__wrapped__)
+
+    @property
+    def bind(self):
+        return self.__wrapped__.bind
+
+    def __call__(self, var: rx.Var):
+        return self.__wrapped__(var)
+
+    def __repr__(self):
+        return f"LazyEventHandler({self.event.__name__}, {self.element.__name__})"
+
+
+# Event model of each DOM event trigger, shared by all elements (see `DOMEvents`)
+DOM_EVENT_TRIGGERS: dict[str, type[SyntheticEvent]] = {
+    # Clipboard Events
+    "on_copy": ClipboardEvent,
+    "on_copy_capture": ClipboardEvent,
+    "on_cut": ClipboardEvent,
+    "on_cut_capture": ClipboardEvent,
+    "on_paste": ClipboardEvent,
+    "on_paste_capture": ClipboardEvent,
+    # Composition Events
+    "on_composition_end": CompositionEvent,
+    "on_composition_end_capture": CompositionEvent,
+    "on_composition_start": CompositionEvent,
+    "on_composition_start_capture": CompositionEvent,
+    "on_composition_update": CompositionEvent,
+    "on_composition_update_capture": CompositionEvent,
+    # Focus Events
+    "on_focus": FocusEvent,
+    "on_focus_capture": FocusEvent,
+    "on_blur": FocusEvent,
+    "on_blur_capture": FocusEvent,
+    # Form Events
+    # Special typing for on_change for <input>, <textarea>, and <select> elements
+    # (see ELEMENT_EVENT_TRIGGERS)
+    "on_change": FocusEvent,
+    "on_change_capture": FormEvent,
+    "on_before_input": FormEvent,  # FormEvent is often used
+    "on_before_input_capture": FormEvent,
+    "on_input": FormEvent,  # FormEvent is often used
+    "on_input_capture": FormEvent,
+    "on_reset": FormEvent,
+    "on_reset_capture": FormEvent,
+    "on_submit": FormEvent,
+    "on_submit_capture": FormEvent,
+    "on_invalid": FormEvent,
+    "on_invalid_capture": FormEvent,
+    # Image Events (Usually SyntheticEvent)
+    "on_load": SyntheticEvent,
+    "on_load_capture": SyntheticEvent,
+    "on_error": SyntheticEvent,  # also a Media Event
+    "on_error_capture": SyntheticEvent,  # also a Media Event
+    # Keyboard Events
+    "on_key_down": KeyboardEvent,
+    "on_key_down_capture": KeyboardEvent,
+    # "on_key_press": KeyboardEvent,  # deprecated
+    # "on_key_press_capture": KeyboardEvent,  # deprecated
+    "on_key_up": KeyboardEvent,
+    "on_key_up_capture": KeyboardEvent,
+    # Media Events (Usually SyntheticEvent)
+    "on_abort": SyntheticEvent,
+    "on_abort_capture": SyntheticEvent,
+    "on_can_play": SyntheticEvent,
+    "on_can_play_capture": SyntheticEvent,
+    "on_can_play_through": SyntheticEvent,
+    "on_can_play_through_capture": SyntheticEvent,
+    "on_duration_change": SyntheticEvent,
+    "on_duration_change_capture": SyntheticEvent,
+    "on_emptied": SyntheticEvent,
+    "on_emptied_capture": SyntheticEvent,
+    "on_encrypted": SyntheticEvent,
+    "on_encrypted_capture": SyntheticEvent,
+    "on_ended": SyntheticEvent,
+    "on_ended_capture": SyntheticEvent,
+    "on_loaded_data": SyntheticEvent,
+    "on_loaded_data_capture": SyntheticEvent,
+    "on_loaded_metadata": SyntheticEvent,
+    "on_loaded_metadata_capture": SyntheticEvent,
+    "on_load_start": SyntheticEvent,
+    "on_load_start_capture": SyntheticEvent,
+    "on_pause": SyntheticEvent,
+    "on_pause_capture": SyntheticEvent,
+    "on_play": SyntheticEvent,
+    "on_play_capture": SyntheticEvent,
+    "on_playing": SyntheticEvent,
+    "on_playing_capture": SyntheticEvent,
+    "on_progress": SyntheticEvent,
+    "on_progress_capture": SyntheticEvent,
+    "on_rate_change": SyntheticEvent,
+    "on_rate_change_capture": SyntheticEvent,
+    "on_resize": SyntheticEvent,
+    "on_resize_capture": SyntheticEvent,
+    "on_seeked": SyntheticEvent,
+    "on_seeked_capture": SyntheticEvent,
+    "on_seeking": SyntheticEvent,
+    "on_seeking_capture": SyntheticEvent,
+    "on_stalled": SyntheticEvent,
+    "on_stalled_capture": SyntheticEvent,
+    "on_suspend": SyntheticEvent,
+    "on_suspend_capture": SyntheticEvent,
+    "on_time_update": SyntheticEvent,
+    "on_time_update_capture": SyntheticEvent,
+    "on_volume_change": SyntheticEvent,
+    "on_volume_change_capture": SyntheticEvent,
+    "on_waiting": SyntheticEvent,
+    "on_waiting_capture": SyntheticEvent,
+    # Mouse Events (Using pointer_event for consistency where applicable, mouse_event otherwise)
+    "on_aux_click": MouseEvent,
+    "on_aux_click_capture": MouseEvent,
+    "on_click": MouseEvent,  # Often PointerEvent in modern React
+    "on_click_capture": MouseEvent,
+    "on_context_menu": MouseEvent,
+    "on_context_menu_capture": MouseEvent,
+    "on_double_click": MouseEvent,
+    "on_double_click_capture": MouseEvent,
+    "on_drag": DragEvent,
+    "on_drag_capture": DragEvent,
+    "on_drag_end": DragEvent,
+    "on_drag_end_capture": DragEvent,
+    "on_drag_enter": DragEvent,
+    "on_drag_enter_capture": DragEvent,
+    "on_drag_exit": DragEvent,
+    "on_drag_exit_capture": DragEvent,
+    "on_drag_leave": DragEvent,
+    "on_drag_leave_capture": DragEvent,
+    "on_drag_over": DragEvent,
+    "on_drag_over_capture": DragEvent,
+    "on_drag_start": DragEvent,
+    "on_drag_start_capture": DragEvent,
+    "on_drop": DragEvent,
+    "on_drop_capture": DragEvent,
+    "on_mouse_down": MouseEvent,
+    "on_mouse_down_capture": MouseEvent,
+    "on_mouse_enter": MouseEvent,  # Uses MouseEvent
+    "on_mouse_leave": MouseEvent,  # Uses MouseEvent
+    "on_mouse_move": MouseEvent,
+    "on_mouse_move_capture": MouseEvent,
+    "on_mouse_out": MouseEvent,
+    "on_mouse_out_capture": MouseEvent,
+    "on_mouse_over": MouseEvent,
+    "on_mouse_over_capture": MouseEvent,
+    "on_mouse_up": MouseEvent,
+    "on_mouse_up_capture": MouseEvent,
+    # Selection Events (Usually SyntheticEvent)
+    "on_select": SyntheticEvent,
+    "on_select_capture": SyntheticEvent,
+    # Touch Events
+    "on_touch_cancel": TouchEvent,
+    "on_touch_cancel_capture": TouchEvent,
+    "on_touch_end": TouchEvent,
+    "on_touch_end_capture": TouchEvent,
+    "on_touch_move": TouchEvent,
+    "on_touch_move_capture": TouchEvent,
+    "on_touch_start": TouchEvent,
+    "on_touch_start_capture": TouchEvent,
+    # Pointer Events
+    "on_pointer_down": PointerEvent,
+    "on_pointer_down_capture": PointerEvent,
+    "on_pointer_move": PointerEvent,
+    "on_pointer_move_capture": PointerEvent,
+    "on_pointer_up": PointerEvent,
+    "on_pointer_up_capture": PointerEvent,
+    "on_pointer_cancel": PointerEvent,
+    "on_pointer_cancel_capture": PointerEvent,
+    "on_pointer_enter": PointerEvent,  # Uses PointerEvent
+    "on_pointer_leave": PointerEvent,  # Uses PointerEvent
+    "on_pointer_over": PointerEvent,
+    "on_pointer_over_capture": PointerEvent,
+    "on_pointer_out": PointerEvent,
+    "on_pointer_out_capture": PointerEvent,
+    "on_got_pointer_capture": PointerEvent,
+    "on_got_pointer_capture_capture": PointerEvent,
+    "on_lost_pointer_capture": PointerEvent,
+    "on_lost_pointer_capture_capture": PointerEvent,
+    # UI Events (Usually UIEvent or SyntheticEvent)
+    "on_scroll": UIEvent,
+    "on_scroll_capture": UIEvent,
+    "on_scroll_end": UIEvent,  # Assuming UIEvent
+    "on_scroll_end_capture": UIEvent,
+    # Wheel Events
+    "on_wheel": WheelEvent,
+    "on_wheel_capture": WheelEvent,
+    # Animation Events
+    "on_animation_start": AnimationEvent,
+    "on_animation_start_capture": AnimationEvent,
+    "on_animation_end": AnimationEvent,
+    "on_animation_end_capture": AnimationEvent,
+    "on_animation_iteration": AnimationEvent,
+    "on_animation_iteration_capture": AnimationEvent,
+    # Toggle Events
+    "on_toggle": ToggleEvent,
+    "on_before_toggle": ToggleEvent,  # Assuming ToggleEvent
+    # Transition Events
+    "on_transition_cancel": TransitionEvent,
+    "on_transition_cancel_capture": TransitionEvent,
+    "on_transition_end": TransitionEvent,
+    "on_transition_end_capture": TransitionEvent,
+    "on_transition_run": TransitionEvent,
+    "on_transition_run_capture": TransitionEvent,
+    "on_transition_start": TransitionEvent,
+    "on_transition_start_capture": TransitionEvent,
+}
+
+# Triggers whose event model differs for some elements, or that only exist on them
+ELEMENT_EVENT_TRIGGERS: dict[type[HTMLElementBase], dict[str, type[SyntheticEvent]]] = {
+    # More specific type for these three elements, where `target` is always the element itself
+    HTMLInputElement: {"on_change": ChangeEvent},
+    HTMLTextAreaElement: {"on_change": ChangeEvent},
+    HTMLSelectElement: {"on_change": ChangeEvent},
+    # Dialog-specific events
+    HTMLDialogElement: {"on_cancel": SyntheticEvent, "on_close": SyntheticEvent},
+}
+
+
+@cache
+def get_dom_event_triggers(
+    element: type[HTMLElementBase],
+) -> dict[str, LazyEventHandler]:
+    """The DOM event triggers of `element`, with one handler per event model."""
+    handlers: dict[type[SyntheticEvent], LazyEventHandler] = {}
+    triggers = {**DOM_EVENT_TRIGGERS, **ELEMENT_EVENT_TRIGGERS.get(element, {})}
+    return {
+        trigger: handlers.setdefault(event, LazyEventHandler(event, element))
+        for trigger, event in triggers.items()
+    }
+
+
 class DOMEvents:
+    """`DOMEvents[element]` adds the DOM event triggers of `element` to a component.
+
+    The triggers aren't declared as fields, they are looked up in the shared
+    `DOM_EVENT_TRIGGERS` table by `_get_event_triggers`. With several mixins, like
+    `HTMLAudioProps(HTMLMediaProps, DOMEvents[HTMLAudioElement])`, the last one of
+    the MRO (the element of the subclass) takes precedence.
+    """
+
     @classmethod
     @cache
     def __class_getitem__(cls, t_element: type[TElement]):
-        generic_handler = make_event_handler("SyntheticEvent", SyntheticEvent[t_element])
-        ui_handler = make_event_handler("UIEvent", UIEvent[t_element])
-        clipboard_handler = make_event_handler("ClipboardEvent", ClipboardEvent[t_element])
-        composition_handler = make_event_handler(
-            "CompositionEvent", CompositionEvent[t_element]
-        )
-        drag_handler = make_event_handler("DragEvent", DragEvent[t_element])
-        pointer_handler = make_event_handler("PointerEvent", PointerEvent[t_element])
-        focus_handler = make_event_handler("FocusEvent", FocusEvent[t_element])
-        form_handler = make_event_handler("FormEvent", FormEvent[t_element])
-        keyboard_handler = make_event_handler("KeyboardEvent", KeyboardEvent[t_element])
-        mouse_handler = make_event_handler("MouseEvent", MouseEvent[t_element])
-        touch_handler = make_event_handler("TouchEvent", TouchEvent[t_element])
-        wheel_handler = make_event_handler("WheelEvent", WheelEvent[t_element])
-        animation_handler = make_event_handler("AnimationEvent", AnimationEvent[t_element])
-        toggle_handler = make_event_handler("ToggleEvent", ToggleEvent[t_element])
-        transition_handler = make_event_handler("TransitionEvent", TransitionEvent[t_element])
-        # More specific type for these three elements, where `target` is always the element itself
-        if t_element in (HTMLInputElement, HTMLTextAreaElement, HTMLSelectElement):
-            change_handler = make_event_handler("ChangeEvent", ChangeEvent[t_element])
-        else:
-            change_handler = make_event_handler("FocusEvent", FocusEvent[t_element])
-
         class DOMEventsMixin(ComponentBase):
-            # Clipboard Events
-            on_copy: rx.EventHandler[clipboard_handler]
-            on_copy_capture: rx.EventHandler[clipboard_handler]
-            on_cut: rx.EventHandler[clipboard_handler]
-            on_cut_capture: rx.EventHandler[clipboard_handler]
-            on_paste: rx.EventHandler[clipboard_handler]
-            on_paste_capture: rx.EventHandler[clipboard_handler]
-
-            # Composition Events
-            on_composition_end: rx.EventHandler[composition_handler]
-            on_composition_end_capture: rx.EventHandler[composition_handler]
-            on_composition_start: rx.EventHandler[composition_handler]
-            on_composition_start_capture: rx.EventHandler[composition_handler]
-            on_composition_update: rx.EventHandler[composition_handler]
-            on_composition_update_capture: rx.EventHandler[composition_handler]
-
-            # Focus Events
-            on_focus: rx.EventHandler[focus_handler]
-            on_focus_capture: rx.EventHandler[focus_handler]
-            on_blur: rx.EventHandler[focus_handler]
-            on_blur_capture: rx.EventHandler[focus_handler]
-
-            # Form Events
-            # Special typing for on_change for <input>, <textarea>, and <select> elements
-            on_change: rx.EventHandler[change_handler]
-            on_change_capture: rx.EventHandler[form_handler]
-            on_before_input: rx.EventHandler[form_handler]  # FormEvent is often used
-            on_before_input_capture: rx.EventHandler[form_handler]
-            on_input: rx.EventHandler[form_handler]  # FormEvent is often used
-            on_input_capture: rx.EventHandler[form_handler]
-            on_reset: rx.EventHandler[form_handler]
-            on_reset_capture: rx.EventHandler[form_handler]
-            on_submit: rx.EventHandler[form_handler]
-            on_submit_capture: rx.EventHandler[form_handler]
-            on_invalid: rx.EventHandler[form_handler]
-            on_invalid_capture: rx.EventHandler[form_handler]
-
-            # Image Events (Usually SyntheticEvent)
-            on_load: rx.EventHandler[generic_handler]
-            on_load_capture: rx.EventHandler[generic_handler]
-            on_error: rx.EventHandler[generic_handler]  # also a Media Event
-            on_error_capture: rx.EventHandler[generic_handler]  # also a Media Event
-
-            # Keyboard Events
-            on_key_down: rx.EventHandler[keyboard_handler]
-            on_key_down_capture: rx.EventHandler[keyboard_handler]
-            # on_key_press: rx.EventHandler[keyboard_handler] # deprecated
-            # on_key_press_capture: rx.EventHandler[keyboard_handler] # deprecated
-            on_key_up: rx.EventHandler[keyboard_handler]
-            on_key_up_capture: rx.EventHandler[keyboard_handler]
-
-            # Media Events (Usually SyntheticEvent)
-            on_abort: rx.EventHandler[generic_handler]
-            on_abort_capture: rx.EventHandler[generic_handler]
-            on_can_play: rx.EventHandler[generic_handler]
-            on_can_play_capture: rx.EventHandler[generic_handler]
-            on_can_play_through: rx.EventHandler[generic_handler]
-            on_can_play_through_capture: rx.EventHandler[generic_handler]
-            on_duration_change: rx.EventHandler[generic_handler]
-            on_duration_change_capture: rx.EventHandler[generic_handler]
-            on_emptied: rx.EventHandler[generic_handler]
-            on_emptied_capture: rx.EventHandler[generic_handler]
-            on_encrypted: rx.EventHandler[generic_handler]
-            on_encrypted_capture: rx.EventHandler[generic_handler]
-            on_ended: rx.EventHandler[generic_handler]
-            on_ended_capture: rx.EventHandler[generic_handler]
-            on_loaded_data: rx.EventHandler[generic_handler]
-            on_loaded_data_capture: rx.EventHandler[generic_handler]
-            on_loaded_metadata: rx.EventHandler[generic_handler]
-            on_loaded_metadata_capture: rx.EventHandler[generic_handler]
-            on_load_start: rx.EventHandler[generic_handler]
-            on_load_start_capture: rx.EventHandler[generic_handler]
-            on_pause: rx.EventHandler[generic_handler]
-            on_pause_capture: rx.EventHandler[generic_handler]
-            on_play: rx.EventHandler[generic_handler]
-            on_play_capture: rx.EventHandler[generic_handler]
-            on_playing: rx.EventHandler[generic_handler]
-            on_playing_capture: rx.EventHandler[generic_handler]
-            on_progress: rx.EventHandler[generic_handler]
-            on_progress_capture: rx.EventHandler[generic_handler]
-            on_rate_change: rx.EventHandler[generic_handler]
-            on_rate_change_capture: rx.EventHandler[generic_handler]
-            on_resize: rx.EventHandler[generic_handler]
-            on_resize_capture: rx.EventHandler[generic_handler]
-            on_seeked: rx.EventHandler[generic_handler]
-            on_seeked_capture: rx.EventHandler[generic_handler]
-            on_seeking: rx.EventHandler[generic_handler]
-            on_seeking_capture: rx.EventHandler[generic_handler]
-            on_stalled: rx.EventHandler[generic_handler]
-            on_stalled_capture: rx.EventHandler[generic_handler]
-            on_suspend: rx.EventHandler[generic_handler]
-            on_suspend_capture: rx.EventHandler[generic_handler]
-            on_time_update: rx.EventHandler[generic_handler]
-            on_time_update_capture: rx.EventHandler[generic_handler]
-            on_volume_change: rx.EventHandler[generic_handler]
-            on_volume_change_capture: rx.EventHandler[generic_handler]
-            on_waiting: rx.EventHandler[generic_handler]
-            on_waiting_capture: rx.EventHandler[generic_handler]
-
-            # Mouse Events (Using pointer_event for consistency where applicable, mouse_event otherwise)
-            on_aux_click: rx.EventHandler[mouse_handler]
-            on_aux_click_capture: rx.EventHandler[mouse_handler]
-            on_click: rx.EventHandler[
-                mouse_handler
-            ]  # Often PointerEvent in modern React
-            on_click_capture: rx.EventHandler[mouse_handler]
-            on_context_menu: rx.EventHandler[mouse_handler]
-            on_context_menu_capture: rx.EventHandler[mouse_handler]
-            on_double_click: rx.EventHandler[mouse_handler]
-            on_double_click_capture: rx.EventHandler[mouse_handler]
-
-            on_drag: rx.EventHandler[drag_handler]
-            on_drag_capture: rx.EventHandler[drag_handler]
-            on_drag_end: rx.EventHandler[drag_handler]
-            on_drag_end_capture: rx.EventHandler[drag_handler]
-            on_drag_enter: rx.EventHandler[drag_handler]
-            on_drag_enter_capture: rx.EventHandler[drag_handler]
-            on_drag_exit: rx.EventHandler[drag_handler]
-            on_drag_exit_capture: rx.EventHandler[drag_handler]
-            on_drag_leave: rx.EventHandler[drag_handler]
-            on_drag_leave_capture: rx.EventHandler[drag_handler]
-            on_drag_over: rx.EventHandler[drag_handler]
-            on_drag_over_capture: rx.EventHandler[drag_handler]
-            on_drag_start: rx.EventHandler[drag_handler]
-            on_drag_start_capture: rx.EventHandler[drag_handler]
-            on_drop: rx.EventHandler[drag_handler]
-            on_drop_capture: rx.EventHandler[drag_handler]
-
-            on_mouse_down: rx.EventHandler[mouse_handler]
-            on_mouse_down_capture: rx.EventHandler[mouse_handler]
-            on_mouse_enter: rx.EventHandler[mouse_handler]  # Uses MouseEvent
-            on_mouse_leave: rx.EventHandler[mouse_handler]  # Uses MouseEvent
-            on_mouse_move: rx.EventHandler[mouse_handler]
-            on_mouse_move_capture: rx.EventHandler[mouse_handler]
-            on_mouse_out: rx.EventHandler[mouse_handler]
-            on_mouse_out_capture: rx.EventHandler[mouse_handler]
-            on_mouse_over: rx.EventHandler[mouse_handler]
-            on_mouse_over_capture: rx.EventHandler[mouse_handler]
-            on_mouse_up: rx.EventHandler[mouse_handler]
-            on_mouse_up_capture: rx.EventHandler[mouse_handler]
-
-            # Selection Events (Usually SyntheticEvent)
-            on_select: rx.EventHandler[generic_handler]
-            on_select_capture: rx.EventHandler[generic_handler]
-
-            # Touch Events
-            on_touch_cancel: rx.EventHandler[touch_handler]
-            on_touch_cancel_capture: rx.EventHandler[touch_handler]
-            on_touch_end: rx.EventHandler[touch_handler]
-            on_touch_end_capture: rx.EventHandler[touch_handler]
-            on_touch_move: rx.EventHandler[touch_handler]
-            on_touch_move_capture: rx.EventHandler[touch_handler]
-            on_touch_start: rx.EventHandler[touch_handler]
-            on_touch_start_capture: rx.EventHandler[touch_handler]
-
-            # Pointer Events
-            on_pointer_down: rx.EventHandler[pointer_handler]
-            on_pointer_down_capture: rx.EventHandler[pointer_handler]
-            on_pointer_move: rx.EventHandler[pointer_handler]
-            on_pointer_move_capture: rx.EventHandler[pointer_handler]
-            on_pointer_up: rx.EventHandler[pointer_handler]
-            on_pointer_up_capture: rx.EventHandler[pointer_handler]
-            on_pointer_cancel: rx.EventHandler[pointer_handler]
-            on_pointer_cancel_capture: rx.EventHandler[pointer_handler]
-            on_pointer_enter: rx.EventHandler[pointer_handler]  # Uses PointerEvent
-            on_pointer_leave: rx.EventHandler[pointer_handler]  # Uses PointerEvent
-            on_pointer_over: rx.EventHandler[pointer_handler]
-            on_pointer_over_capture: rx.EventHandler[pointer_handler]
-            on_pointer_out: rx.EventHandler[pointer_handler]
-            on_pointer_out_capture: rx.EventHandler[pointer_handler]
-            on_got_pointer_capture: rx.EventHandler[pointer_handler]
-            on_got_pointer_capture_capture: rx.EventHandler[pointer_handler]
-            on_lost_pointer_capture: rx.EventHandler[pointer_handler]
-            on_lost_pointer_capture_capture: rx.EventHandler[pointer_handler]
-
-            # UI Events (Usually UIEvent or SyntheticEvent)
-            on_scroll: rx.EventHandler[ui_handler]
-            on_scroll_capture: rx.EventHandler[ui_handler]
-            on_scroll_end: rx.EventHandler[ui_handler]  # Assuming UIEvent
-            on_scroll_end_capture: rx.EventHandler[ui_handler]
-
-            # Wheel Events
-            on_wheel: rx.EventHandler[wheel_handler]
-            on_wheel_capture: rx.EventHandler[wheel_handler]
-
-            # Animation Events
-            on_animation_start: rx.EventHandler[animation_handler]
-            on_animation_start_capture: rx.EventHandler[animation_handler]
-            on_animation_end: rx.EventHandler[animation_handler]
-            on_animation_end_capture: rx.EventHandler[animation_handler]
-            on_animation_iteration: rx.EventHandler[animation_handler]
-            on_animation_iteration_capture: rx.EventHandler[animation_handler]
-
-            # Toggle Events
-            on_toggle: rx.EventHandler[toggle_handler]
-            on_before_toggle: rx.EventHandler[toggle_handler]  # Assuming ToggleEvent
-
-            # Transition Events
-            on_transition_cancel: rx.EventHandler[transition_handler]
-            on_transition_cancel_capture: rx.EventHandler[transition_handler]
-            on_transition_end: rx.EventHandler[transition_handler]
-            on_transition_end_capture: rx.EventHandler[transition_handler]
-            on_transition_run: rx.EventHandler[transition_handler]
-            on_transition_run_capture: rx.EventHandler[transition_handler]
-            on_transition_start: rx.EventHandler[transition_handler]
-            on_transition_start_capture: rx.EventHandler[transition_handler]
-
-        if t_element == HTMLDialogElement:
-
-            class DialogDOMEventsMixin(DOMEventsMixin):
-                # Dialog-specific events
-                on_cancel: rx.EventHandler[generic_handler]
-                on_close: rx.EventHandler[generic_handler]
-
-            return DialogDOMEventsMixin
+            def _get_event_triggers(
+                self,
+            ) -> dict[str, types.ArgsSpec | Sequence[types.ArgsSpec]]:
+                # Triggers declared by the component itself take precedence
+                return {
+                    **get_dom_event_triggers(t_element),
+                    **super()._get_event_triggers(),
+                }
 
         return DOMEventsMixin
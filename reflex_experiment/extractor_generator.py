@@ -0,0 +1,252 @@
+"""Generates the JS extractors of `.web/custom/serialize.ts` from the models in
+`elements.py` and `events.py`, so both sides can't drift apart.
+
+Every extractor is a straight-line object literal containing exactly the fields
+of its model. Events whose fields depend on the element type (like the `target`
+of a `FocusEvent`) get one extractor per element, which doesn't need to switch
+on the tag name of the element.
+
+The compact extractors of `.web/custom/compact.ts` (see `set_compact_payloads`)
+send the same fields as positional arrays, tagged with the schema id of the event.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic.v1 import BaseModel
+
+from reflex_experiment.decoders import COMPACT_KEY
+from reflex_experiment.elements import HTMLElement, HTMLElementBase, HTMLMediaElement
+from reflex_experiment.events import (
+    SyntheticEvent,
+    get_extractor_name,
+    is_element_specific,
+)
+from reflex_experiment.helpers import (
+    get_js_property_name,
+    get_schema_id,
+    is_pydantic_model,
+)
+
+logger = logging.getLogger("extractor_generator")
+
+DEFAULT_OUTPUT = Path(__file__).parent.parent / ".web" / "custom" / "serialize.ts"
+DEFAULT_COMPACT_OUTPUT = DEFAULT_OUTPUT.with_name("compact.ts")
+
+# Element types that can be used as the type parameter of an event
+ELEMENT_TYPES: tuple[type[HTMLElementBase], ...] = (
+    HTMLElementBase,
+    HTMLMediaElement,
+    *get_args(HTMLElement),
+)
+
+# Models whose name differs from the DOM / React type they are extracted from
+TS_TYPE_NAMES = {
+    "HTMLElementBase": "HTMLElement",
+    "HTMLMediaElement": "HTMLMediaElement",
+    "HTMLCiteElement": "HTMLElement",
+    "HTMLLiElement": "HTMLLIElement",
+}
+
+HEADER = """\
+// ------------------- DO NOT EDIT ----------------------
+// This file was generated by `reflex_experiment/extractor_generator.py`!
+// ------------------------------------------------------
+"""
+
+
+def get_event_types() -> list[type[SyntheticEvent]]:
+    """All the (non-parametrized) event models, in definition order."""
+    events = []
+    pending = [SyntheticEvent]
+    while pending:
+        event = pending.pop(0)
+        if event.__concrete__ or event in events:
+            continue
+        events.append(event)
+        pending.extend(event.__subclasses__())
+    return events
+
+
+def _is_element_union(type_: Any) -> bool:
+    return get_origin(type_) in (Union, UnionType) and all(
+        is_pydantic_model(arg) and issubclass(arg, HTMLElementBase)
+        for arg in get_args(type_)
+    )
+
+
+class ExtractorGenerator:
+    """Collects the TS source of all extractors, nested models are generated on demand."""
+
+    def __init__(self, compact: bool = False):
+        self.compact = compact
+        self.prefix = "extractCompact" if compact else "extract"
+        # Elements can be sent as snapshots in the object encoding (snapshots.ts),
+        # if the extractors of the events and nested models get `snapshots = true`
+        self.snapshots = not compact
+        self.functions: dict[str, str] = {}
+
+    def _model_extractor(self, model: type[BaseModel]) -> str:
+        name = f"{self.prefix}{model.__name__}"
+        if name not in self.functions:
+            self.functions[name] = ""  # reserve the name in case of recursion
+            ts_type = TS_TYPE_NAMES.get(model.__name__, model.__name__)
+            self.functions[name] = self._function(name, "obj", ts_type, model)
+        return name
+
+    def _value(self, type_: Any, expr: str, depth: int = 0) -> str:
+        """JS expression converting the DOM value `expr` to the JSON form of `type_`."""
+        origin = get_origin(type_)
+        args = get_args(type_)
+        if origin in (Union, UnionType) and NoneType in args:
+            inner = Union[tuple(arg for arg in args if arg is not NoneType)]  # type: ignore
+            converted = self._value(inner, expr, depth)
+            return converted if converted == expr else f"{expr} ? {converted} : null"
+        if _is_element_union(type_) or (
+            is_pydantic_model(type_) and issubclass(type_, HTMLElementBase)
+        ):
+            if _is_element_union(type_):
+                extract, ts_type = f"{self.prefix}HTMLElement", "HTMLElement"
+            else:
+                extract = self._model_extractor(type_)
+                ts_type = TS_TYPE_NAMES.get(type_.__name__, type_.__name__)
+            if not self.snapshots:
+                return f"{extract}({expr} as {ts_type})"
+            return (
+                f"(snapshots ? snapshotElement({expr} as {ts_type}, {extract})"
+                f" : {extract}({expr} as {ts_type}))"
+            )
+        if is_pydantic_model(type_):
+            ts_type = TS_TYPE_NAMES.get(type_.__name__, type_.__name__)
+            snapshots = ", snapshots" if self.snapshots else ""
+            return f"{self._model_extractor(type_)}({expr} as {ts_type}{snapshots})"
+        if origin is list:
+            item = f"item{depth}"
+            converted = self._value(args[0], item, depth + 1)
+            if converted == item:
+                return f"Array.from({expr})"
+            return f"Array.from({expr}, ({item}: any) => {converted})"
+        # Primitives, literals, unions of primitives and dicts are sent as is
+        return expr
+
+    def _fields(self, model: type[BaseModel], obj: str) -> list[str]:
+        lines = []
+        for name, field in model.__fields__.items():
+            if name == "tag_name":
+                # `tagName` is uppercase for HTML elements, our models use lowercase literals
+                value = f"{obj}.tagName.toLowerCase()"
+            else:
+                value = self._value(
+                    field.outer_type_, f"{obj}.{get_js_property_name(field.alias)}"
+                )
+            if field.allow_none and not value.endswith(": null"):
+                # Some DOM properties are `undefined` instead of `null`
+                value = f"{value} ?? null"
+            lines.append(
+                f"    {value}, // {name}" if self.compact else f"    {name}: {value},"
+            )
+        return lines
+
+    def _function(
+        self,
+        name: str,
+        param: str,
+        ts_type: str,
+        model: type[BaseModel],
+        event: bool = False,
+    ) -> str:
+        if not self.compact:
+            body = ["  return {", *self._fields(model, param), "  };"]
+        elif event:
+            # Only the payload of the event is tagged with its schema
+            schema_id = get_schema_id(model)
+            body = [
+                f'  return {{ {COMPACT_KEY}: ["{schema_id}", [',
+                *self._fields(model, param),
+                "  ] };",
+            ]
+        else:
+            body = ["  return [", *self._fields(model, param), "  ];"]
+        params = f"{param}: {ts_type}"
+        if self.snapshots and not issubclass(model, HTMLElementBase):
+            params += ", snapshots = false"
+        return "\n".join([f"export function {name}({params}) {{", *body, "}"])
+
+    def add_element_switch(self):
+        """`extractHTMLElement`, dispatching on the tag name of the element."""
+        name = f"{self.prefix}HTMLElement"
+        cases = []
+        for element in get_args(HTMLElement):
+            tag_name = element.__fields__["tag_name"].outer_type_
+            assert get_origin(tag_name) is Literal, (
+                f"{element.__name__}.tag_name should be a Literal"
+            )
+            ts_type = TS_TYPE_NAMES.get(element.__name__, element.__name__)
+            cases.extend(f'    case "{tag.upper()}":' for tag in get_args(tag_name))
+            cases.append(
+                f"      return {self._model_extractor(element)}(elt as {ts_type});"
+            )
+        self.functions[name] = "\n".join(
+            [
+                f"export function {name}(elt: HTMLElement): object {{",
+                "  switch (elt.tagName) {",
+                *cases,
+                "    default:",
+                "      throw new Error(",
+                "        `Unexpected HTML element tag: ${elt.tagName} (update reflex_experiment/elements.py)`",
+                "      );",
+                "  }",
+                "}",
+            ]
+        )
+
+    def add_event(self, event: type[SyntheticEvent]):
+        ts_type = f"React.{event.__name__}"
+        if not is_element_specific(event):
+            # Any element works, the element type isn't used by the fields
+            name = get_extractor_name(event, HTMLElementBase, self.compact)
+            self.functions[name] = self._function(
+                name, "evt", ts_type, event, event=True
+            )
+            return
+        for element in ELEMENT_TYPES:
+            name = get_extractor_name(event, element, self.compact)
+            self.functions[name] = self._function(
+                name, "evt", ts_type, event[element], event=True
+            )
+
+    def generate(self) -> str:
+        for element in ELEMENT_TYPES:
+            self._model_extractor(element)
+        self.add_element_switch()
+        for event in get_event_types():
+            self.add_event(event)
+        imports = ['import React from "react";']
+        if self.snapshots:
+            imports.append('import { snapshotElement } from "./snapshots";')
+        return "\n".join(
+            [
+                HEADER,
+                "\n".join(imports) + "\n",
+                *(f"{fn}\n" for fn in self.functions.values()),
+            ]
+        )
+
+
+def generate_extractors(compact: bool = False) -> str:
+    """Generate the TS source of all the extractors."""
+    return ExtractorGenerator(compact).generate()
+
+
+def write_extractors(path: Path = DEFAULT_OUTPUT, compact: bool = False) -> bool:
+    """Write the extractors to `path`, returns whether the file changed."""
+    source = generate_extractors(compact)
+    if path.exists() and path.read_text() == source:
+        return False
+    path.write_text(source)
+    logger.info(f"Wrote {path}")
+    return True
@@ -1,7 +1,16 @@
+import json
+import logging
+import os
+import re
+import tempfile
+from hashlib import md5
 from inspect import isclass
+from pathlib import Path
 from types import NoneType, UnionType
 from typing import (
+    Annotated,
     Any,
+    Iterable,
     Literal,
     Type,
     TypeGuard,
@@ -12,19 +21,23 @@ from typing import (
 )
 import reflex as rx
 from pydantic.v1 import BaseModel
-from pydantic.v1.fields import ModelField
+from pydantic.v1.fields import FieldInfo, ModelField
 from pydantic.v1.generics import GenericModel
 from reflex.vars import (
     ObjectVar,
     Var,
     ArrayVar,
+    LiteralVar,
     VarData,
     var_operation,
     var_operation_return,
 )
 from reflex.utils.imports import ImportVar
+from reflex.utils.prerequisites import get_web_dir
 from functools import cache
 
+logger = logging.getLogger("converters")
+
 
 def to_camel(snake_str: str) -> str:
     """Convert snake_case to camelCase, preserving all leading/trailing underscores."""
@@ -46,6 +59,70 @@ def to_camel(snake_str: str) -> str:
 
 JS_NULL: Var[None] = Var(_js_expr="null", _var_type=None)
 
+# Fields whose DOM property name is not the camelCase version of the field name
+JS_PROPERTY_NAMES = {
+    "as_": "as",
+    "async_": "async",
+    "datetime": "dateTime",
+    "timestamp": "timeStamp",
+}
+
+
+def get_js_property_name(name: str) -> str:
+    """Get the name of the DOM property backing the (snake_case) field `name`."""
+    return JS_PROPERTY_NAMES.get(name, to_camel(name))
+
+
+def get_js_property(obj_var: ObjectVar, name: str) -> Var:
+    """Access the DOM property backing the (snake_case) field `name`."""
+    if name == "tag_name":
+        # `tagName` is uppercase for HTML elements, our models use lowercase literals
+        return obj_var.tagName.to(str).lower()
+    # Not `getattr`, properties like `items` would return methods of `ObjectVar`
+    return obj_var[get_js_property_name(name)]
+
+
+class ModelFieldVars:
+    """The fields of `models` as Vars of the DOM properties backing them on `obj_var`.
+
+    `ModelFieldVars((KeyboardEvent[HTMLInputElement],), var).key == "Enter"`
+    is a `BooleanVar` evaluated on the DOM event. Nested models (like the
+    `target` element) give their own `ModelFieldVars`, unions of models allow
+    the fields of any member.
+    """
+
+    def __init__(self, models: tuple[type[BaseModel], ...], obj_var: Var):
+        self._models = models
+        self._obj_var = obj_var.to(ObjectVar)
+
+    def __getattr__(self, name: str) -> Any:
+        field = next(
+            (
+                model.__fields__[name]
+                for model in self._models
+                if name in model.__fields__
+            ),
+            None,
+        )
+        if field is None:
+            owner = self._models[0].__name__ if len(self._models) == 1 else "union"
+            raise AttributeError(f"The {owner} model has no field {name}")
+        value = get_js_property(self._obj_var, name)
+        type_ = field.outer_type_
+        if get_origin(type_) is Literal:
+            return value.to(type(get_args(type_)[0]))
+        if is_pydantic_model(type_):
+            return ModelFieldVars((type_,), value)
+        args = tuple(arg for arg in get_args(type_) if arg is not NoneType)
+        if get_origin(type_) in (Union, UnionType) and all(
+            is_pydantic_model(arg) for arg in args
+        ):
+            return ModelFieldVars(args, value)
+        try:
+            return value.to(type_)
+        except TypeError:
+            return value
+
 
 def is_pydantic_model(typ) -> TypeGuard[type[BaseModel]]:
     return isclass(typ) and issubclass(typ, BaseModel)
@@ -56,14 +133,78 @@ def assert_is_concrete_model(typ):
         raise ValueError("Non-concrete generic Pydantic models are not supported")
 
 
+def find_discriminator(models: tuple[type[BaseModel], ...]) -> str | None:
+    """A field with disjoint literal values in all of `models`, if any."""
+    for name in models[0].__fields__:
+        seen = set()
+        for model in models:
+            field = model.__fields__.get(name)
+            if field is None or get_origin(field.outer_type_) is not Literal:
+                break
+            values = set(get_args(field.outer_type_))
+            if values & seen:
+                break
+            seen |= values
+        else:
+            return name
+    return None
+
+
+def get_discriminated_cases(
+    models: tuple[type[BaseModel], ...], discriminator: str
+) -> tuple[tuple[Any, type[BaseModel]], ...]:
+    """The (literal, model) pairs of a union of `models` discriminated by the
+    `discriminator` field."""
+    return tuple(
+        (literal, model)
+        for model in models
+        for literal in get_args(model.__fields__[discriminator].outer_type_)
+    )
+
+
+def _schema_signature(type_: Any, seen: set[type[BaseModel]]) -> str:
+    if is_pydantic_model(type_):
+        # Not named, `MouseEvent` and `MouseEvent[HTMLButtonElement]` share a layout
+        if type_ in seen:
+            return "(...)"
+        seen.add(type_)
+        fields = ",".join(
+            f"{name}:{_schema_signature(field.outer_type_, seen)}"
+            f"{'?' if field.allow_none else ''}"
+            for name, field in type_.__fields__.items()
+        )
+        return f"({fields})"
+    if get_origin(type_) is not None:
+        args = ",".join(_schema_signature(arg, seen) for arg in get_args(type_))
+        return f"{getattr(get_origin(type_), '__name__', get_origin(type_))}[{args}]"
+    return getattr(type_, "__name__", repr(type_))
+
+
+@cache
+def get_schema_id(model: type[BaseModel]) -> str:
+    """Identifies the field layout of `model` (and its nested models) in compact
+    and binary payloads, so that payloads of an outdated frontend are rejected."""
+    return md5(_schema_signature(model, set()).encode()).hexdigest()[:8]
+
+
 PRIMITIVE_TYPES = (int, float, str, bool, NoneType)
 
 
+@var_operation
+def array_from(var: Var):
+    """Converts an array-like JS value (like a `TouchList`) to an array."""
+    return var_operation_return(js_expression=f"Array.from({var})", var_type=list)
+
+
+def _passthrough(var: Var) -> Var:
+    return var
+
+
 @cache
 def _create_value_converter(type_: Type) -> Callable[[Var], Var]:
     """Creates a lambda to convert a Var based on the target Python type."""
     if type_ in PRIMITIVE_TYPES:
-        return lambda var: var  # Primitive types pass through
+        return _passthrough  # Primitive types pass through
 
     if is_pydantic_model(type_):
         assert_is_concrete_model(type_)
@@ -72,18 +213,53 @@ def _create_value_converter(type_: Type) -> Callable[[Var], Var]:
     origin = get_origin(type_)
     args = get_args(type_)
 
+    if origin is Annotated:
+        # `Annotated[A | B, Field(discriminator=...)]`, as items of lists or dicts
+        inner, *metadata = args
+        for info in metadata:
+            if isinstance(info, FieldInfo) and info.discriminator is not None:
+                models = get_args(inner)
+                alias = models[0].__fields__[info.discriminator].alias
+                return _create_union_converter(
+                    alias, get_discriminated_cases(models, info.discriminator)
+                )
+        return _create_value_converter(inner)
+
     if origin is Literal:
         assert all(type(arg) in PRIMITIVE_TYPES for arg in args), (
             f"Only primitive values ({PRIMITIVE_TYPES}) are supported in literals, received {type_}"
         )
         return lambda var: var
 
+    if (origin is Union or origin is UnionType) and NoneType in args:
+        inner = Union[tuple(arg for arg in args if arg is not NoneType)]  # type: ignore
+        inner_converter = _create_value_converter(inner)
+        if inner_converter is _passthrough:
+            return _passthrough
+        return lambda var: rx.cond(
+            var == rx.Var.create(None), JS_NULL, inner_converter(var)
+        )
+
+    # Unions of models, like `HTMLElement`, dispatch on their literal field
+    if (origin is Union or origin is UnionType) and all(
+        is_pydantic_model(arg) for arg in args
+    ):
+        discriminator = find_discriminator(args)
+        if discriminator is None:
+            raise ValueError(f"Cannot convert non-discriminated union {type_}")
+        return _create_union_converter(
+            args[0].__fields__[discriminator].alias,
+            get_discriminated_cases(args, discriminator),
+        )
+
     # Non-discriminated Unions of primitives
     if origin is Union or origin is UnionType:
-        assert all(type(arg) in PRIMITIVE_TYPES for arg in args), (
+        assert all(
+            arg in PRIMITIVE_TYPES or get_origin(arg) is Literal for arg in args
+        ), (
             f"Only primitive values ({PRIMITIVE_TYPES}) are supported in unions, received {type_}"
         )
-        return lambda var: var  # Pass through if only primitives
+        return _passthrough  # Pass through if only primitives
 
     if origin is tuple:
         element_converters = [_create_value_converter(arg) for arg in args]
@@ -94,17 +270,35 @@ def _create_value_converter(type_: Type) -> Callable[[Var], Var]:
             ]
         )
 
+    # Items of lists and values of dicts are converted in a single pass, by a
+    # function of the converters module shared by all the items
     if origin is list:
-        element_converter = _create_value_converter(args[0])
-        return lambda var: var.to(ArrayVar).foreach(element_converter)
+        item_fn = _register_item_converter(args[0])
+        if item_fn is None:
+            return array_from
+        return lambda var: Var(
+            _js_expr=f"Array.from({var}, {item_fn})",
+            _var_type=list,
+            _var_data=VarData.merge(
+                var._get_all_var_data(), _get_converter_var_data(item_fn)
+            ),
+        )
 
     if origin is dict:
         assert args[0] is str, "Only string keys are allowed for dictionaries"
-        assert args[1] in (int, float, str), (
-            "Only primitive types are currently supported for dictionary values"
+        value_fn = _register_item_converter(args[1])
+        if value_fn is None:
+            return _passthrough
+        return lambda var: Var(
+            _js_expr=(
+                f"Object.fromEntries(Object.entries({var})"
+                f".map(([key, value]) => [key, {value_fn}(value)]))"
+            ),
+            _var_type=dict,
+            _var_data=VarData.merge(
+                var._get_all_var_data(), _get_converter_var_data(value_fn)
+            ),
         )
-        # For primitive dict values, no complex conversion needed per item
-        return lambda var: var
 
     raise ValueError(
         f"Unsupported field type: {type_} (origin: {origin}, args: {args})"
@@ -132,26 +326,14 @@ def _create_field_converter(field: ModelField) -> Callable[[Var], Var]:
                 f"Cannot determine discriminator alias for field '{field.name}'"
             )
 
-        # Pre-calculate converters for each sub-model
-        sub_model_converters = {
-            literal: _create_model_converter(sub_field.type_)
-            for literal, sub_field in field.sub_fields_mapping.items()
-        }
-        camel_discriminator_alias = to_camel(discriminator_alias)
-
-        def discriminated_union_converter(var: Var) -> Var:
-            obj_var = var.to(ObjectVar)  # Ensure we have an object var
-            discriminator_value_var = getattr(obj_var, camel_discriminator_alias)
-            cases = [
-                (
-                    literal,
-                    converter(obj_var),
-                )  # Apply the sub-converter to the whole object
-                for literal, converter in sub_model_converters.items()
-            ]
-            return rx.match(discriminator_value_var, *cases, JS_NULL).to(ObjectVar)
-
-        value_converter = discriminated_union_converter
+        # Dispatched through a lookup table of the sub-model converters
+        value_converter = _create_union_converter(
+            discriminator_alias,
+            tuple(
+                (literal, sub_field.type_)
+                for literal, sub_field in field.sub_fields_mapping.items()
+            ),
+        )
 
     else:
         # Create the main value converter for the field's type
@@ -168,26 +350,255 @@ def _create_field_converter(field: ModelField) -> Callable[[Var], Var]:
         return value_converter
 
 
-@cache
-def _create_model_converter(model: type[BaseModel]) -> Callable[[Var], Var]:
-    """Creates a lambda to convert a Var to a dict structure matching the Pydantic model."""
+# Model converters are emitted once, as named functions of their own module in
+# this directory, imported by the pages calling them
+CONVERTERS_MODULE = "$/custom/converters"
+
+CONVERTERS_HEADER = """\
+// ------------------- DO NOT EDIT ----------------------
+// This file was generated by `reflex_experiment/helpers.py` while compiling
+// the app, it contains a converter used by its event handlers.
+// ------------------------------------------------------
+"""
+
+_converter_functions: dict[str, str] = {}
+# Imports of each converter function, including the converters it calls
+_converter_imports: dict[str, dict[str, set[ImportVar]]] = {}
+# Converter modules written by this process
+_written_converters: set[Path] = set()
+
+
+def get_converters_dir() -> Path:
+    return get_web_dir() / "custom" / "converters"
+
+
+def get_converter_module(fn_name: str) -> str:
+    return f"{CONVERTERS_MODULE}/{fn_name}"
+
+
+def get_called_converters(values: Iterable[Any]) -> set[str]:
+    """Names of the converter functions called by `values`, event chains or Vars."""
+    names = set()
+    for value in values:
+        var_data = LiteralVar.create(value)._get_all_var_data()
+        for lib, tags in var_data.imports if var_data else ():
+            if lib.startswith(f"{CONVERTERS_MODULE}/"):
+                names.update(str(tag.tag) for tag in tags)
+    return names
+
+
+def get_converter_dependencies(fn_names: Iterable[str]) -> set[str]:
+    """`fn_names`, along with the converter functions they call, recursively."""
+    pending = list(fn_names)
+    names = set()
+    while pending:
+        fn_name = pending.pop()
+        if fn_name in names:
+            continue
+        names.add(fn_name)
+        for lib, tags in _converter_imports.get(fn_name, {}).items():
+            if lib.startswith(f"{CONVERTERS_MODULE}/"):
+                pending.extend(str(tag.tag) for tag in tags)
+    return names
+
+
+def get_converter_sizes() -> dict[str, int]:
+    """Size (in characters) of the registered converter functions, largest first."""
+    sizes = {name: len(source) for name, source in _converter_functions.items()}
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
+
+
+def _write_converter(fn_name: str, path: Path) -> bool:
+    imports = [
+        f'import {{ {", ".join(sorted(str(tag.tag) for tag in tags))} }} from "{lib}";'
+        for lib, tags in sorted(_converter_imports[fn_name].items())
+    ]
+    source = "\n".join([CONVERTERS_HEADER, *imports, _converter_functions[fn_name]])
+    if path.exists() and path.read_text() == source:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Written atomically, the frontend dev server may be watching the file. The
+    # temporary file is unique, several workers may compile the app at once
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as tmp_file:
+        tmp_file.write(source)
+    os.replace(tmp_file.name, path)
+    return True
+
+
+def write_converters(fn_names: Iterable[str], directory: Path | None = None) -> int:
+    """Write the modules of the converter functions `fn_names` and of those they
+    call to `directory`, returns the number of changed files.
+
+    Called while collecting the imports of the components (see `ComponentBase`),
+    so only when compiling the frontend, and only for the converters of the
+    compiled pages. Each module is written once per process.
+    """
+    directory = directory or get_converters_dir()
+    changed = 0
+    for fn_name in sorted(get_converter_dependencies(fn_names)):
+        path = directory / f"{fn_name}.ts"
+        if path in _written_converters and path.exists():
+            continue
+        changed += _write_converter(fn_name, path)
+        _written_converters.add(path)
+    if changed:
+        logger.debug(f"Wrote {changed} converters to {directory}")
+    return changed
+
+
+def _add_converter_function(
+    name: str, render: Callable[[str], str], key: str, var_data: VarData | None
+) -> str:
+    """Add the function rendered by `render(fn_name)` to the converters module,
+    returns its name."""
+    # Named after the content, so that every process agrees on the names
+    digest = md5(key.encode()).hexdigest()[:8]
+    identifier = re.sub(r"\W+", "_", name).strip("_")
+    fn_name = f"convert{identifier}_{digest}"
+    if fn_name in _converter_functions:
+        return fn_name
+
+    imports: dict[str, set[ImportVar]] = {}
+    for lib, tags in var_data.imports if var_data else ():
+        imports.setdefault(lib, set()).update(tags)
+    _converter_imports[fn_name] = imports
+    _converter_functions[fn_name] = render(fn_name)
+    logger.debug(
+        f"Registered converter {fn_name} ({len(_converter_functions[fn_name])} chars)"
+    )
+    return fn_name
+
+
+def register_converter(name: str, body: Var) -> str:
+    """Emit `body`, an expression of the JS variable `obj`, as a function of the
+    converters module. Returns the name of the function."""
+    source = str(body)
+    return _add_converter_function(
+        name,
+        lambda fn_name: (
+            f"export function {fn_name}(obj: any) {{\n  return {source};\n}}\n"
+        ),
+        source,
+        body._get_all_var_data(),
+    )
+
 
+def register_union_converter(
+    name: str, discriminator: Var, cases: dict[Any, str]
+) -> str:
+    """Emit a function dispatching `obj` to the converter of its `discriminator`
+    value (an expression of `obj`), or returning null for unknown values."""
+    discriminator_source = str(discriminator)
+    entries = "".join(
+        f"  [{json.dumps(literal)}, {case_fn}],\n" for literal, case_fn in cases.items()
+    )
+
+    def render(fn_name: str) -> str:
+        return (
+            f"const {fn_name}_cases = new Map<unknown, (obj: any) => object>([\n"
+            f"{entries}]);\n\n"
+            f"export function {fn_name}(obj: any) {{\n"
+            f"  const convert = {fn_name}_cases.get({discriminator_source});\n"
+            f"  return convert ? convert(obj) : null;\n"
+            f"}}\n"
+        )
+
+    return _add_converter_function(
+        name,
+        render,
+        f"{discriminator_source}\n{entries}",
+        VarData.merge(
+            discriminator._get_all_var_data(),
+            *(_get_converter_var_data(case_fn) for case_fn in cases.values()),
+        ),
+    )
+
+
+def _get_converter_var_data(fn_name: str) -> VarData:
+    return VarData(imports={get_converter_module(fn_name): [ImportVar(tag=fn_name)]})
+
+
+def _create_converter_call(fn_name: str) -> Callable[[Var], Var]:
+    """Creates a lambda calling the converter `fn_name` of the converters module."""
+    fn_var_data = _get_converter_var_data(fn_name)
+
+    def converter_call(var: Var) -> Var:
+        return Var(
+            _js_expr=f"{fn_name}({var})",
+            _var_type=dict,
+            _var_data=VarData.merge(var._get_all_var_data(), fn_var_data),
+        ).to(ObjectVar)
+
+    return converter_call
+
+
+@cache
+def _register_model_converter(model: type[BaseModel]) -> str:
     assert_is_concrete_model(model)
-    # Pre-calculate field converters and their JS camelCase names (using alias)
+    # Pre-calculate field converters (JS properties are looked up using the alias)
     field_converters = {
-        field_name: (to_camel(field.alias), _create_field_converter(field))
+        field_name: (field.alias, _create_field_converter(field))
         for field_name, field in model.__fields__.items()
     }
 
-    def model_converter(var: Var) -> Var:
-        obj_var = var.to(ObjectVar)  # Ensure we have an object var
-        result_dict = {}
-        for field_name, (camel_alias, converter) in field_converters.items():
-            field_var = getattr(obj_var, camel_alias)
-            result_dict[field_name] = converter(field_var)
-        return Var.create(result_dict)
+    obj_var = Var(_js_expr="obj").to(ObjectVar)
+    result_dict = {}
+    for field_name, (alias, converter) in field_converters.items():
+        field_var = get_js_property(obj_var, alias)
+        result_dict[field_name] = converter(field_var)
+    return register_converter(model.__name__, Var.create(result_dict))
 
-    return model_converter
+
+@cache
+def _create_model_converter(model: type[BaseModel]) -> Callable[[Var], Var]:
+    """Creates a lambda to convert a Var to a dict structure matching the Pydantic model.
+
+    The conversion is emitted once as a function of the converters module, the
+    returned lambda only calls it.
+    """
+    return _create_converter_call(_register_model_converter(model))
+
+
+@cache
+def _register_union_converter(
+    discriminator_alias: str, cases: tuple[tuple[Any, type[BaseModel]], ...]
+) -> str:
+    models = [model for _, model in cases]
+    base = next(
+        cls for cls in models[0].__mro__ if all(issubclass(m, cls) for m in models)
+    )
+    return register_union_converter(
+        f"{base.__name__}Union",
+        get_js_property(Var(_js_expr="obj").to(ObjectVar), discriminator_alias),
+        {literal: _register_model_converter(model) for literal, model in cases},
+    )
+
+
+@cache
+def _create_union_converter(
+    discriminator_alias: str, cases: tuple[tuple[Any, type[BaseModel]], ...]
+) -> Callable[[Var], Var]:
+    """Creates a lambda to convert a Var to the model of a discriminated union
+    selected by its `discriminator_alias` property, in constant time."""
+    return _create_converter_call(_register_union_converter(discriminator_alias, cases))
+
+
+@cache
+def _register_item_converter(type_: Type) -> str | None:
+    """Name of the converters module function converting a value of `type_`, for
+    the items of lists and dicts. None if the values are passed through as is."""
+    if is_pydantic_model(type_):
+        assert_is_concrete_model(type_)
+        return _register_model_converter(type_)
+    body = _create_value_converter(type_)(Var(_js_expr="obj"))
+    if str(body) == "obj":
+        return None
+    # Models and unions are already a single function call, don't wrap them
+    if match := re.fullmatch(r"(convert\w+)\(obj\)", str(body)):
+        return match.group(1)
+    return register_converter(getattr(type_, "__name__", "Item"), body)
 
 
 # Updated create_event_handler
@@ -224,11 +635,12 @@ def create_event_handler(event, element):
 
 class TypedEventHandler:
     "Helper class to define a pass-through event handler in Reflex with proper return type annotations"
+
     @classmethod
     def __class_getitem__(cls, *t_args: type):
-        return_type = tuple[*(rx.Var[t] for t in t_args)] # type: ignore
+        return_type = tuple[*(rx.Var[t] for t in t_args)]  # type: ignore
 
-        def handler(*args) -> return_type: # type: ignore
+        def handler(*args) -> return_type:  # type: ignore
             return args
 
-        return handler
\ No newline at end of file
+        return handler
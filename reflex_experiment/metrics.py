@@ -0,0 +1,256 @@
+"""Per-trigger instrumentation of event payloads, see `set_trigger_metrics`.
+
+With metrics enabled, the payloads of the triggers bound to components are
+tagged on the client with the trigger name and event type. On the backend, the
+`TriggerMetricsMiddleware` of the app removes the tag and records, per trigger
+and event type:
+- `payload_bytes`: the size of the payload, as JSON plus its binary attachments
+- `decode_seconds`: the time spent building the models of the payload
+- `handler_seconds`: the time spent in the event handler, excluding decoding
+
+The metrics go to a `MetricsSink`, by default a `HistogramSink` kept in memory,
+which can also be exported in the Prometheus text format. Each backend worker
+records its own metrics. Decode and handler times aren't recorded for background
+event handlers.
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from reflex.event import Event
+from reflex.middleware import Middleware
+from reflex.state import BaseState, StateUpdate
+
+# Key of the tag added to the payloads
+TRIGGER_KEY = "__trigger__"
+
+METRICS = ("payload_bytes", "decode_seconds", "handler_seconds")
+
+# Upper bounds of the histogram buckets of each metric
+DEFAULT_BUCKETS = {
+    "payload_bytes": (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576),
+    "decode_seconds": (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05),
+    "handler_seconds": (1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1, 5),
+}
+
+
+class MetricsSink(ABC):
+    """Receives the measurements of the instrumented triggers."""
+
+    @abstractmethod
+    def record(self, trigger: str, event_type: str, metric: str, value: float):
+        """Record `value`, measured for `metric` on an `event_type` event of `trigger`."""
+
+
+@dataclass
+class Histogram:
+    bounds: tuple[float, ...]
+    # One more bucket than bounds, for the values above the last one
+    counts: list[int]
+    sum: float = 0
+    count: int = 0
+
+    @classmethod
+    def create(cls, bounds: tuple[float, ...]) -> "Histogram":
+        return cls(bounds, [0] * (len(bounds) + 1))
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class HistogramSink(MetricsSink):
+    """Keeps a histogram of each metric per trigger and event type."""
+
+    def __init__(
+        self,
+        buckets: dict[str, tuple[float, ...]] = DEFAULT_BUCKETS,
+        prefix: str = "reflex_event",
+    ):
+        self.buckets = buckets
+        self.prefix = prefix
+        # (metric, trigger, event type) -> histogram
+        self.histograms: dict[tuple[str, str, str], Histogram] = {}
+
+    def record(self, trigger: str, event_type: str, metric: str, value: float):
+        key = (metric, trigger, event_type)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram.create(self.buckets[metric])
+        histogram.observe(value)
+
+    def summary(self, metric: str = "payload_bytes") -> list[dict[str, Any]]:
+        """Count, mean and total of `metric` per trigger, largest total first."""
+        rows = [
+            {
+                "trigger": trigger,
+                "event_type": event_type,
+                "count": histogram.count,
+                "mean": histogram.mean,
+                "sum": histogram.sum,
+            }
+            for (name, trigger, event_type), histogram in self.histograms.items()
+            if name == metric
+        ]
+        return sorted(rows, key=lambda row: row["sum"], reverse=True)
+
+    def to_prometheus(self) -> str:
+        """The histograms in the Prometheus text exposition format."""
+        lines = []
+        for metric in METRICS:
+            name = f"{self.prefix}_{metric}"
+            histograms = [
+                (trigger, event_type, histogram)
+                for (key, trigger, event_type), histogram in self.histograms.items()
+                if key == metric
+            ]
+            if not histograms:
+                continue
+            lines.append(f"# TYPE {name} histogram")
+            for trigger, event_type, histogram in histograms:
+                labels = (
+                    f'trigger="{_escape_label(trigger)}",'
+                    f'event_type="{_escape_label(event_type)}"'
+                )
+                cumulative = 0
+                for bound, count in zip((*histogram.bounds, "+Inf"), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "".join(f"{line}\n" for line in lines)
+
+
+_metrics_sink: MetricsSink | None = None
+
+
+def set_trigger_metrics(enabled: bool = True, sink: MetricsSink | None = None):
+    """Record the payload size, decode time and handler time of each trigger.
+
+    Applies to the triggers bound after the call, so enable it before compiling
+    the app, and add the middleware removing the tags from the payloads:
+
+        set_trigger_metrics()
+        app.add_middleware(TriggerMetricsMiddleware())
+
+    The metrics go to `sink`, a new `HistogramSink` by default (see `trigger_metrics`).
+    """
+    global _metrics_sink
+    _metrics_sink = (sink or HistogramSink()) if enabled else None
+
+
+def trigger_metrics() -> MetricsSink | None:
+    """The sink of the trigger metrics, `None` if they are disabled."""
+    return _metrics_sink
+
+
+def serve_prometheus_metrics(app: Any, path: str = "/metrics"):
+    """Expose the metrics of a `HistogramSink` at `path` of the app's backend."""
+    from fastapi.responses import PlainTextResponse
+
+    def metrics():
+        sink = _metrics_sink
+        text = sink.to_prometheus() if isinstance(sink, HistogramSink) else ""
+        return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
+
+    app.api.add_api_route(path, metrics, methods=["GET"])
+
+
+@dataclass
+class Measurement:
+    """Timings of the event being processed."""
+
+    trigger: str
+    event_type: str
+    start: float = field(default_factory=time.perf_counter)
+    decode_seconds: float = 0
+    decoding: bool = False
+
+    @contextmanager
+    def decode(self):
+        self.decoding = True
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.decode_seconds += time.perf_counter() - start
+            self.decoding = False
+
+
+_measurement: ContextVar[Measurement | None] = ContextVar("_measurement", default=None)
+
+
+def current_measurement() -> Measurement | None:
+    """The measurement of the event being processed, if its trigger is instrumented."""
+    return _measurement.get()
+
+
+def payload_size(payload: Any) -> int:
+    """Size of `payload` as sent by Socket.IO, binary attachments included."""
+    attachments = 0
+
+    def default(value: Any):
+        nonlocal attachments
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            attachments += memoryview(value).nbytes
+            return None
+        raise TypeError(f"Cannot measure {type(value).__name__}")
+
+    encoded = json.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False, default=default
+    )
+    return len(encoded.encode()) + attachments
+
+
+class TriggerMetricsMiddleware(Middleware):
+    """Removes the tags of the instrumented payloads and records their metrics."""
+
+    async def preprocess(
+        self, app: Any, state: BaseState, event: Event
+    ) -> StateUpdate | None:
+        sink = _metrics_sink
+        tag = None
+        for value in event.payload.values():
+            if isinstance(value, dict) and TRIGGER_KEY in value:
+                tag = value.pop(TRIGGER_KEY)
+        if sink is None or tag is None:
+            _measurement.set(None)
+            return None
+        trigger, event_type = tag
+        sink.record(trigger, event_type, "payload_bytes", payload_size(event.payload))
+        _measurement.set(Measurement(trigger, event_type))
+        return None
+
+    async def postprocess(
+        self, app: Any, state: BaseState, event: Event, update: StateUpdate
+    ) -> StateUpdate:
+        measurement = _measurement.get()
+        sink = _metrics_sink
+        if measurement is None or sink is None or not update.final:
+            return update
+        _measurement.set(None)
+        elapsed = time.perf_counter() - measurement.start
+        trigger, event_type = measurement.trigger, measurement.event_type
+        sink.record(trigger, event_type, "decode_seconds", measurement.decode_seconds)
+        sink.record(
+            trigger,
+            event_type,
+            "handler_seconds",
+            elapsed - measurement.decode_seconds,
+        )
+        return update
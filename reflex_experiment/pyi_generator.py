@@ -7,17 +7,34 @@ import ast
 import contextlib
 import importlib
 import inspect
+import json
 import logging
+import multiprocessing
 import re
 import subprocess
+import sys
+import tempfile
+import time
 import typing
-from fileinput import FileInput
+from graphlib import CycleError, TopologicalSorter
+from hashlib import md5
+from importlib.metadata import version
 from inspect import getfullargspec
 from itertools import chain
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
 from pathlib import Path
 from types import ModuleType, SimpleNamespace, UnionType
-from typing import Any, Callable, Iterable, Sequence, Type, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    Type,
+    get_args,
+    get_origin,
+)
 
 from reflex.components.component import Component
 from reflex.utils import types as rx_types
@@ -104,6 +121,199 @@ def _walk_files(path: str | Path):
         yield p.resolve()
 
 
+# Generated stubs of the previous runs, see `PyiGenerator.scan_all`
+CACHE_FILE = ".pyi_cache.json"
+CACHE_VERSION = 1
+
+# The stubs also depend on the generator, and the schema of the static mode
+GENERATOR_FILES = [
+    Path(__file__).with_name(name).resolve()
+    for name in ("pyi_generator.py", "pyi_static.py", "pyi_schema.json")
+]
+
+
+def _hash_text(text: str) -> str:
+    return md5(text.encode()).hexdigest()
+
+
+def _module_file(module: str) -> Path | None:
+    """Get the file of a module of the project, without importing it.
+
+    Args:
+        module: The dotted name of the module.
+
+    Returns:
+        The resolved path of the module or package file, None if it isn't part of the project.
+    """
+    base = PWD.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+def _imported_files(path: Path) -> set[Path]:
+    """Get the project files directly imported by a file, from its AST.
+
+    Args:
+        path: The file to read the imports of.
+
+    Returns:
+        The imported modules and the packages containing them.
+    """
+    package = list(_relative_to_pwd(path).with_suffix("").parts[:-1])
+    modules = []
+    for node in ast.walk(ast.parse(path.read_text())):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = package[: len(package) - node.level + 1] if node.level else []
+            module = ".".join([*base, *([node.module] if node.module else [])])
+            modules.append(module)
+            # `from package import submodule`
+            modules.extend(f"{module}.{alias.name}" for alias in node.names)
+    files = set()
+    for module in modules:
+        parts = module.split(".")
+        for end in range(1, len(parts) + 1):
+            file = _module_file(".".join(parts[:end]))
+            if file is not None and file != path:
+                files.add(file)
+    return files
+
+
+def _run_ruff(args: list[str], paths: list[Path]):
+    """Run ruff in place on files, leaving them as they are if it fails.
+
+    Args:
+        args: The ruff command and its options.
+        paths: The files to process.
+    """
+    result = subprocess.run(
+        ["ruff", *args, *map(str, paths)], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        logger.warning(f"ruff {args[0]} failed: {result.stderr}")
+
+
+def _ruff_fix_and_format(stubs: dict[Path, str]) -> dict[Path, str]:
+    """Fix and format generated stubs before they are written, with a single ruff
+    process per step for all of them.
+
+    The stubs are processed in a temporary copy of their directories within the
+    project, so that ruff uses its configuration without touching the .pyi files.
+
+    Args:
+        stubs: The generated stubs, by path.
+
+    Returns:
+        The stubs, with the fixable ruff errors (like unused imports) fixed and formatted.
+    """
+    if not stubs:
+        return {}
+    with tempfile.TemporaryDirectory(prefix=".pyi_stubs_", dir=PWD) as tmp_dir:
+        tmp_paths = {}
+        for pyi_path, source in stubs.items():
+            tmp_path = Path(tmp_dir) / _relative_to_pwd(pyi_path)
+            tmp_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(source)
+            tmp_paths[pyi_path] = tmp_path
+        # Fixing first, removed imports would otherwise need another format
+        _run_ruff(["check", "--fix-only", "--exit-zero"], list(tmp_paths.values()))
+        _run_ruff(["format"], list(tmp_paths.values()))
+        return {pyi_path: path.read_text() for pyi_path, path in tmp_paths.items()}
+
+
+def _add_type_ignores(source: str) -> str:
+    """Add the `# type: ignore` comments of the stubs, which ast can't represent.
+
+    Args:
+        source: The formatted stub.
+
+    Returns:
+        The stub with the comments.
+    """
+    lines = source.splitlines(keepends=True)
+    for index, line in enumerate(lines):
+        if "def create(" in line or "Var[Figure]" in line or "Var[Template]" in line:
+            lines[index] = line.rstrip() + "  # type: ignore\n"
+    return "".join(lines)
+
+
+def _module_name(path: Path) -> str:
+    """Get the dotted name of a module of the project from its file.
+
+    Args:
+        path: The file of the module or package.
+
+    Returns:
+        The name to import it with.
+    """
+    parts = _relative_to_pwd(path).with_suffix("").parts
+    return ".".join(parts[:-1] if parts[-1] == "__init__" else parts)
+
+
+def _warm_imports(modules: list[str]):
+    """Import the modules shared by the files to scan, once per process.
+
+    Args:
+        modules: The dotted names of the modules.
+    """
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            # Reported by the scan of the files importing it
+            logger.debug(f"Could not import {module}: {e}")
+
+
+def _py_mtimes(roots: Iterable[Path]) -> dict[Path, int]:
+    mtimes = {}
+    for root in roots:
+        for file in _walk_files(root):
+            if file.suffix == ".py":
+                with contextlib.suppress(OSError):
+                    mtimes[file] = file.stat().st_mtime_ns
+    return mtimes
+
+
+def _watch_changes(roots: list[Path], interval: float) -> Iterator[set[Path]]:
+    """Watch the Python files in directories, with watchfiles (inotify on Linux)
+    when it is installed, by polling their modification time otherwise.
+
+    Args:
+        roots: The directories to watch, recursively.
+        interval: The seconds between two polls.
+
+    Yields:
+        The resolved paths of the files changed, added or removed, by batch.
+    """
+    try:
+        import watchfiles
+    except ImportError:
+        logger.info(
+            f"Polling for changes every {interval}s, install watchfiles to be notified"
+        )
+        before = _py_mtimes(roots)
+        while True:
+            time.sleep(interval)
+            after = _py_mtimes(roots)
+            changed = {
+                file
+                for file in before.keys() | after.keys()
+                if before.get(file) != after.get(file)
+            }
+            before = after
+            if changed:
+                yield changed
+    for changes in watchfiles.watch(*roots, watch_filter=watchfiles.PythonFilter()):
+        yield {
+            path
+            for _, name in changes
+            if (path := Path(name).resolve()).suffix == ".py"
+        }
+
+
 def _relative_to_pwd(path: Path) -> Path:
     """Get the relative path of a path to the current working directory.
 
@@ -242,55 +452,73 @@ def _generate_imports(
     ]
 
 
-def _generate_docstrings(clzs: list[Type[Component]], props: list[str]) -> str:
-    """Generate the docstrings for the create method.
+def _get_props_comments(source: str) -> list[tuple[str, list[str]]]:
+    """Get the comments documenting the props declared in a class.
 
     Args:
-        clzs: The classes to generate docstrings for.
-        props: The props to generate docstrings for.
+        source: The source of the class.
 
     Returns:
-        The docstring for the create method.
+        The name and comment lines of each documented prop, in declaration order.
     """
-    props_comments = {}
+    props_comments = []
     comments = []
-    for clz in clzs:
-        for line in inspect.getsource(clz).splitlines():
-            reached_functions = re.search("def ", line)
-            if reached_functions:
-                # We've reached the functions, so stop.
-                break
+    for line in source.splitlines():
+        reached_functions = re.search("def ", line)
+        if reached_functions:
+            # We've reached the functions, so stop.
+            break
+
+        if line == "":
+            # We hit a blank line, so clear comments to avoid commented out prop appearing in next prop docs.
+            comments.clear()
+            continue
 
-            if line == "":
-                # We hit a blank line, so clear comments to avoid commented out prop appearing in next prop docs.
-                comments.clear()
-                continue
+        # Get comments for prop
+        if line.strip().startswith("#"):
+            # Remove noqa from the comments.
+            line = line.partition(" # noqa")[0]
+            comments.append(line)
+            continue
 
-            # Get comments for prop
-            if line.strip().startswith("#"):
-                # Remove noqa from the comments.
-                line = line.partition(" # noqa")[0]
-                comments.append(line)
-                continue
+        # Check if this line has a prop.
+        match = re.search("\\w+:", line)
+        if match is None:
+            # This line doesn't have a var, so continue.
+            continue
+
+        # Get the prop.
+        prop = match.group(0).strip(":")
+        if comments:  # do not include undocumented props
+            props_comments.append(
+                (prop, [comment.strip().strip("#") for comment in comments])
+            )
+        comments.clear()
+    return props_comments
 
-            # Check if this line has a prop.
-            match = re.search("\\w+:", line)
-            if match is None:
-                # This line doesn't have a var, so continue.
-                continue
 
-            # Get the prop.
-            prop = match.group(0).strip(":")
+def _format_docstring(
+    create_doc: str | None,
+    clzs_comments: list[list[tuple[str, list[str]]]],
+    props: list[str],
+) -> str:
+    """Add the documentation of the props to the docstring of the create method.
+
+    Args:
+        create_doc: The docstring of the create method.
+        clzs_comments: The props comments of each class, see `_get_props_comments`.
+        props: The props to generate docstrings for.
+
+    Returns:
+        The docstring for the create method.
+    """
+    props_comments = {}
+    for clz_comments in clzs_comments:
+        for prop, comments in clz_comments:
             if prop in props:
-                if not comments:  # do not include undocumented props
-                    continue
-                props_comments[prop] = [
-                    comment.strip().strip("#") for comment in comments
-                ]
-            comments.clear()
-    clz = clzs[0]
+                props_comments[prop] = comments
     new_docstring = []
-    for line in (clz.create.__doc__ or "").splitlines():
+    for line in (create_doc or "").splitlines():
         if "**" in line:
             indent = line.split("**")[0]
             new_docstring.extend(
@@ -300,6 +528,23 @@ def _generate_docstrings(clzs: list[Type[Component]], props: list[str]) -> str:
     return "\n".join(new_docstring)
 
 
+def _generate_docstrings(clzs: list[Type[Component]], props: list[str]) -> str:
+    """Generate the docstrings for the create method.
+
+    Args:
+        clzs: The classes to generate docstrings for.
+        props: The props to generate docstrings for.
+
+    Returns:
+        The docstring for the create method.
+    """
+    return _format_docstring(
+        clzs[0].create.__doc__,
+        [_get_props_comments(inspect.getsource(clz)) for clz in clzs],
+        props,
+    )
+
+
 def _extract_func_kwargs_as_ast_nodes(
     func: Callable,
     type_hint_globals: dict[str, Any],
@@ -329,6 +574,30 @@ def _extract_func_kwargs_as_ast_nodes(
     return kwargs
 
 
+def _get_class_props(target_class: Type, type_hint_globals: dict[str, Any]):
+    """Get the props declared by a class itself.
+
+    Args:
+        target_class: The class to get the props of.
+        type_hint_globals: The globals to use to resolving a type hint str.
+
+    Returns:
+        The name and type hint of each prop, excluding the event triggers.
+    """
+    event_triggers = target_class._create([]).get_event_triggers()
+    # Import from the target class to ensure type hints are resolvable.
+    exec(f"from {target_class.__module__} import *", type_hint_globals)
+    return [
+        (name, _get_type_hint(value, type_hint_globals))
+        for name, value in target_class.__annotations__.items()
+        if not (
+            name in EXCLUDED_PROPS
+            or name in event_triggers
+            or (isinstance(value, str) and "ClassVar" in value)
+        )
+    ]
+
+
 def _extract_class_props_as_ast_nodes(
     func: Callable,
     clzs: list[Type],
@@ -356,17 +625,8 @@ def _extract_class_props_as_ast_nodes(
         if target_class is Component:
             continue
         # === CHANGED ===
-        event_triggers = target_class._create([]).get_event_triggers()
-        # Import from the target class to ensure type hints are resolvable.
-        exec(f"from {target_class.__module__} import *", type_hint_globals)
-        for name, value in target_class.__annotations__.items():
-            if (
-                name in spec.kwonlyargs
-                or name in EXCLUDED_PROPS
-                or name in all_props
-                or name in event_triggers
-                or (isinstance(value, str) and "ClassVar" in value)
-            ):
+        for name, type_hint in _get_class_props(target_class, type_hint_globals):
+            if name in spec.kwonlyargs or name in all_props:
                 continue
             all_props.append(name)
 
@@ -382,12 +642,7 @@ def _extract_class_props_as_ast_nodes(
 
             kwargs.append(
                 (
-                    ast.arg(
-                        arg=name,
-                        annotation=ast.Name(
-                            id=_get_type_hint(value, type_hint_globals)
-                        ),
-                    ),
+                    ast.arg(arg=name, annotation=ast.Name(id=type_hint)),
                     ast.Constant(value=default),
                 )
             )
@@ -440,8 +695,11 @@ def type_to_ast(typ: Any, cls: type) -> ast.AST:
     if not args:
         return ast.Name(id=base_name)
 
-    # Convert all type arguments recursively
-    arg_nodes = [type_to_ast(arg, cls) for arg in args]
+    # Convert all type arguments recursively, the values of Literals as is
+    arg_nodes = [
+        ast.Constant(value=arg) if origin is Literal else type_to_ast(arg, cls)
+        for arg in args
+    ]
 
     # Special case for single-argument types (like list[T] or Optional[T])
     if len(arg_nodes) == 1:
@@ -470,161 +728,160 @@ def _get_parent_imports(func: Callable):
     return _imports
 
 
-def _generate_component_create_functiondef(
-    node: ast.FunctionDef | None,
-    clz: type[Component] | type[SimpleNamespace],
-    type_hint_globals: dict[str, Any],
-) -> ast.FunctionDef:
-    """Generate the create function definition for a Component.
+def _figure_out_return_type(annotation: Any, clz: type) -> ast.Name:
+    """Get the EventType union accepted by a trigger, from the return annotation of
+    its event spec.
 
     Args:
-        node: The existing create functiondef node from the ast
-        clz: The Component class to generate the create functiondef for.
-        type_hint_globals: The globals to use to resolving a type hint str.
+        annotation: The return annotation of the event spec.
+        clz: The class of the trigger.
 
     Returns:
-        The create functiondef node for the ast.
-
-    Raises:
-        TypeError: If clz is not a subclass of Component.
+        The union of the EventType of each prefix of the spec arguments.
     """
-    if not issubclass(clz, Component):
-        raise TypeError(f"clz must be a subclass of Component, not {clz!r}")
+    if inspect.isclass(annotation) and issubclass(annotation, inspect._empty):
+        return ast.Name(id="EventType[Any]")
 
-    # add the imports needed by get_type_hint later
-    type_hint_globals.update(
-        {name: getattr(typing, name) for name in DEFAULT_TYPING_IMPORTS}
-    )
+    if not isinstance(annotation, str) and get_origin(annotation) is tuple:
+        arguments = get_args(annotation)
 
-    if clz.__module__ != clz.create.__module__:
-        _imports = _get_parent_imports(clz.create)
-        for name, values in _imports.items():
-            exec(f"from {name} import {','.join(values)}", type_hint_globals)
+        arguments_without_var = [
+            get_args(argument)[0] if get_origin(argument) == Var else argument
+            for argument in arguments
+        ]
 
-    kwargs = _extract_func_kwargs_as_ast_nodes(clz.create, type_hint_globals)
+        # Convert each argument type to its AST representation
+        type_args = [type_to_ast(arg, cls=clz) for arg in arguments_without_var]
 
-    # kwargs associated with props defined in the class and its parents
-    all_classes = [c for c in clz.__mro__ if issubclass(c, Component)]
-    prop_kwargs = _extract_class_props_as_ast_nodes(
-        clz.create, all_classes, type_hint_globals
-    )
-    all_props = [arg[0].arg for arg in prop_kwargs]
-    kwargs.extend(prop_kwargs)
+        # Get all prefixes of the type arguments
+        all_count_args_type = [
+            ast.Name(
+                f"EventType[{', '.join([ast.unparse(arg) for arg in type_args[:i]])}]"
+            )
+            if i > 0
+            else ast.Name("EventType[()]")
+            for i in range(len(type_args) + 1)
+        ]
 
-    def figure_out_return_type(annotation: Any):
-        if inspect.isclass(annotation) and issubclass(annotation, inspect._empty):
-            return ast.Name(id="EventType[Any]")
+        # Create EventType using the joined string
+        return ast.Name(id=f"{' | '.join(map(ast.unparse, all_count_args_type))}")
 
-        if not isinstance(annotation, str) and get_origin(annotation) is tuple:
-            arguments = get_args(annotation)
+    if isinstance(annotation, str) and annotation.lower().startswith("tuple["):
+        inside_of_tuple = (
+            annotation.removeprefix("tuple[").removeprefix("Tuple[").removesuffix("]")
+        )
 
-            arguments_without_var = [
-                get_args(argument)[0] if get_origin(argument) == Var else argument
-                for argument in arguments
-            ]
+        if inside_of_tuple == "()":
+            return ast.Name(id="EventType[()]")
 
-            # Convert each argument type to its AST representation
-            type_args = [type_to_ast(arg, cls=clz) for arg in arguments_without_var]
+        arguments = [""]
 
-            # Get all prefixes of the type arguments
-            all_count_args_type = [
-                ast.Name(
-                    f"EventType[{', '.join([ast.unparse(arg) for arg in type_args[:i]])}]"
-                )
-                if i > 0
-                else ast.Name("EventType[()]")
-                for i in range(len(type_args) + 1)
-            ]
+        bracket_count = 0
 
-            # Create EventType using the joined string
-            return ast.Name(id=f"{' | '.join(map(ast.unparse, all_count_args_type))}")
+        for char in inside_of_tuple:
+            if char == "[":
+                bracket_count += 1
+            elif char == "]":
+                bracket_count -= 1
 
-        if isinstance(annotation, str) and annotation.lower().startswith("tuple["):
-            inside_of_tuple = (
-                annotation.removeprefix("tuple[")
-                .removeprefix("Tuple[")
-                .removesuffix("]")
-            )
+            if char == "," and bracket_count == 0:
+                arguments.append("")
+            else:
+                arguments[-1] += char
+
+        arguments = [argument.strip() for argument in arguments]
 
-            if inside_of_tuple == "()":
-                return ast.Name(id="EventType[()]")
+        arguments_without_var = [
+            argument.removeprefix("Var[").removesuffix("]")
+            if argument.startswith("Var[")
+            else argument
+            for argument in arguments
+        ]
 
-            arguments = [""]
+        all_count_args_type = [
+            ast.Name(f"EventType[{', '.join(arguments_without_var[:i])}]")
+            if i > 0
+            else ast.Name("EventType[()]")
+            for i in range(len(arguments) + 1)
+        ]
 
-            bracket_count = 0
+        return ast.Name(id=f"{' | '.join(map(ast.unparse, all_count_args_type))}")
+    return ast.Name(id="EventType[Any]")
 
-            for char in inside_of_tuple:
-                if char == "[":
-                    bracket_count += 1
-                elif char == "]":
-                    bracket_count -= 1
 
-                if char == "," and bracket_count == 0:
-                    arguments.append("")
-                else:
-                    arguments[-1] += char
+def _get_event_trigger_hint(
+    event_specs: Callable | Sequence[Callable], clz: type
+) -> str:
+    """Get the type hint of a trigger of a component.
 
-            arguments = [argument.strip() for argument in arguments]
+    Args:
+        event_specs: The event spec of the trigger, or its alternatives.
+        clz: The component class.
 
-            arguments_without_var = [
-                argument.removeprefix("Var[").removesuffix("]")
-                if argument.startswith("Var[")
-                else argument
-                for argument in arguments
-            ]
+    Returns:
+        The type hint of the trigger, without the Optional.
+    """
+    if not isinstance(event_specs, Sequence):
+        return ast.unparse(
+            _figure_out_return_type(
+                inspect.signature(event_specs).return_annotation, clz
+            )
+        )
+    return ast.unparse(
+        ast.Subscript(
+            ast.Name("Union"),
+            ast.Tuple(
+                [
+                    _figure_out_return_type(
+                        inspect.signature(event_spec).return_annotation, clz
+                    )
+                    for event_spec in event_specs
+                ]
+            ),
+        )
+    )
 
-            all_count_args_type = [
-                ast.Name(f"EventType[{', '.join(arguments_without_var[:i])}]")
-                if i > 0
-                else ast.Name("EventType[()]")
-                for i in range(len(arguments) + 1)
-            ]
 
-            return ast.Name(id=f"{' | '.join(map(ast.unparse, all_count_args_type))}")
-        return ast.Name(id="EventType[Any]")
+def _build_create_functiondef(
+    node: ast.FunctionDef | None,
+    kwargs: list[tuple[ast.arg, ast.Constant | None]],
+    event_triggers: dict[str, str],
+    docstring: str,
+    clz_name: str,
+) -> ast.FunctionDef:
+    """Build the create function definition of a Component from its resolved props.
 
-    event_triggers = clz._create([]).get_event_triggers()
+    Args:
+        node: The existing create functiondef node from the ast
+        kwargs: The kwargs of the create function and the props of the component.
+        event_triggers: The type hint of each trigger of the component.
+        docstring: The docstring of the create function.
+        clz_name: The name of the Component class.
 
+    Returns:
+        The create functiondef node for the ast.
+    """
     # event handler kwargs
-    kwargs.extend(
-        (
-            ast.arg(
-                arg=trigger,
-                annotation=ast.Subscript(
-                    ast.Name("Optional"),
-                    ast.Index(  # pyright: ignore [reportArgumentType]
-                        value=ast.Name(
-                            id=ast.unparse(
-                                figure_out_return_type(
-                                    inspect.signature(event_specs).return_annotation
-                                )
-                                if not isinstance(
-                                    event_specs := event_triggers[trigger], Sequence
-                                )
-                                else ast.Subscript(
-                                    ast.Name("Union"),
-                                    ast.Tuple(
-                                        [
-                                            figure_out_return_type(
-                                                inspect.signature(
-                                                    event_spec
-                                                ).return_annotation
-                                            )
-                                            for event_spec in event_specs
-                                        ]
-                                    ),
-                                )
-                            )
-                        )
+    kwargs = [
+        *kwargs,
+        *(
+            (
+                ast.arg(
+                    arg=trigger,
+                    annotation=ast.Subscript(
+                        ast.Name("Optional"),
+                        ast.Index(  # pyright: ignore [reportArgumentType]
+                            value=ast.Name(id=event_triggers[trigger])
+                        ),
                     ),
                 ),
-            ),
-            ast.Constant(value=None),
-        )
-        for trigger in sorted(event_triggers)
-    )
+                ast.Constant(value=None),
+            )
+            for trigger in sorted(event_triggers)
+        ),
+    ]
 
-    logger.debug(f"Generated {clz.__name__}.create method with {len(kwargs)} kwargs")
+    logger.debug(f"Generated {clz_name}.create method with {len(kwargs)} kwargs")
     create_args = ast.arguments(
         args=[ast.arg(arg="cls")],
         posonlyargs=[],
@@ -639,13 +896,7 @@ def _generate_component_create_functiondef(
         name="create",
         args=create_args,
         body=[  # pyright: ignore [reportArgumentType]
-            ast.Expr(
-                value=ast.Constant(
-                    value=_generate_docstrings(
-                        all_classes, [*all_props, *event_triggers]
-                    )
-                ),
-            ),
+            ast.Expr(value=ast.Constant(value=docstring)),
             ast.Expr(
                 value=ast.Constant(value=Ellipsis),
             ),
@@ -659,11 +910,66 @@ def _generate_component_create_functiondef(
             ),
         ],
         lineno=node.lineno if node is not None else None,  # pyright: ignore [reportArgumentType]
-        returns=ast.Constant(value=clz.__name__),
+        returns=ast.Constant(value=clz_name),
     )
     return definition
 
 
+def _generate_component_create_functiondef(
+    node: ast.FunctionDef | None,
+    clz: type[Component] | type[SimpleNamespace],
+    type_hint_globals: dict[str, Any],
+) -> ast.FunctionDef:
+    """Generate the create function definition for a Component.
+
+    Args:
+        node: The existing create functiondef node from the ast
+        clz: The Component class to generate the create functiondef for.
+        type_hint_globals: The globals to use to resolving a type hint str.
+
+    Returns:
+        The create functiondef node for the ast.
+
+    Raises:
+        TypeError: If clz is not a subclass of Component.
+    """
+    if not issubclass(clz, Component):
+        raise TypeError(f"clz must be a subclass of Component, not {clz!r}")
+
+    # add the imports needed by get_type_hint later
+    type_hint_globals.update(
+        {name: getattr(typing, name) for name in DEFAULT_TYPING_IMPORTS}
+    )
+
+    if clz.__module__ != clz.create.__module__:
+        _imports = _get_parent_imports(clz.create)
+        for name, values in _imports.items():
+            exec(f"from {name} import {','.join(values)}", type_hint_globals)
+
+    kwargs = _extract_func_kwargs_as_ast_nodes(clz.create, type_hint_globals)
+
+    # kwargs associated with props defined in the class and its parents
+    all_classes = [c for c in clz.__mro__ if issubclass(c, Component)]
+    prop_kwargs = _extract_class_props_as_ast_nodes(
+        clz.create, all_classes, type_hint_globals
+    )
+    all_props = [arg[0].arg for arg in prop_kwargs]
+    kwargs.extend(prop_kwargs)
+
+    event_triggers = {
+        trigger: _get_event_trigger_hint(event_specs, clz)
+        for trigger, event_specs in clz._create([]).get_event_triggers().items()
+    }
+
+    return _build_create_functiondef(
+        node,
+        kwargs,
+        event_triggers,
+        _generate_docstrings(all_classes, [*all_props, *event_triggers]),
+        clz.__name__,
+    )
+
+
 def _generate_staticmethod_call_functiondef(
     node: ast.FunctionDef | None,
     clz: type[Component] | type[SimpleNamespace],
@@ -824,6 +1130,41 @@ class StubGenerator(ast.NodeTransformer):
             and issubclass(self.classes[self.current_class], Component)
         )
 
+    def _update_type_hint_globals(self):
+        """Resolve the names imported by the module, before generating a class."""
+        exec("\n".join(self.import_statements), self.type_hint_globals)
+
+    def _generate_create_functiondef(
+        self, node: ast.FunctionDef | None
+    ) -> ast.FunctionDef:
+        """Generate the create method of the current class.
+
+        Args:
+            node: The existing create functiondef node, if any.
+
+        Returns:
+            The create functiondef node for the ast.
+        """
+        return _generate_component_create_functiondef(
+            node, self.classes[self.current_class], self.type_hint_globals
+        )
+
+    def _generate_call_functiondef(self, node: ast.ClassDef) -> ast.FunctionDef | None:
+        """Generate the `__call__` method of the current namespace class.
+
+        Args:
+            node: The namespace classdef node.
+
+        Returns:
+            The __call__ functiondef node for the ast, if it can be generated.
+        """
+        return _generate_namespace_call_functiondef(
+            node,
+            self.current_class,
+            self.classes,
+            type_hint_globals=self.type_hint_globals,
+        )
+
     def visit_Module(self, node: ast.Module) -> ast.Module:
         """Visit a Module node and remove docstring from body.
 
@@ -886,7 +1227,7 @@ class StubGenerator(ast.NodeTransformer):
         Returns:
             The modified ClassDef node.
         """
-        exec("\n".join(self.import_statements), self.type_hint_globals)
+        self._update_type_hint_globals()
         self.current_class = node.name
         self._remove_docstring(node)
 
@@ -909,12 +1250,7 @@ class StubGenerator(ast.NodeTransformer):
                     continue
                 if not child.targets[:]:
                     node.body.remove(child)
-                call_definition = _generate_namespace_call_functiondef(
-                    node,
-                    self.current_class,
-                    self.classes,
-                    type_hint_globals=self.type_hint_globals,
-                )
+                call_definition = self._generate_call_functiondef(node)
                 break
 
         self.generic_visit(node)  # Visit child nodes.
@@ -927,13 +1263,7 @@ class StubGenerator(ast.NodeTransformer):
             and self._current_class_is_component()
         ):
             # Add a new .create FunctionDef since one does not exist.
-            node.body.append(
-                _generate_component_create_functiondef(
-                    node=None,
-                    clz=self.classes[self.current_class],
-                    type_hint_globals=self.type_hint_globals,
-                )
-            )
+            node.body.append(self._generate_create_functiondef(None))
         if call_definition is not None:
             node.body.append(call_definition)
         if not node.body:
@@ -958,9 +1288,7 @@ class StubGenerator(ast.NodeTransformer):
             The modified FunctionDef node (or None).
         """
         if node.name == "create" and self.current_class in self.classes:
-            node = _generate_component_create_functiondef(
-                node, self.classes[self.current_class], self.type_hint_globals
-            )
+            node = self._generate_create_functiondef(node)
         else:
             if node.name.startswith("_") and node.name != "__call__":
                 return None  # remove private methods
@@ -1054,8 +1382,107 @@ class PyiGenerator:
     root: str = ""
     current_module: Any = {}
     written_files: list[str] = []
+    # Direct project imports and content hash of each file, for the cache keys
+    _imports: dict[Path, set[Path]] = {}
+    _hashes: dict[Path, str] = {}
+    # Generated stubs of the current scan, formatted and written together
+    _pending_stubs: dict[Path, str] = {}
+    # Seconds spent importing and generating the stub of each module of the last scan
+    timings: dict[str, float] = {}
+    # Reads the modules in static mode, see `scan_all`
+    _resolver: Any = None
+
+    def _get_dependencies(self, path: Path) -> set[Path]:
+        """Get the project files a file depends on, directly or not.
+
+        Args:
+            path: The resolved path of the file.
+
+        Returns:
+            The resolved paths of its dependencies.
+        """
+        dependencies: set[Path] = set()
+        pending = [path]
+        while pending:
+            file = pending.pop()
+            imported = self._imports.get(file)
+            if imported is None:
+                imported = self._imports[file] = _imported_files(file)
+            for dependency in imported - dependencies:
+                dependencies.add(dependency)
+                pending.append(dependency)
+        dependencies.discard(path)
+        return dependencies
+
+    def _hash_file(self, path: Path) -> str:
+        digest = self._hashes.get(path)
+        if digest is None:
+            digest = self._hashes[path] = md5(path.read_bytes()).hexdigest()
+        return digest
+
+    def _get_cache_key(self, module_path: Path) -> str:
+        """Get the key of the stub of a module in the cache.
+
+        It changes with the module, the project modules it imports (directly or
+        not), the generator itself and the installed Reflex version.
+
+        Args:
+            module_path: The module to generate a stub for.
+
+        Returns:
+            The cache key.
+        """
+        path = module_path.resolve()
+        generator_files = [file for file in GENERATOR_FILES if file.exists()]
+        files = sorted({path, *generator_files, *self._get_dependencies(path)})
+        return _hash_text(
+            json.dumps(
+                [
+                    version("reflex"),
+                    DEFAULT_IMPORTS,
+                    [
+                        # The generator is outside of the project once installed
+                        (
+                            str(_relative_to_pwd(file))
+                            if file.is_relative_to(PWD)
+                            else file.name,
+                            self._hash_file(file),
+                        )
+                        for file in files
+                    ],
+                ],
+                sort_keys=True,
+            )
+        )
+
+    def _load_cache(self) -> dict[str, dict]:
+        try:
+            cache = json.loads((PWD / CACHE_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != CACHE_VERSION:
+            return {}
+        return cache["files"]
+
+    def _save_cache(self, entries: dict[str, dict]):
+        (PWD / CACHE_FILE).write_text(
+            json.dumps({"version": CACHE_VERSION, "files": entries}, indent=1) + "\n"
+        )
+
+    def _restore_pyi_file(self, module_path: Path, stub: str | None):
+        """Write back a cached stub if the .pyi file was removed or edited.
+
+        Args:
+            module_path: The module of the stub.
+            stub: The cached content of the stub, None if the module has none.
+        """
+        pyi_path = module_path.with_suffix(".pyi")
+        if stub is None or (pyi_path.exists() and pyi_path.read_text() == stub):
+            return
+        pyi_path.write_text(stub)
+        logger.info(f"Restored {_relative_to_pwd(pyi_path)}")
 
-    def _write_pyi_file(self, module_path: Path, source: str):
+    def _render_pyi_file(self, module_path: Path, source: str) -> str:
         relpath = str(_relative_to_pwd(module_path)).replace("\\", "/")
         pyi_content = (
             "\n".join(
@@ -1070,9 +1497,22 @@ class PyiGenerator:
             + source
         )
 
-        pyi_path = module_path.with_suffix(".pyi")
-        pyi_path.write_text(pyi_content)
-        logger.info(f"Wrote {relpath}")
+        return pyi_content
+
+    def _write_pending_stubs(self):
+        """Format the stubs generated by the last scan at once, and write them."""
+        stubs = _ruff_fix_and_format(self._pending_stubs)
+        self._pending_stubs = {}
+        for pyi_path, pyi_content in stubs.items():
+            pyi_content = _add_type_ignores(pyi_content)
+            self.written_files.append(str(pyi_path))
+            relpath = _relative_to_pwd(pyi_path).as_posix()
+            # Keep the mtime of unchanged stubs for the tools watching them
+            if pyi_path.exists() and pyi_path.read_text() == pyi_content:
+                logger.debug(f"Unchanged {relpath}")
+                continue
+            pyi_path.write_text(pyi_content)
+            logger.info(f"Wrote {relpath}")
 
     def _get_init_lazy_imports(self, mod: tuple | ModuleType, new_tree: ast.AST):
         # retrieve the _SUBMODULES and _SUBMOD_ATTRS from an init file if present.
@@ -1113,7 +1553,46 @@ class PyiGenerator:
         text += ast.unparse(new_tree) + "\n"
         return text
 
-    def _scan_file(self, module_path: Path) -> str | None:
+    def _render_stub(
+        self,
+        module_path: Path,
+        module: ModuleType | SimpleNamespace,
+        source: str,
+        generator: StubGenerator,
+    ) -> tuple[str, str] | None:
+        is_init_file = _relative_to_pwd(module_path).name == "__init__.py"
+        if not generator.classes and not is_init_file:
+            return
+
+        if is_init_file:
+            new_tree = InitStubGenerator(module, generator.classes).visit(  # pyright: ignore [reportArgumentType]
+                ast.parse(source)
+            )
+            init_imports = self._get_init_lazy_imports(module, new_tree)  # pyright: ignore [reportArgumentType]
+            if not init_imports:
+                return
+            pyi_content = self._render_pyi_file(module_path, init_imports)
+        else:
+            new_tree = generator.visit(ast.parse(source))
+            pyi_content = self._render_pyi_file(module_path, ast.unparse(new_tree))
+        # Written by the main process, see `_write_pending_stubs`
+        return str(module_path.with_suffix(".pyi").resolve()), pyi_content
+
+    def _scan_file_static(
+        self, module_path: Path, module_import: str
+    ) -> tuple[str, str] | None:
+        from reflex_experiment.pyi_static import StaticStubGenerator, load_static_module
+
+        module, class_names = load_static_module(self._resolver, module_import)
+        logger.debug(f"Read {module_path} statically")
+        return self._render_stub(
+            module_path,
+            module,
+            self._resolver.module(module_import).source,
+            StaticStubGenerator(module, class_names, self._resolver),
+        )
+
+    def _scan_file(self, module_path: Path) -> tuple[str, str] | None:
         module_import = (
             _relative_to_pwd(module_path)
             .with_suffix("")
@@ -1121,6 +1600,13 @@ class PyiGenerator:
             .replace("/", ".")
             .replace("\\", ".")
         )
+        if self._resolver is not None:
+            from reflex_experiment.pyi_static import StaticStubError
+
+            try:
+                return self._scan_file_static(module_path, module_import)
+            except StaticStubError as e:
+                logger.info(f"Importing {module_import} to generate its stub: {e}")
         module = importlib.import_module(module_import)
         logger.debug(f"Read {module_path}")
         class_names = {
@@ -1131,42 +1617,72 @@ class PyiGenerator:
             and obj != Component
             and inspect.getmodule(obj) == module
         }
-        is_init_file = _relative_to_pwd(module_path).name == "__init__.py"
-        if not class_names and not is_init_file:
-            return
+        return self._render_stub(
+            module_path,
+            module,
+            inspect.getsource(module),
+            StubGenerator(module, class_names),
+        )
 
-        if is_init_file:
-            new_tree = InitStubGenerator(module, class_names).visit(
-                ast.parse(inspect.getsource(module))
-            )
-            init_imports = self._get_init_lazy_imports(module, new_tree)
-            if not init_imports:
-                return
-            self._write_pyi_file(module_path, init_imports)
-        else:
-            new_tree = StubGenerator(module, class_names).visit(
-                ast.parse(inspect.getsource(module))
-            )
-            self._write_pyi_file(module_path, ast.unparse(new_tree))
-        return str(module_path.with_suffix(".pyi").resolve())
+    def _scan_file_timed(
+        self, module_path: Path
+    ) -> tuple[Path, tuple[str, str] | None, float]:
+        start = time.perf_counter()
+        stub = self._scan_file(module_path)
+        return module_path, stub, time.perf_counter() - start
+
+    def _record_scan(
+        self, module_path: Path, stub: tuple[str, str] | None, seconds: float
+    ):
+        relpath = str(_relative_to_pwd(module_path))
+        self.timings[relpath] = seconds
+        logger.info(f"Scanned {relpath} in {seconds:.2f}s")
+        if stub:
+            pyi_path, pyi_content = stub
+            self._pending_stubs[Path(pyi_path)] = pyi_content
+
+    def _get_shared_modules(self, files: list[Path]) -> list[str]:
+        """Get the project modules imported by the files, to import them once before
+        starting the workers.
+
+        Args:
+            files: The files to scan.
+
+        Returns:
+            The dotted names of the modules, sorted so that packages come first.
+        """
+        paths = {file.resolve() for file in files}
+        dependencies = set(chain.from_iterable(map(self._get_dependencies, paths)))
+        return sorted(
+            {_module_name(file) for file in dependencies - paths},
+            key=lambda module: (module.count("."), module),
+        )
 
     def _scan_files_multiprocess(self, files: list[Path]):
-        with Pool(processes=cpu_count()) as pool:
-            self.written_files.extend(f for f in pool.map(self._scan_file, files) if f)
+        modules = self._get_shared_modules(files)
+        if "fork" in multiprocessing.get_all_start_methods():
+            # The workers inherit the modules imported here
+            _warm_imports(modules)
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing.get_context()
+        # Largest first, so that the last files to complete are the quick ones
+        files = sorted(files, key=lambda file: file.stat().st_size, reverse=True)
+        with context.Pool(
+            processes=min(cpu_count(), len(files)),
+            initializer=_warm_imports,
+            initargs=(modules,),
+        ) as pool:
+            for result in pool.imap_unordered(self._scan_file_timed, files):
+                self._record_scan(*result)
 
     def _scan_files(self, files: list[Path]):
         for file in files:
-            pyi_path = self._scan_file(file)
-            if pyi_path:
-                self.written_files.append(pyi_path)
-
-    def scan_all(self, targets: list, changed_files: list[Path] | None = None):
-        """Scan all targets for class inheriting Component and generate the .pyi files.
+            self._record_scan(*self._scan_file_timed(file))
 
-        Args:
-            targets: the list of file/folders to scan.
-            changed_files (optional): the list of changed files since the last run.
-        """
+    def _get_file_targets(
+        self, targets: list, changed_files: list[Path] | None = None
+    ) -> list[Path]:
         file_targets = []
         for target in targets:
             target_path = Path(target)
@@ -1189,6 +1705,49 @@ class PyiGenerator:
                 ):
                     continue
                 file_targets.append(file_path)
+        return file_targets
+
+    def _load_resolver(self) -> Any:
+        """Get the resolver of the static mode, None if the schema is out of date."""
+        from reflex_experiment.pyi_static import (
+            StaticResolver,
+            StaticStubError,
+            load_schema,
+        )
+
+        try:
+            return StaticResolver(load_schema())
+        except StaticStubError as e:
+            logger.warning(
+                f"Importing the modules to generate their stubs: {e}, rebuild "
+                "it with `scripts/generate_pyi_files.py --build-schema`"
+            )
+            return None
+
+    def scan_all(
+        self,
+        targets: list,
+        changed_files: list[Path] | None = None,
+        use_cache: bool = True,
+        static: bool = False,
+    ):
+        """Scan all targets for class inheriting Component and generate the .pyi files.
+
+        With the cache, the stubs of the modules that didn't change since the
+        previous run, nor any project module they import, are restored from
+        `CACHE_FILE` instead of importing the modules again.
+
+        In static mode, the modules are read from their AST instead of being
+        imported (see pyi_static.py). Those that can't be, or all of them if the
+        schema of the shared base classes is out of date, are still imported.
+
+        Args:
+            targets: the list of file/folders to scan.
+            changed_files (optional): the list of changed files since the last run.
+            use_cache: whether to skip the modules whose stub is cached.
+            static: whether to generate the stubs without importing the modules.
+        """
+        file_targets = self._get_file_targets(targets, changed_files)
 
         # check if pyi changed but not the source
         if changed_files is not None:
@@ -1202,29 +1761,168 @@ class PyiGenerator:
                     continue
                 subprocess.run(["git", "checkout", changed_file])
 
-        if cpu_count() == 1 or len(file_targets) < 5:
+        self._imports = {}
+        self._hashes = {}
+        self._pending_stubs = {}
+        self.timings = {}
+        self._resolver = self._load_resolver() if static else None
+        cache = self._load_cache() if use_cache else {}
+        keys = {}
+        if use_cache:
+            keys = {file: self._get_cache_key(file) for file in file_targets}
+            stale = []
+            for file in file_targets:
+                entry = cache.get(str(_relative_to_pwd(file)))
+                if entry is not None and entry["key"] == keys[file]:
+                    self._restore_pyi_file(file, entry["stub"])
+                else:
+                    stale.append(file)
+            logger.info(f"{len(file_targets) - len(stale)} stubs up to date")
+            file_targets = stale
+
+        # Reading the modules statically is quicker than starting the workers
+        if self._resolver is not None or cpu_count() == 1 or len(file_targets) < 5:
             self._scan_files(file_targets)
         else:
             self._scan_files_multiprocess(file_targets)
+        self._write_pending_stubs()
+
+        if use_cache:
+            written = set(self.written_files)
+            for file in file_targets:
+                pyi_path = file.with_suffix(".pyi")
+                cache[str(_relative_to_pwd(file))] = {
+                    "key": keys[file],
+                    "stub": pyi_path.read_text()
+                    if str(pyi_path.resolve()) in written
+                    else None,
+                }
+            self._save_cache(cache)
+
+    def _reload_modules(self, files: set[Path]) -> set[Path]:
+        """Reload the imported modules of files, after their dependencies.
+
+        Args:
+            files: The resolved paths of the files.
 
-        # Fix generated pyi files with ruff.
-        if self.written_files:
-            subprocess.run(["ruff", "format", *self.written_files])
-            subprocess.run(["ruff", "check", "--fix", *self.written_files])
-
-        # For some reason, we need to format the __init__.pyi files again after fixing...
-        init_files = [f for f in self.written_files if "/__init__.pyi" in f]
-        subprocess.run(["ruff", "format", *init_files])
-
-        # Post-process the generated pyi files to add hacky type: ignore comments
-        for file_path in self.written_files:
-            with FileInput(file_path, inplace=True) as f:
-                for line in f:
-                    # Hack due to ast not supporting comments in the tree.
-                    if (
-                        "def create(" in line
-                        or "Var[Figure]" in line
-                        or "Var[Template]" in line
-                    ):
-                        line = line.rstrip() + "  # type: ignore\n"
-                    print(line, end="")  # noqa: T201
+        Returns:
+            The files whose module, or one of its dependencies, failed to reload.
+        """
+        graph = {file: self._imports[file] & files for file in files}
+        try:
+            order = list(TopologicalSorter(graph).static_order())
+        except CycleError:
+            order = sorted(files)
+        failed: set[Path] = set()
+        for file in order:
+            module = sys.modules.get(_module_name(file))
+            if module is None:
+                continue  # imported by the next scan if needed
+            if self._get_dependencies(file) & failed:
+                failed.add(file)
+                continue
+            try:
+                importlib.reload(module)
+            except Exception as e:
+                logger.error(f"Could not reload {module.__name__}: {e!r}")
+                failed.add(file)
+        return failed
+
+    def _regenerate(self, targets: list, changed: set[Path], static: bool):
+        """Regenerate the stubs of the targets affected by changed files.
+
+        Args:
+            targets: The files and directories to generate the stubs of.
+            changed: The resolved paths of the changed files, removed ones included.
+            static: Whether to generate the stubs without importing the modules.
+        """
+        start = time.perf_counter()
+        removed = {file for file in changed if not file.exists()}
+        for file in changed - removed:
+            try:
+                ast.parse(file.read_text())
+            except SyntaxError as e:
+                # Picked up again with the next change
+                logger.error(
+                    f"Waiting for {_relative_to_pwd(file)} to be fixed: {e.msg} "
+                    f"(line {e.lineno})"
+                )
+                return
+        self._imports = {
+            file: imported
+            for file, imported in self._imports.items()
+            if file not in changed and not imported & removed
+        }
+        for file in changed:
+            self._hashes.pop(file, None)
+            if file in GENERATOR_FILES:
+                logger.warning(f"Restart the watch to use the changes to {file.name}")
+        for file in removed:
+            pyi_path = file.with_suffix(".pyi")
+            if pyi_path.exists():
+                pyi_path.unlink()
+                logger.info(f"Removed {_relative_to_pwd(pyi_path)}")
+
+        files = {file.resolve() for file in self._get_file_targets(targets)}
+        known = files | set(chain.from_iterable(map(self._get_dependencies, files)))
+        affected = {
+            file
+            for file in known
+            if file in changed or self._get_dependencies(file) & changed
+        }
+        if static and (
+            self._resolver is None
+            or any(
+                _relative_to_pwd(file).as_posix() in self._resolver.schema["sources"]
+                for file in changed
+            )
+        ):
+            self._resolver = self._load_resolver()
+        if self._resolver is not None:
+            self._resolver.forget({_module_name(file) for file in affected})
+        failed = self._reload_modules(affected)
+
+        scanned = sorted((affected & files) - failed)
+        for file in scanned:
+            try:
+                self._record_scan(*self._scan_file_timed(file))
+            except Exception as e:
+                logger.error(
+                    f"Could not generate the stub of {_relative_to_pwd(file)}: {e!r}"
+                )
+        self._write_pending_stubs()
+        seconds = time.perf_counter() - start
+        logger.info(f"Regenerated {len(scanned)} stubs in {seconds * 1000:.0f}ms")
+
+    def watch(self, targets: list, static: bool = False, interval: float = 0.2):
+        """Generate the stubs of the targets, then regenerate them as the project
+        files change, until interrupted.
+
+        The modules stay imported (or read, in static mode) between changes: a
+        changed file reloads its module and the project modules depending on
+        it, and only the stubs of the targets among them are regenerated.
+
+        Args:
+            targets: the list of file/folders to scan.
+            static: whether to generate the stubs without importing the modules.
+            interval: the seconds between two polls, without watchfiles.
+        """
+        self.scan_all(targets, static=static)
+        files = {file.resolve() for file in self._get_file_targets(targets)}
+        dependencies = set(chain.from_iterable(map(self._get_dependencies, files)))
+        if self._resolver is None:
+            # Imported in the workers of the scan, or restored from the cache
+            modules = sorted(map(_module_name, files))
+            _warm_imports([*self._get_shared_modules(list(files)), *modules])
+        # The top level packages of the project files involved
+        roots = sorted(
+            {
+                PWD / _relative_to_pwd(file).parts[0]
+                for file in files | dependencies
+                if len(_relative_to_pwd(file).parts) > 1
+            }
+        )
+        logger.info(f"Watching {', '.join(map(str, map(_relative_to_pwd, roots)))}")
+        for changed in _watch_changes(roots, interval):
+            if changed:
+                self._regenerate(targets, changed, static)
@@ -0,0 +1,840 @@
+"""Generation of the stubs of component modules without importing them.
+
+With `PyiGenerator.scan_all(static=True)`, the component classes of a module are
+read from its AST. Their bases defined in `SCHEMA_MODULES` (`ComponentBase`,
+`HTMLProps`, the `HTML*Props` and their `DOMEvents[...]` triggers) are looked up
+in `SCHEMA_FILE`, which is built once by importing those modules (see
+`write_schema`). The other names of the project are resolved from the AST of
+their module, only third party modules (reflex, typing) are imported.
+
+The stub of a module that can't be read statically, like a component with its
+own `create` method, raises a `StaticStubError` and is generated by importing
+the module instead.
+"""
+
+import ast
+import importlib
+import inspect
+import json
+import typing
+from dataclasses import dataclass
+from functools import cache
+from importlib.metadata import version
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Annotated, Any, get_args, get_origin
+
+from reflex.components.component import Component
+from reflex.event import EventHandler, no_args_event_spec
+from reflex.vars.base import Var
+
+from reflex_experiment.pyi_generator import (
+    DEFAULT_IMPORTS,
+    DEFAULT_TYPING_IMPORTS,
+    EXCLUDED_PROPS,
+    PyiGenerator,
+    StubGenerator,
+    _build_create_functiondef,
+    _extract_func_kwargs_as_ast_nodes,
+    _format_docstring,
+    _get_class_props,
+    _get_event_trigger_hint,
+    _get_props_comments,
+    _get_type_hint,
+    _hash_text,
+    _module_file,
+    _module_name,
+    _relative_to_pwd,
+    logger,
+    type_to_ast,
+)
+
+SCHEMA_FILE = Path(__file__).with_name("pyi_schema.json")
+SCHEMA_VERSION = 1
+
+# Modules whose component classes are stored in the schema
+SCHEMA_MODULES = ["reflex_experiment.components.base", "reflex_experiment.attributes"]
+
+COMPONENT_KEY = f"{Component.__module__}.{Component.__qualname__}"
+COMPONENT_BASE_KEY = "reflex_experiment.components.base.ComponentBase"
+DOM_EVENTS_KEY = "reflex_experiment.events.DOMEvents"
+
+
+class StaticStubError(Exception):
+    """The stub of a module can't be generated without importing it."""
+
+
+def _dom_trigger_hint(event: str, element: str) -> str:
+    return f"EventType[()] | EventType[{event}[{element}]]"
+
+
+def _dom_events_element(clz: type) -> type | None:
+    """The element of a `DOMEvents[element]` mixin, None for the other classes."""
+    if clz.__qualname__ != "DOMEvents.__class_getitem__.<locals>.DOMEventsMixin":
+        return None
+    triggers = clz.__dict__["_get_event_triggers"]
+    return inspect.getclosurevars(triggers).nonlocals["t_element"]
+
+
+def _class_key(clz: type) -> str:
+    element = _dom_events_element(clz)
+    if element is not None:
+        return f"{DOM_EVENTS_KEY}[{element.__name__}]"
+    return f"{clz.__module__}.{clz.__qualname__}"
+
+
+def _default_type_hint_globals() -> dict[str, Any]:
+    """The names imported by all the stubs, to render the type hints with."""
+    type_hint_globals = {name: getattr(typing, name) for name in DEFAULT_TYPING_IMPORTS}
+    for module, names in DEFAULT_IMPORTS.items():
+        if _module_file(module) is None:
+            imported = importlib.import_module(module)
+            type_hint_globals.update((name, getattr(imported, name)) for name in names)
+    return type_hint_globals
+
+
+def _class_entry(clz: type[Component]) -> dict[str, Any]:
+    """Describe a component class the way the schema stores it.
+
+    Args:
+        clz: The component class.
+
+    Returns:
+        The keys of its MRO, the props and event triggers it declares, the
+        comments documenting them and its create method if it defines one.
+    """
+    type_hint_globals = _default_type_hint_globals()
+    entry: dict[str, Any] = {
+        "mro": [_class_key(c) for c in clz.__mro__ if issubclass(c, Component)],
+        "props": [] if clz is Component else _get_class_props(clz, type_hint_globals),
+        "comments": _get_props_comments(inspect.getsource(clz)),
+        "triggers": {},
+    }
+    if clz is not Component:
+        triggers = clz._create([]).get_event_triggers()
+        entry["triggers"] = {
+            name: _get_event_trigger_hint(triggers[name], clz)
+            for name in clz.__annotations__
+            if name in triggers
+            and name in clz.__fields__
+            and clz.__fields__[name].type_ is EventHandler
+        }
+    element = _dom_events_element(clz)
+    if element is not None:
+        entry["element"] = element.__name__
+    if "create" in clz.__dict__:
+        kwonly = []
+        for arg, default in _extract_func_kwargs_as_ast_nodes(
+            clz.create, type_hint_globals
+        ):
+            kwarg: dict[str, Any] = {
+                "name": arg.arg,
+                "hint": ast.unparse(arg.annotation) if arg.annotation else None,
+            }
+            if default is not None:
+                kwarg["default"] = default.value
+            kwonly.append(kwarg)
+        entry["create"] = {"kwonly": kwonly, "doc": clz.create.__doc__}
+    return entry
+
+
+def _schema_sources() -> dict[str, str]:
+    """The hash of the files the schema is built from, to tell when it is stale."""
+    generator = PyiGenerator()
+    generator._imports = {}
+    files = {Path(inspect.getfile(PyiGenerator)).resolve()}
+    for module in SCHEMA_MODULES:
+        path = _module_file(module)
+        if path is None:
+            raise StaticStubError(f"Cannot find the schema module {module}")
+        files |= {path, *generator._get_dependencies(path)}
+    return {
+        str(_relative_to_pwd(file).as_posix()): _hash_text(file.read_text())
+        for file in sorted(files)
+    }
+
+
+def build_schema() -> dict[str, Any]:
+    """Import the `SCHEMA_MODULES` and describe their component classes.
+
+    Returns:
+        The schema, see `write_schema`.
+
+    Raises:
+        RuntimeError: If the event triggers of a class can't be resolved from it.
+    """
+    from reflex_experiment.events import DOM_EVENT_TRIGGERS, ELEMENT_EVENT_TRIGGERS
+
+    classes: dict[str, type[Component]] = {}
+    for name in SCHEMA_MODULES:
+        module = importlib.import_module(name)
+        for obj in vars(module).values():
+            if (
+                inspect.isclass(obj)
+                and issubclass(obj, Component)
+                and obj.__module__ == name
+            ):
+                for clz in obj.__mro__:
+                    if issubclass(clz, Component):
+                        classes.setdefault(_class_key(clz), clz)
+    schema = {
+        "version": SCHEMA_VERSION,
+        "reflex": version("reflex"),
+        "sources": _schema_sources(),
+        "dom_event_triggers": {
+            trigger: event.__name__ for trigger, event in DOM_EVENT_TRIGGERS.items()
+        },
+        "element_event_triggers": {
+            element.__name__: {
+                trigger: event.__name__ for trigger, event in triggers.items()
+            }
+            for element, triggers in ELEMENT_EVENT_TRIGGERS.items()
+        },
+        "classes": {},
+    }
+    for key, clz in sorted(classes.items()):
+        try:
+            schema["classes"][key] = _class_entry(clz)
+        except Exception as e:
+            # Read statically like the other classes of the project
+            logger.warning(f"Leaving {key} out of the schema: {e!r}")
+    resolver = StaticResolver(schema)
+    for key, clz in classes.items():
+        if clz is Component or key not in schema["classes"]:
+            continue
+        triggers = clz._create([]).get_event_triggers()
+        expected = {
+            name: _get_event_trigger_hint(specs, clz)
+            for name, specs in triggers.items()
+        }
+        if resolver.event_triggers(key) != expected:
+            raise RuntimeError(f"The event triggers of {key} can't be resolved")
+    return schema
+
+
+def write_schema() -> Path:
+    """Build the schema of the shared component classes and write it to `SCHEMA_FILE`.
+
+    To run again when the `SCHEMA_MODULES`, the modules they import or the
+    generator change.
+
+    Returns:
+        The path of the schema.
+    """
+    SCHEMA_FILE.write_text(json.dumps(build_schema(), indent=1) + "\n")
+    return SCHEMA_FILE
+
+
+def load_schema() -> dict[str, Any]:
+    """Load `SCHEMA_FILE`, checking that it is up to date.
+
+    Returns:
+        The schema.
+
+    Raises:
+        StaticStubError: If the schema is missing or stale.
+    """
+    if not SCHEMA_FILE.exists():
+        raise StaticStubError(f"{SCHEMA_FILE.name} is missing")
+    schema = json.loads(SCHEMA_FILE.read_text())
+    if (
+        schema.get("version") != SCHEMA_VERSION
+        or schema.get("reflex") != version("reflex")
+        or schema.get("sources") != _schema_sources()
+    ):
+        raise StaticStubError(f"{SCHEMA_FILE.name} is out of date")
+    return schema
+
+
+class _Placeholder(type):
+    """A class of the project, standing for it in the annotations evaluated statically.
+
+    Subscripting it gives another placeholder named after the arguments, like
+    `FocusEvent[HTMLElement]`.
+    """
+
+    def __getitem__(cls, args: Any) -> "_Placeholder":
+        if not isinstance(args, tuple):
+            args = (args,)
+        names = ", ".join(
+            _alias_names.get(id(arg)) or ast.unparse(type_to_ast(arg, cls))
+            for arg in args
+        )
+        return _placeholder(cls.__module__, f"{cls.__name__}[{names}]")
+
+
+# Names of the type aliases of the project, by id of their value
+_alias_names: dict[int, str] = {}
+
+
+@cache
+def _placeholder(module: str, name: str) -> _Placeholder:
+    return _Placeholder(name, (), {"__module__": module, "__qualname__": name})
+
+
+def _key(placeholder: _Placeholder) -> str:
+    return f"{placeholder.__module__}.{placeholder.__qualname__}"
+
+
+class _TypedEventHandler:
+    """Stands for `helpers.TypedEventHandler`, whose specs only depend on Reflex."""
+
+    def __class_getitem__(cls, t_args: Any):
+        if not isinstance(t_args, tuple):
+            t_args = (t_args,)
+        return_type = tuple[*(Var[t] for t in t_args)]  # type: ignore
+
+        def handler(*args) -> return_type:  # type: ignore
+            return args
+
+        return handler
+
+
+# Names of the project evaluated to a stand-in rather than to a placeholder
+STATIC_NAMES = {"reflex_experiment.helpers.TypedEventHandler": _TypedEventHandler}
+
+
+class _Namespace(dict):
+    """The names of a module, resolved from its AST when first looked up."""
+
+    def __init__(self, module: "StaticModule"):
+        super().__init__()
+        self.module = module
+        self.resolving: set[str] = set()
+
+    def __missing__(self, name: str) -> Any:
+        node = self.module.bindings.get(name)
+        if node is None or name in self.resolving:
+            raise KeyError(name)
+        self.resolving.add(name)
+        try:
+            value = self[name] = self.module.evaluate(name, node)
+        finally:
+            self.resolving.discard(name)
+        return value
+
+
+class StaticModule:
+    """A module of the project, read from its AST."""
+
+    def __init__(self, resolver: "StaticResolver", name: str, path: Path):
+        self.resolver = resolver
+        self.name = name
+        self.path = path
+        self.source = path.read_text()
+        self.tree = ast.parse(self.source)
+        # Top level statement binding each name, the last one wins
+        self.bindings: dict[str, ast.stmt | tuple[ast.stmt, ast.alias]] = {}
+        for node in self.tree.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    bound = alias.asname or alias.name.split(".")[0]
+                    self.bindings[bound] = (node, alias)
+            elif isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+                self.bindings[node.name] = node
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        self.bindings[target.id] = node
+            elif (
+                isinstance(node, ast.AnnAssign)
+                and isinstance(node.target, ast.Name)
+                and node.value is not None
+            ):
+                self.bindings[node.target.id] = node
+        self.namespace = _Namespace(self)
+        self._type_hint_globals: dict[str, Any] | None = None
+
+    def _import_from(self, node: ast.ImportFrom, alias: ast.alias) -> Any:
+        if node.level:
+            package = _module_name(self.path).split(".")
+            if self.path.name != "__init__.py":
+                package = package[:-1]
+            package = package[: len(package) - node.level + 1]
+            module = ".".join([*package, *([node.module] if node.module else [])])
+        else:
+            module = node.module or ""
+        full_name = f"{module}.{alias.name}"
+        if full_name in STATIC_NAMES:
+            return STATIC_NAMES[full_name]
+        if _module_file(module) is None:
+            return getattr(importlib.import_module(module), alias.name)
+        if _module_file(full_name) is not None:
+            raise StaticStubError(f"Cannot import the module {full_name} statically")
+        try:
+            return self.resolver.module(module).namespace[alias.name]
+        except KeyError:
+            raise StaticStubError(f"Cannot resolve {full_name}") from None
+
+    def _stub_function(self, node: ast.FunctionDef) -> Any:
+        # Only the signature of the event specs matters to the stubs
+        stub = ast.FunctionDef(
+            name=node.name,
+            args=node.args,
+            body=[ast.Expr(value=ast.Constant(value=Ellipsis))],
+            decorator_list=[],
+            returns=node.returns,
+            type_params=[],
+        )
+        module = ast.fix_missing_locations(ast.Module(body=[stub], type_ignores=[]))
+        used = {
+            name.id
+            for part in (node.args, node.returns)
+            if part is not None
+            for name in ast.walk(part)
+            if isinstance(name, ast.Name)
+        }
+        function_globals = {
+            name: self.namespace[name] for name in used if name in self.bindings
+        }
+        exec(compile(module, str(self.path), "exec"), function_globals)
+        return function_globals[node.name]
+
+    def evaluate(self, name: str, node: ast.stmt | tuple[ast.stmt, ast.alias]) -> Any:
+        """Resolve a name bound at the top level of the module.
+
+        Args:
+            name: The name.
+            node: The statement binding it, with the alias for imports.
+
+        Returns:
+            The imported third party objects and the evaluated aliases as is, a
+            placeholder for the classes of the project.
+
+        Raises:
+            StaticStubError: If the name can't be resolved statically.
+        """
+        if isinstance(node, tuple):
+            statement, alias = node
+            if isinstance(statement, ast.ImportFrom):
+                return self._import_from(statement, alias)
+            if _module_file(alias.name) is not None:
+                raise StaticStubError(
+                    f"Cannot import the module {alias.name} statically"
+                )
+            return importlib.import_module(alias.name if alias.asname else name)
+        if isinstance(node, ast.ClassDef):
+            return _placeholder(self.name, name)
+        if isinstance(node, ast.FunctionDef):
+            try:
+                return self._stub_function(node)
+            except StaticStubError:
+                raise
+            except Exception as e:
+                raise StaticStubError(
+                    f"Cannot evaluate {self.name}.{name}: {e!r}"
+                ) from e
+        value = self.eval(node.value, name)  # pyright: ignore [reportAttributeAccessIssue]
+        if get_origin(value) is not None:
+            # Kept alive by the namespace
+            _alias_names.setdefault(id(value), name)
+        return value
+
+    def eval(self, expression: ast.expr, what: str) -> Any:
+        """Evaluate an expression of the module with its top level names.
+
+        Args:
+            expression: The expression node.
+            what: What the expression is, for the error message.
+
+        Returns:
+            The value of the expression.
+
+        Raises:
+            StaticStubError: If the expression can't be evaluated statically.
+        """
+        code = compile(ast.Expression(body=expression), str(self.path), "eval")
+        try:
+            return eval(code, {}, self.namespace)
+        except StaticStubError:
+            raise
+        except Exception as e:
+            raise StaticStubError(f"Cannot evaluate {self.name}.{what}: {e!r}") from e
+
+    def type_hint_globals(self) -> dict[str, Any]:
+        """The globals to render the type hints of the module with."""
+        if self._type_hint_globals is not None:
+            return self._type_hint_globals
+        type_hint_globals = _default_type_hint_globals()
+        for name in self.bindings:
+            try:
+                type_hint_globals[name] = self.namespace[name]
+            except (StaticStubError, KeyError):
+                continue  # not used by the type hints
+        self._type_hint_globals = type_hint_globals
+        return type_hint_globals
+
+
+@dataclass
+class StaticClass:
+    """A class of a module read statically."""
+
+    name: str
+    key: str
+    is_component: bool
+    # Value of `__call__ = ...` in a namespace class
+    call: ast.expr | None = None
+
+
+class StaticResolver:
+    """Resolves the component classes of the project, from the schema or their AST."""
+
+    def __init__(self, schema: dict[str, Any]):
+        self.schema = schema
+        self.entries: dict[str, dict[str, Any]] = dict(schema["classes"])
+        self.modules: dict[str, StaticModule] = {}
+
+    def module(self, name: str) -> StaticModule:
+        module = self.modules.get(name)
+        if module is None:
+            path = _module_file(name)
+            if path is None:
+                raise StaticStubError(f"Cannot find the module {name}")
+            module = self.modules[name] = StaticModule(self, name, path)
+        return module
+
+    def forget(self, module_names: set[str]):
+        """Drop what was read from modules, to read them again after they changed.
+
+        Args:
+            module_names: The dotted names of the modules.
+        """
+        for name in module_names:
+            module = self.modules.pop(name, None)
+            if module is None:
+                continue
+            for value_name, value in module.namespace.items():
+                if not isinstance(module.bindings.get(value_name), tuple):
+                    _alias_names.pop(id(value), None)
+        self.entries = {
+            key: entry
+            for key, entry in self.entries.items()
+            if key.rpartition(".")[0] not in module_names
+            or key in self.schema["classes"]
+        }
+
+    def base_key(self, base: Any) -> str | None:
+        """The key of a component base class, None if it isn't a component.
+
+        Args:
+            base: The evaluated base, a placeholder for the classes of the project.
+
+        Returns:
+            The key of its entry.
+        """
+        if isinstance(base, _Placeholder):
+            key = _key(base)
+            return key if self.entry(key) is not None else None
+        if inspect.isclass(base) and issubclass(base, Component):
+            key = _class_key(base)
+            if key not in self.entries:
+                for clz in base.__mro__:
+                    if issubclass(clz, Component):
+                        self.entries.setdefault(_class_key(clz), _class_entry(clz))
+            return key
+        return None
+
+    def entry(self, key: str) -> dict[str, Any] | None:
+        """The entry of a component class of the project, see `_class_entry`.
+
+        Args:
+            key: The key of the class.
+
+        Returns:
+            The entry, None if the class isn't a component.
+        """
+        if key in self.entries:
+            return self.entries[key]
+        if key.startswith(f"{DOM_EVENTS_KEY}["):
+            element = key.removeprefix(f"{DOM_EVENTS_KEY}[").removesuffix("]")
+            base = self.entries[COMPONENT_BASE_KEY]
+            entry = {
+                "mro": [key, *base["mro"]],
+                "props": [],
+                "comments": [],
+                "triggers": {},
+                "element": element,
+            }
+        else:
+            module_name, _, name = key.rpartition(".")
+            node = self.module(module_name).bindings.get(name)
+            if not isinstance(node, ast.ClassDef):
+                raise StaticStubError(f"Cannot resolve the class {key}")
+            entry = self._read_class(self.module(module_name), node)
+        self.entries[key] = entry
+        return entry
+
+    def _read_class(
+        self, module: StaticModule, node: ast.ClassDef
+    ) -> dict[str, Any] | None:
+        key = f"{module.name}.{node.name}"
+        bases = []
+        for base in node.bases:
+            base_key = self.base_key(module.eval(base, f"{node.name} base"))
+            if base_key is not None:
+                bases.append(base_key)
+        if not bases:
+            return None
+        if any(
+            isinstance(child, ast.FunctionDef) and child.name == "create"
+            for child in node.body
+        ):
+            raise StaticStubError(f"{key} defines its own create method")
+        mro = [
+            key,
+            *_c3_merge([*(self.entries[base]["mro"] for base in bases), bases]),
+        ]
+        annotations = [
+            (
+                child.target.id,
+                module.eval(child.annotation, f"{node.name}.{child.target.id}"),
+            )
+            for child in node.body
+            if isinstance(child, ast.AnnAssign) and isinstance(child.target, ast.Name)
+        ]
+        # Stands for the class in the type hints of its triggers
+        clz = _placeholder(module.name, node.name)
+        entry = {
+            "mro": mro,
+            "props": [],
+            "comments": _get_props_comments(
+                ast.get_source_segment(module.source, node) or ""
+            ),
+            "triggers": {
+                name: _get_event_trigger_hint(spec, clz)
+                for name, annotation in annotations
+                if (spec := _event_spec(annotation)) is not None
+            },
+        }
+        self.entries[key] = entry
+        triggers = self.event_triggers(key)
+        type_hint_globals = module.type_hint_globals()
+        try:
+            entry["props"] = [
+                (name, _get_type_hint(annotation, type_hint_globals))
+                for name, annotation in annotations
+                if not (
+                    name in EXCLUDED_PROPS
+                    or name in triggers
+                    or (isinstance(annotation, str) and "ClassVar" in annotation)
+                )
+            ]
+        except Exception:
+            del self.entries[key]
+            raise
+        return entry
+
+    def event_triggers(self, key: str) -> dict[str, str]:
+        """Resolve the event triggers of a component class, like `get_event_triggers`.
+
+        Args:
+            key: The key of the class.
+
+        Returns:
+            The type hint of each trigger.
+        """
+        entries = [self.entries[k] for k in self.entries[key]["mro"]]
+        triggers = {}
+        # The DOM triggers of the last `DOMEvents` mixin take precedence
+        for entry in entries:
+            element = entry.get("element")
+            if element is not None:
+                events = {
+                    **self.schema["dom_event_triggers"],
+                    **self.schema["element_event_triggers"].get(element, {}),
+                }
+                triggers.update(
+                    (trigger, _dom_trigger_hint(event, element))
+                    for trigger, event in events.items()
+                )
+        # Then the fields, the class overriding its parents
+        for entry in reversed(entries):
+            triggers.update(entry["triggers"])
+        return triggers
+
+    def create_functiondef(
+        self, key: str, node: ast.FunctionDef | None = None
+    ) -> ast.FunctionDef:
+        """Generate the create method of a component class, see
+        `_generate_component_create_functiondef`.
+
+        Args:
+            key: The key of the class.
+            node: The existing create functiondef node from the ast
+
+        Returns:
+            The create functiondef node for the ast.
+        """
+        entries = [self.entries[k] for k in self.entries[key]["mro"]]
+        create = next(entry["create"] for entry in entries if "create" in entry)
+        kwargs = [
+            (
+                ast.arg(
+                    arg=kwarg["name"],
+                    annotation=ast.Name(id=kwarg["hint"]) if kwarg["hint"] else None,
+                ),
+                ast.Constant(value=kwarg["default"]) if "default" in kwarg else None,
+            )
+            for kwarg in create["kwonly"]
+        ]
+        kwonly = [kwarg["name"] for kwarg in create["kwonly"]]
+        all_props = []
+        for entry in entries:
+            for name, type_hint in entry["props"]:
+                if name in kwonly or name in all_props:
+                    continue
+                all_props.append(name)
+                kwargs.append(
+                    (
+                        ast.arg(arg=name, annotation=ast.Name(id=type_hint)),
+                        ast.Constant(value=None),
+                    )
+                )
+        event_triggers = self.event_triggers(key)
+        docstring = _format_docstring(
+            create["doc"],
+            [entry["comments"] for entry in entries],
+            [*all_props, *event_triggers],
+        )
+        return _build_create_functiondef(
+            node, kwargs, event_triggers, docstring, key.rpartition(".")[2]
+        )
+
+
+def _c3_merge(sequences: list[list[str]]) -> list[str]:
+    """Merge the linearizations of the bases of a class, like Python's MRO."""
+    sequences = [list(sequence) for sequence in sequences if sequence]
+    result = []
+    while sequences:
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            raise StaticStubError("Cannot create a consistent method resolution order")
+        result.append(head)
+        sequences = [[key for key in sequence if key != head] for sequence in sequences]
+        sequences = [sequence for sequence in sequences if sequence]
+    return result
+
+
+def _event_spec(annotation: Any) -> Any:
+    """The event spec of an event trigger annotation, None for the other props."""
+    if annotation is EventHandler:
+        return no_args_event_spec
+    if get_origin(annotation) is Annotated and get_args(annotation)[0] is EventHandler:
+        return annotation.__metadata__[0]
+    if inspect.isfunction(annotation):
+        # `TypedEventHandler[...]`
+        return annotation
+    return None
+
+
+def load_static_module(
+    resolver: StaticResolver, module_name: str
+) -> tuple[SimpleNamespace, dict[str, StaticClass]]:
+    """Read a module of the project statically.
+
+    Args:
+        resolver: The resolver of the component classes.
+        module_name: The dotted name of the module.
+
+    Returns:
+        The module, with the names used by the stub generator, and its
+        component and namespace classes.
+    """
+    module = resolver.module(module_name)
+    classes = {}
+    for node in module.tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        key = f"{module_name}.{node.name}"
+        if resolver.entry(key) is not None:
+            classes[node.name] = StaticClass(node.name, key, is_component=True)
+            continue
+        is_namespace = any(
+            inspect.isclass(value := module.eval(base, f"{node.name} base"))
+            and issubclass(value, SimpleNamespace)
+            for base in node.bases
+        )
+        if is_namespace:
+            call = next(
+                (
+                    child.value
+                    for child in node.body
+                    if isinstance(child, ast.Assign)
+                    and any(
+                        isinstance(target, ast.Name) and target.id == "__call__"
+                        for target in child.targets
+                    )
+                ),
+                None,
+            )
+            classes[node.name] = StaticClass(
+                node.name, key, is_component=False, call=call
+            )
+    attributes = {**module.type_hint_globals()}
+    for name in ("_SUBMODULES", "_SUBMOD_ATTRS", "_PYRIGHT_IGNORE_IMPORTS"):
+        node = module.bindings.get(name)
+        if isinstance(node, ast.Assign):
+            attributes[name] = ast.literal_eval(node.value)
+    return SimpleNamespace(**attributes), classes
+
+
+class StaticStubGenerator(StubGenerator):
+    """A stub generator for the modules read statically, see `load_static_module`."""
+
+    def __init__(
+        self,
+        module: SimpleNamespace,
+        classes: dict[str, StaticClass],
+        resolver: StaticResolver,
+    ):
+        super().__init__(module, classes)  # pyright: ignore [reportArgumentType]
+        self.resolver = resolver
+
+    def _update_type_hint_globals(self):
+        # Resolved by the static module
+        pass
+
+    def _current_class_is_component(self) -> bool:
+        return (
+            self.current_class is not None
+            and self.current_class in self.classes
+            and self.classes[self.current_class].is_component  # pyright: ignore [reportAttributeAccessIssue]
+        )
+
+    def _generate_create_functiondef(
+        self, node: ast.FunctionDef | None
+    ) -> ast.FunctionDef:
+        clz = self.classes[self.current_class]  # pyright: ignore [reportArgumentType]
+        if node is not None or not clz.is_component:  # pyright: ignore [reportAttributeAccessIssue]
+            raise StaticStubError(f"Cannot read {clz.key}.create statically")  # pyright: ignore [reportAttributeAccessIssue]
+        return self.resolver.create_functiondef(clz.key)  # pyright: ignore [reportAttributeAccessIssue]
+
+    def _generate_call_functiondef(self, node: ast.ClassDef) -> ast.FunctionDef | None:
+        clz = self.classes[self.current_class]  # pyright: ignore [reportArgumentType]
+        call = clz.call  # pyright: ignore [reportAttributeAccessIssue]
+        # `__call__ = staticmethod(Component.create)`
+        if not (
+            isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Name)
+            and call.func.id == "staticmethod"
+            and len(call.args) == 1
+            and isinstance(call.args[0], ast.Attribute)
+            and call.args[0].attr == "create"
+        ):
+            raise StaticStubError(f"Cannot read {clz.key}.__call__ statically")  # pyright: ignore [reportAttributeAccessIssue]
+        module = self.resolver.module(clz.key.rpartition(".")[0])  # pyright: ignore [reportAttributeAccessIssue]
+        component = module.eval(call.args[0].value, f"{clz.name}.__call__")  # pyright: ignore [reportAttributeAccessIssue]
+        key = self.resolver.base_key(component)
+        if key is None:
+            return None
+        definition = self.resolver.create_functiondef(key)
+        definition.name = "__call__"
+
+        # Turn the definition into a staticmethod
+        del definition.args.args[0]  # remove `cls` arg
+        definition.decorator_list = [ast.Name(id="staticmethod")]
+
+        return definition
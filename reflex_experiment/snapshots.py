@@ -0,0 +1,180 @@
+"""Delta-encoded element snapshots (see `.web/custom/snapshots.ts`).
+
+Continuous interactions (drag, scroll, pointer moves) fire many events on the
+same element, whose 40+ fields rarely change in between. With snapshots enabled,
+the client sends an element in full once, tagged with a snapshot id, and then
+only the fields that changed along with that id and the version of the snapshot
+they apply to (the number of deltas sent before). The backend keeps the latest
+version of each snapshot of a client in a bounded LRU table to rebuild the full
+element.
+
+Only the handlers decoding their payload into an event model receive snapshots,
+and never those whose events Reflex may drop after extracting them (throttled,
+debounced or temporal), see `bind_event_trigger`. The `SnapshotMiddleware`
+replaces the snapshots of a payload by the full elements before it's decoded,
+the element models don't know about them. The client can still refer to a
+snapshot the backend doesn't have (after a restart, on another worker, or once
+evicted), or to another version of it (after the client sent it in full again):
+the middleware then has the client send the event again with its elements in
+full, instead of failing it.
+"""
+
+import json
+import logging
+from collections import OrderedDict
+from typing import Any
+
+import reflex as rx
+from reflex.event import Event, fix_events
+from reflex.middleware import Middleware
+from reflex.state import BaseState, StateUpdate
+
+logger = logging.getLogger("snapshots")
+
+# Keys of the full and delta encodings of an element
+SNAPSHOT_KEY = "__snapshot__"
+DELTA_KEY = "__delta__"
+VERSION_KEY = "__version__"
+
+DEFAULT_MAX_SNAPSHOTS = 256
+DEFAULT_MAX_CLIENTS = 1024
+
+_element_snapshots = False
+_max_snapshots = DEFAULT_MAX_SNAPSHOTS
+_max_clients = DEFAULT_MAX_CLIENTS
+# Version and fields of the snapshots of each client token, both tables in LRU
+# order
+Snapshot = tuple[int, dict[str, Any]]
+_snapshots: OrderedDict[str, OrderedDict[str, Snapshot]] = OrderedDict()
+
+
+def set_element_snapshots(
+    enabled: bool = True,
+    max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+    max_clients: int = DEFAULT_MAX_CLIENTS,
+    *,
+    app: rx.App | None = None,
+):
+    """Send the elements of DOM events as deltas of their previous extraction.
+
+    Applies to the triggers bound after the call, so enable it before adding
+    the pages of `app`, which gets the middleware resolving the snapshots of
+    each client (call it once per app):
+
+        app = rx.App()
+        set_element_snapshots(app=app)
+
+    Only used by the object encoding of the payloads (not compact). The backend
+    keeps the `max_snapshots` most recently used snapshots of the
+    `max_clients` most recently active clients.
+    """
+    if enabled:
+        if app is None:
+            raise ValueError(
+                "Element snapshots are resolved by the SnapshotMiddleware, pass "
+                "the app to set_element_snapshots to add it"
+            )
+        app.add_middleware(SnapshotMiddleware())
+    global _element_snapshots, _max_snapshots, _max_clients
+    _element_snapshots = enabled
+    _max_snapshots = max_snapshots
+    _max_clients = max_clients
+    while len(_snapshots) > _max_clients:
+        _snapshots.popitem(last=False)
+    for snapshots in _snapshots.values():
+        while len(snapshots) > _max_snapshots:
+            snapshots.popitem(last=False)
+
+
+def element_snapshots() -> bool:
+    return _element_snapshots
+
+
+def _resolve(
+    value: Any, snapshots: dict[str, Snapshot], resolved: dict[str, Snapshot]
+) -> Any:
+    """`value` with its snapshots and deltas replaced by the full fields.
+
+    `resolved` collects the snapshots sent or updated in `value`, the deltas of
+    a batch refer to those of its first events. Raises KeyError for a delta of
+    a snapshot version the backend doesn't have.
+    """
+    if isinstance(value, list):
+        return [_resolve(item, snapshots, resolved) for item in value]
+    if not isinstance(value, dict):
+        return value
+    fields = {key: _resolve(item, snapshots, resolved) for key, item in value.items()}
+    if SNAPSHOT_KEY in fields:
+        snapshot_id, version = fields.pop(SNAPSHOT_KEY), 0
+    elif DELTA_KEY in fields:
+        snapshot_id, version = fields.pop(DELTA_KEY), fields.pop(VERSION_KEY)
+        base = resolved.get(snapshot_id)
+        if base is None:
+            base = snapshots[snapshot_id]
+        # A delta of another version than the stored one would rebuild the
+        # wrong fields: a replayed event after newer deltas, or a delta of a
+        # version sent again in full
+        if base[0] != version:
+            raise KeyError(snapshot_id)
+        fields, version = {**base[1], **fields}, version + 1
+    else:
+        return fields
+    resolved[snapshot_id] = (version, fields)
+    return fields
+
+
+def resolve_snapshots(token: str, payload: Any) -> Any | None:
+    """`payload` with the elements sent as snapshots or deltas replaced by their
+    full fields, None if it refers to a snapshot the client `token` doesn't have.
+
+    Stores the snapshots of `payload` as the latest ones of the client.
+    """
+    snapshots = _snapshots.get(token)
+    resolved: dict[str, Snapshot] = {}
+    try:
+        payload = _resolve(payload, snapshots or {}, resolved)
+    except KeyError:
+        return None
+    if not resolved:
+        return payload
+    if snapshots is None:
+        snapshots = _snapshots[token] = OrderedDict()
+        if len(_snapshots) > _max_clients:
+            _snapshots.popitem(last=False)
+    _snapshots.move_to_end(token)
+    for snapshot_id, snapshot in resolved.items():
+        snapshots[snapshot_id] = snapshot
+        snapshots.move_to_end(snapshot_id)
+    while len(snapshots) > _max_snapshots:
+        snapshots.popitem(last=False)
+    return payload
+
+
+def _resend_in_full(event: Event) -> StateUpdate:
+    """Have the client queue `event` again, with the deltas of its payload
+    replaced by full snapshots (see `expandElementSnapshots`)."""
+    script = (
+        f"const payload = globalThis.expandElementSnapshots?.({json.dumps(event.payload)});"
+        # Ahead of the queued events, which came after it
+        f"if (payload) {{ queueEvents([Event({json.dumps(event.name)}, payload)], socket, true);"
+        " processEvent(socket); }"
+    )
+    return StateUpdate(events=fix_events([rx.call_script(script)], event.token))
+
+
+class SnapshotMiddleware(Middleware):
+    """Resolves the element snapshots of the client sending the event, and has
+    it send the event again in full when it refers to an unknown snapshot."""
+
+    async def preprocess(
+        self, app: Any, state: BaseState, event: Event
+    ) -> StateUpdate | None:
+        payload = resolve_snapshots(event.token, event.payload)
+        if payload is None:
+            logger.info(
+                f"Unknown element snapshot in {event.name}, resending it in full"
+            )
+            return _resend_in_full(event)
+        # Events are frozen, but not their payload
+        event.payload.update(payload)
+        return None
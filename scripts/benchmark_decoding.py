@@ -0,0 +1,66 @@
+"""Compare the validating and trusted (construct-only) decoding of event payloads.
+
+PYTHONPATH=. python scripts/benchmark_decoding.py
+"""
+
+from timeit import timeit
+
+from pydantic.v1 import BaseModel
+
+from reflex_experiment.decoders import set_trusted_payloads
+from reflex_experiment.elements import (
+    HTMLButtonElement,
+    HTMLElementBase,
+    HTMLInputElement,
+)
+from reflex_experiment.events import (
+    EventBatch,
+    FocusEvent,
+    KeyboardEvent,
+    MouseEvent,
+    PointerEvent,
+    light,
+    project,
+)
+from scripts.samples import sample_payload
+
+NUMBER = 2000
+
+
+def bench(label: str, model: type[BaseModel], payload: dict):
+    set_trusted_payloads(False)
+    validated = model(**payload)
+    validating = timeit(lambda: model(**payload), number=NUMBER)
+    set_trusted_payloads(True)
+    trusted = model(**payload)
+    construct_only = timeit(lambda: model(**payload), number=NUMBER)
+    set_trusted_payloads(False)
+
+    assert trusted == validated, f"{label}: decoded payloads differ"
+    print(
+        f"{label:<46} validating {validating / NUMBER * 1e6:8.1f} us"
+        f"   trusted {construct_only / NUMBER * 1e6:8.1f} us"
+        f"   x{validating / construct_only:5.1f}"
+    )
+
+
+if __name__ == "__main__":
+    mouse = MouseEvent[HTMLButtonElement]
+    pointer = PointerEvent[HTMLElementBase]
+    cases = [
+        ("MouseEvent[HTMLButtonElement]", mouse),
+        ("FocusEvent[HTMLInputElement]", FocusEvent[HTMLInputElement]),
+        ("KeyboardEvent[HTMLInputElement]", KeyboardEvent[HTMLInputElement]),
+        ("PointerEvent[HTMLElementBase]", pointer),
+        ("Light[PointerEvent]", light(pointer)),
+        (
+            "Projection[MouseEvent, client_x, client_y]",
+            project(mouse, "client_x", "client_y"),
+        ),
+    ]
+    for label, model in cases:
+        bench(label, model, sample_payload(model))
+
+    batch = EventBatch[light(pointer)]
+    payload = {"events": [sample_payload(light(pointer))] * 32}
+    bench("EventBatch[Light[PointerEvent]] (32 events)", batch, payload)
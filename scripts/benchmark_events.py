@@ -0,0 +1,246 @@
+"""Benchmark the serialization and decoding of every event family, crossed with
+representative elements, and print the results as JSON for regression tracking.
+
+For each (event, element) pair, the event targeting the element:
+- the size of the JSON payload in the object and compact encodings, and with
+  the target sent as a snapshot delta (see snapshots.py), either unchanged or
+  scrolled since its snapshot
+- the time to decode those payloads into models, validating and trusted, the
+  deltas being resolved first like `SnapshotMiddleware` does
+- the size of the converters emitted by helpers.py, including those they call,
+  for the full event and its light variant (used by projections and `Light`)
+- the memory retained per decoded event, validating and trusted
+
+Payloads are generated from the models, with the values recorded in
+fixtures/mouse_event_button.json where the field names match.
+
+    PYTHONPATH=. python scripts/benchmark_events.py --output bench.json
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import sys
+import tracemalloc
+from importlib.metadata import version
+from pathlib import Path
+from timeit import timeit
+from typing import Any, get_args
+
+from pydantic.v1 import BaseModel
+
+from reflex_experiment.decoders import COMPACT_KEY, set_trusted_payloads
+from reflex_experiment.elements import (
+    HTMLAnchorElement,
+    HTMLButtonElement,
+    HTMLDivElement,
+    HTMLElement,
+    HTMLInputElement,
+    HTMLVideoElement,
+)
+from reflex_experiment.events import light
+from reflex_experiment.extractor_generator import get_event_types
+from reflex_experiment.helpers import (
+    _register_model_converter,
+    get_converter_dependencies,
+    get_converter_sizes,
+    get_schema_id,
+    is_pydantic_model,
+)
+from reflex_experiment.snapshots import (
+    DELTA_KEY,
+    SNAPSHOT_KEY,
+    VERSION_KEY,
+    resolve_snapshots,
+)
+from scripts.samples import sample_payload
+
+FIXTURE = Path(__file__).parent / "fixtures" / "mouse_event_button.json"
+
+ELEMENTS = {
+    element.__name__: element
+    for element in (
+        HTMLButtonElement,
+        HTMLInputElement,
+        HTMLDivElement,
+        HTMLAnchorElement,
+        HTMLVideoElement,
+    )
+}
+
+
+def with_recorded_values(payload: Any, recorded: Any) -> Any:
+    """`payload`, with the recorded values of the fields it shares with `recorded`."""
+    if not isinstance(payload, dict) or not isinstance(recorded, dict):
+        return payload
+    if payload.get("tag_name") != recorded.get("tag_name"):
+        return payload  # another element
+    return {
+        key: with_recorded_values(value, recorded.get(key))
+        if isinstance(value, dict)
+        else recorded.get(key, value)
+        for key, value in payload.items()
+    }
+
+
+def fixture_payload(model: type[BaseModel], element: type[BaseModel]) -> dict:
+    """A payload of `model` targeting `element`, as realistic as the recorded
+    fixture allows."""
+    payload = sample_payload(model, element)
+    recorded = with_recorded_values(payload, json.loads(FIXTURE.read_text()))
+    try:
+        model.validate(recorded)
+    except ValueError:
+        return payload  # a recorded value doesn't fit this event
+    return recorded
+
+
+def to_compact(type_: Any, value: Any) -> Any:
+    """The positional arrays sent by the compact extractors for `value`."""
+    if isinstance(value, dict):
+        if "tag_name" in value and not is_pydantic_model(type_):
+            # Member of the element union
+            type_ = next(
+                model
+                for model in get_args(HTMLElement)
+                if value["tag_name"]
+                in get_args(model.__fields__["tag_name"].outer_type_)
+            )
+        return [
+            to_compact(field.outer_type_, value[name])
+            for name, field in type_.__fields__.items()
+        ]
+    if isinstance(value, list):
+        return [to_compact(get_args(type_)[0], item) for item in value]
+    return value
+
+
+def json_size(payload: Any) -> int:
+    return len(json.dumps(payload, separators=(",", ":")))
+
+
+def time_us(fn, number: int) -> float:
+    return timeit(fn, number=number) / number * 1e6
+
+
+def retained_bytes(fn, number: int) -> float:
+    """Memory retained per result of `fn`, averaged over `number` calls."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [fn() for _ in range(number)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del results
+    return size / number
+
+
+def bench_pair(event: type[BaseModel], element: type[BaseModel], number: int):
+    model = event[element]  # type: ignore
+    payload = fixture_payload(model, element)
+    tag_names = get_args(element.__fields__["tag_name"].outer_type_)
+    assert payload["target"]["tag_name"] in tag_names, "not targeting the element"
+    compact = {COMPACT_KEY: [get_schema_id(model), to_compact(model, payload)]}
+    # The target as a snapshot, then as deltas of it: unchanged, and scrolled
+    snapshot_id = f"bench-{event.__name__}-{element.__name__}"
+    snapshot = {**payload, "target": {**payload["target"], SNAPSHOT_KEY: snapshot_id}}
+    delta = {**payload, "target": {DELTA_KEY: snapshot_id, VERSION_KEY: 0}}
+    scrolled = {
+        **payload,
+        "target": {**delta["target"], "scroll_top": 120, "scroll_left": 8},
+    }
+    versions = itertools.count()
+
+    def resolved(payload: dict) -> dict:
+        # What `SnapshotMiddleware` hands to the handlers, each delta applying
+        # to the version of the snapshot left by the previous one
+        target = payload["target"]
+        if DELTA_KEY in target:
+            target = {**target, VERSION_KEY: next(versions)}
+        return resolve_snapshots("bench", {**payload, "target": target})  # type: ignore
+
+    resolved(snapshot)  # stores the snapshot the deltas refer to
+    set_trusted_payloads(False)
+    validating = time_us(lambda: model(**payload), number)
+    validating_delta = time_us(lambda: model(**resolved(scrolled)), number)
+    validating_memory = retained_bytes(lambda: model(**payload), number)
+    set_trusted_payloads(True)
+    assert model(**compact) == model(**payload)  # also compiles the decoders
+    # The deltas update the snapshot, which is now scrolled
+    scrolled_target = {**payload["target"], "scroll_top": 120, "scroll_left": 8}
+    assert model(**resolved(delta)) == model(**{**payload, "target": scrolled_target})
+    trusted = time_us(lambda: model(**payload), number)
+    trusted_compact = time_us(lambda: model(**compact), number)
+    trusted_delta = time_us(lambda: model(**resolved(scrolled)), number)
+    trusted_memory = retained_bytes(lambda: model(**payload), number)
+    set_trusted_payloads(False)
+
+    fn_names = {
+        "full": _register_model_converter(model),
+        "light": _register_model_converter(light(model)),
+    }
+    converter_sizes = get_converter_sizes()
+
+    return {
+        "event": event.__name__,
+        "element": element.__name__,
+        "fields": len(model.__fields__),
+        "payload_bytes": {
+            "object": json_size(payload),
+            "compact": json_size(compact),
+            "target_delta": json_size(delta),
+            "target_delta_scrolled": json_size(scrolled),
+        },
+        "decode_us": {
+            "validating": round(validating, 2),
+            "validating_delta_scrolled": round(validating_delta, 2),
+            "trusted": round(trusted, 2),
+            "trusted_compact": round(trusted_compact, 2),
+            "trusted_delta_scrolled": round(trusted_delta, 2),
+        },
+        "converter_chars": {
+            variant: sum(
+                converter_sizes[name] for name in get_converter_dependencies([fn_name])
+            )
+            for variant, fn_name in fn_names.items()
+        },
+        "retained_bytes_per_event": {
+            "validating": round(validating_memory),
+            "trusted": round(trusted_memory),
+        },
+    }
+
+
+def run(events: list[str] | None, elements: list[str] | None, number: int) -> dict:
+    results = []
+    for event in get_event_types():
+        if events and event.__name__ not in events:
+            continue
+        for name, element in ELEMENTS.items():
+            if elements and name not in elements:
+                continue
+            print(f"{event.__name__}[{name}]", file=sys.stderr)
+            results.append(bench_pair(event, element, number))
+    return {
+        "python": platform.python_version(),
+        "pydantic": version("pydantic"),
+        "reflex": version("reflex"),
+        "number": number,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", nargs="*", help="event families, e.g. MouseEvent")
+    parser.add_argument("--elements", nargs="*", help=f"among {', '.join(ELEMENTS)}")
+    parser.add_argument("--number", type=int, default=200, help="runs per timing")
+    parser.add_argument("--output", type=Path, help="JSON file (default: stdout)")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args.events, args.elements, args.number), indent=2)
+    if args.output:
+        args.output.write_text(report + "\n")
+    else:
+        print(report)
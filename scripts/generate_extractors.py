@@ -0,0 +1,13 @@
+from reflex_experiment.extractor_generator import (
+    DEFAULT_COMPACT_OUTPUT,
+    DEFAULT_OUTPUT,
+    write_extractors,
+)
+
+# Regenerate .web/custom/serialize.ts and .web/custom/compact.ts whenever a
+# model in elements.py or events.py changes.
+for path, compact in [(DEFAULT_OUTPUT, False), (DEFAULT_COMPACT_OUTPUT, True)]:
+    if write_extractors(path, compact):
+        print(f"Generated {path}")
+    else:
+        print(f"{path} is up to date.")
@@ -1,3 +1,16 @@
+"""Generate the .pyi stubs of the components.
+
+    PYTHONPATH=. python scripts/generate_pyi_files.py [--static] [--build-schema] [--watch]
+
+With --static, the component modules are read from their AST instead of being
+imported, using the schema of the shared base classes in pyi_schema.json.
+--build-schema imports the base classes to rebuild that schema first.
+With --watch, the stubs are regenerated as the project files change, until
+interrupted.
+"""
+
+import argparse
+import logging
 from reflex_experiment.pyi_generator import PyiGenerator, DEFAULT_IMPORTS
 from pathlib import Path
 
@@ -90,11 +103,41 @@ DEFAULT_IMPORTS["reflex_experiment.elements"] = [
     "HTMLUListElement",
     "HTMLVideoElement",
 ]
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+parser.add_argument(
+    "--static", action="store_true", help="don't import the component modules"
+)
+parser.add_argument(
+    "--build-schema", action="store_true", help="rebuild the schema of --static"
+)
+parser.add_argument(
+    "--watch", action="store_true", help="regenerate the stubs on changes"
+)
+args = parser.parse_args()
+
+if args.build_schema:
+    from reflex_experiment.pyi_static import write_schema
+
+    print("Wrote", write_schema())
+
 generator = PyiGenerator()
 
+if args.watch:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    try:
+        generator.watch(component_dirs, static=args.static)
+    except KeyboardInterrupt:
+        pass
+    raise SystemExit
+
 # --- Run the scan ---
 # Pass the list of directories (or files) containing your components
-generator.scan_all(targets=component_dirs)
+generator.scan_all(targets=component_dirs, static=args.static)
 
 print("Finished generating .pyi files.")
 print("Generated files:", generator.written_files)
+print("Slowest modules:")
+for module, seconds in sorted(
+    generator.timings.items(), key=lambda item: item[1], reverse=True
+)[:5]:
+    print(f"  {module}: {seconds:.2f}s")
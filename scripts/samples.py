@@ -0,0 +1,41 @@
+"""Sample event payloads generated from the models, shared by the benchmarks."""
+
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic.v1 import BaseModel
+
+from reflex_experiment.elements import HTMLButtonElement
+from reflex_experiment.helpers import is_pydantic_model
+
+
+def sample_value(type_: Any, element: type[BaseModel] = HTMLButtonElement) -> Any:
+    """A value of `type_`, as sent by the extractors.
+
+    Element unions (like the `target` of events) are sampled as `element`, by
+    default a button, like a click on `rx.button` would send.
+    """
+    origin = get_origin(type_)
+    args = get_args(type_)
+    if is_pydantic_model(type_):
+        return sample_payload(type_, element)
+    if origin is Literal:
+        return args[0]
+    if origin is Union or origin is UnionType:
+        if element in args:
+            return sample_payload(element, element)
+        return sample_value(next(arg for arg in args if arg is not NoneType), element)
+    if origin is list:
+        return [sample_value(args[0], element)]
+    if origin is dict:
+        return {}
+    return {int: 1, float: 1, bool: True, str: "x"}.get(type_)
+
+
+def sample_payload(
+    model: type[BaseModel], element: type[BaseModel] = HTMLButtonElement
+) -> dict:
+    return {
+        name: sample_value(field.outer_type_, element)
+        for name, field in model.__fields__.items()
+    }
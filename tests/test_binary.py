@@ -0,0 +1,75 @@
+import pytest
+from pydantic.v1 import BaseModel
+
+from reflex_experiment.binary import LIST_COUNT, get_binary_layout
+from reflex_experiment.decoders import decode_binary_payload
+from reflex_experiment.elements import HTMLElementBase
+from reflex_experiment.events import PointerEvent, Projection, TouchEvent
+from reflex_experiment.helpers import get_schema_id
+
+PointerProjection = Projection[
+    PointerEvent[HTMLElementBase], "client_x", "pointer_id", "is_primary"
+]
+TouchProjection = Projection[
+    TouchEvent[HTMLElementBase],
+    "alt_key",
+    "detail",
+    "touches.identifier",
+    "touches.client_x",
+]
+
+
+def test_pointer_projection_round_trip():
+    layout = get_binary_layout(PointerProjection)
+    assert layout.names == ("client_x", "pointer_id", "is_primary")
+    assert layout.struct.format == "<di?"
+    assert layout.offsets() == [0, 8, 12]
+
+    # Packed like the converter does, with a DataView
+    buffer = layout.struct.pack(12.5, 3, True)
+    values = decode_binary_payload(
+        PointerProjection, [get_schema_id(PointerProjection), buffer]
+    )
+    assert values == {"client_x": 12.5, "pointer_id": 3, "is_primary": True}
+    assert type(values["is_primary"]) is bool
+
+
+def test_touch_projection_round_trip():
+    layout = get_binary_layout(TouchProjection)
+    assert layout.names == ("alt_key", "detail")
+    ((name, _, touch, touch_layout),) = layout.lists
+    assert name == "touches"
+    assert touch_layout.struct.format == "<id"
+
+    touches = [(7, 1.5), (8, -2.0)]
+    buffer = b"".join(
+        [
+            layout.struct.pack(False, 2),
+            LIST_COUNT.pack(len(touches)),
+            *(touch_layout.struct.pack(*values) for values in touches),
+        ]
+    )
+    values = decode_binary_payload(
+        TouchProjection, [get_schema_id(TouchProjection), buffer]
+    )
+    assert values["alt_key"] is False
+    assert values["detail"] == 2
+    assert [(t.identifier, t.client_x) for t in values["touches"]] == touches
+    assert all(isinstance(t, touch) for t in values["touches"])
+
+
+def test_empty_list_round_trip():
+    layout = get_binary_layout(TouchProjection)
+    buffer = layout.struct.pack(True, 0) + LIST_COUNT.pack(0)
+    values = decode_binary_payload(
+        TouchProjection, [get_schema_id(TouchProjection), buffer]
+    )
+    assert values["touches"] == []
+
+
+def test_nullable_field_is_rejected():
+    class Nullable(BaseModel):
+        x: float | None
+
+    with pytest.raises(TypeError):
+        get_binary_layout(Nullable)
@@ -0,0 +1,22 @@
+from reflex_experiment.elements import HTMLButtonElement, HTMLInputElement
+from reflex_experiment.helpers import (
+    _register_union_converter,
+    get_converter_module,
+    write_converters,
+)
+
+
+def test_converter_is_written_with_the_converters_it_calls(tmp_path):
+    union_fn = _register_union_converter(
+        "tagName", (("BUTTON", HTMLButtonElement), ("INPUT", HTMLInputElement))
+    )
+    assert write_converters([union_fn], tmp_path) == 3
+
+    source = (tmp_path / f"{union_fn}.ts").read_text()
+    case_fns = {path.stem for path in tmp_path.iterdir()} - {union_fn}
+    assert len(case_fns) == 2
+    for case_fn in case_fns:
+        assert f'from "{get_converter_module(case_fn)}"' in source
+
+    # Written once per process
+    assert write_converters([union_fn], tmp_path) == 0
@@ -0,0 +1,138 @@
+import re
+
+import pytest
+import reflex as rx
+
+from reflex_experiment.attributes import HTMLAudioProps, HTMLMediaProps
+from reflex_experiment.components.ui.button import button
+from reflex_experiment.decoders import set_trusted_payloads
+from reflex_experiment.elements import (
+    HTMLAudioElement,
+    HTMLButtonElement,
+    HTMLMediaElement,
+)
+from reflex_experiment.events import (
+    EventBatch,
+    KeyboardEvent,
+    MouseEvent,
+    Projection,
+    batched,
+    coalesced,
+    debounced,
+    filtered,
+    throttled,
+)
+
+ValueProjection = Projection[MouseEvent[HTMLButtonElement], "client_x", "target.value"]
+
+
+@pytest.fixture(params=[False, True], ids=["validating", "trusted"])
+def trusted(request):
+    set_trusted_payloads(request.param)
+    yield request.param
+    set_trusted_payloads(False)
+
+
+def test_projection_of_union_target_keeps_value(trusted):
+    target_type = ValueProjection.__fields__["target"].outer_type_
+    assert set(target_type.__fields__) == {"value"}
+    assert not target_type.__fields__["value"].required
+
+    event = ValueProjection(client_x=1, target={"value": "3"})
+    assert event.client_x == 1
+    assert event.target.value == "3"
+
+    event = ValueProjection(client_x=1, target={"value": 0.5})
+    assert event.target.value == 0.5
+
+
+def test_projection_of_union_target_without_value(trusted):
+    event = ValueProjection(client_x=1, target={})
+    assert event.target.value is None
+
+
+def test_projection_of_unknown_field():
+    with pytest.raises(TypeError):
+        Projection[MouseEvent[HTMLButtonElement], "target.not_a_field"]
+
+
+class EventsState(rx.State):
+    @rx.event
+    def click(self, value: MouseEvent[HTMLButtonElement]):
+        pass
+
+    @rx.event
+    def key_down(self, value: KeyboardEvent[HTMLButtonElement]):
+        pass
+
+    @rx.event
+    def keys_down(
+        self, value: EventBatch[Projection[KeyboardEvent[HTMLButtonElement], "key"]]
+    ):
+        pass
+
+
+def render_trigger(trigger: str, handler) -> str:
+    return str(button("x", **{trigger: handler}).event_triggers[trigger])
+
+
+@pytest.mark.parametrize(
+    ("binding", "call"),
+    [
+        (throttled(EventsState.click, 20), '"throttle", 50.0'),
+        (debounced(EventsState.click, 250), '"debounce", 250'),
+        (coalesced(EventsState.click), '"coalesce", 0'),
+    ],
+    ids=["throttled", "debounced", "coalesced"],
+)
+def test_rate_limited_trigger(binding, call):
+    rendered = render_trigger("on_click", binding)
+    assert re.match(rf'rateLimitEvent\({call}, "on_click_[0-9a-f]{{8}}", ', rendered)
+    assert rendered.count("rateLimitEvent") == 1
+    assert "extractMouseEvent(_var)" in rendered
+
+
+@pytest.mark.parametrize("hz", [0, -1])
+def test_throttled_rate_must_be_positive(hz):
+    with pytest.raises(ValueError):
+        throttled(EventsState.click, hz)
+
+
+def test_debounced_delay_must_not_be_negative():
+    with pytest.raises(ValueError):
+        debounced(EventsState.click, -1)
+
+
+def test_filtered_trigger():
+    rendered = render_trigger(
+        "on_key_down", filtered(EventsState.key_down, lambda evt: evt.key == "Enter")
+    )
+    assert rendered.startswith('((_var) => ((_var["key"] === "Enter")) ? (')
+    assert rendered.endswith(")(_var) : undefined)")
+    assert "extractKeyboardEvent(_var)" in rendered
+
+
+def test_filter_wraps_rate_limiting_and_batching():
+    binding = batched(
+        throttled(
+            filtered(EventsState.keys_down, lambda evt: evt.key == "Enter"),
+            10,
+        )
+    )
+    rendered = render_trigger("on_key_down", binding)
+    # Dropped events are neither rate limited nor buffered
+    guard = rendered.index('(_var["key"] === "Enter")')
+    rate_limit = rendered.index('rateLimitEvent("throttle", 100.0, ')
+    batch = rendered.index("batchEvent(")
+    assert guard < rate_limit < batch
+    assert rendered.endswith(")(_var) : undefined)")
+
+
+def test_dom_events_of_the_subclass_element_take_precedence():
+    media_triggers = HTMLMediaProps.create().get_event_triggers()
+    assert media_triggers["on_copy"].element is HTMLMediaElement
+    assert media_triggers["on_play"].element is HTMLMediaElement
+
+    audio_triggers = HTMLAudioProps.create().get_event_triggers()
+    assert audio_triggers["on_copy"].element is HTMLAudioElement
+    assert audio_triggers["on_play"].element is HTMLAudioElement
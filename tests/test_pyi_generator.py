@@ -0,0 +1,96 @@
+import sys
+
+import pytest
+
+from reflex_experiment import pyi_generator
+from reflex_experiment.pyi_generator import PyiGenerator
+
+MODULES = {
+    "__init__.py": "",
+    "base.py": """\
+import reflex as rx
+
+
+class Base(rx.Component):
+    size: rx.Var[int]
+""",
+    "widget.py": """\
+import reflex as rx
+
+from stubpkg.base import Base
+
+
+class Widget(Base):
+    label: rx.Var[str]
+""",
+    "other.py": """\
+import reflex as rx
+
+
+class Other(rx.Component):
+    pass
+""",
+}
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """A project with a `stubpkg` package, `widget` importing `base`."""
+    root = tmp_path.resolve()
+    package = root / "stubpkg"
+    package.mkdir()
+    for name, source in MODULES.items():
+        (package / name).write_text(source)
+    monkeypatch.setattr(pyi_generator, "PWD", root)
+    monkeypatch.syspath_prepend(str(root))
+    yield package
+    for module in [name for name in sys.modules if name.startswith("stubpkg")]:
+        del sys.modules[module]
+
+
+def scan(package) -> set[str]:
+    """Generate the stubs of `package` with the cache, returns the scanned files."""
+    generator = PyiGenerator()
+    generator.scan_all([package])
+    return set(generator.timings)
+
+
+def test_cache_is_invalidated_by_transitive_dependencies(package):
+    assert scan(package) == {
+        "stubpkg/__init__.py",
+        "stubpkg/base.py",
+        "stubpkg/other.py",
+        "stubpkg/widget.py",
+    }
+    assert scan(package) == set()
+
+    with (package / "base.py").open("a") as file:
+        file.write("# edited\n")
+    assert scan(package) == {"stubpkg/base.py", "stubpkg/widget.py"}
+
+
+def test_removed_stub_is_restored_from_the_cache(package):
+    scan(package)
+    stub = package / "widget.pyi"
+    content = stub.read_text()
+    assert "def create(" in content
+
+    stub.unlink()
+    assert scan(package) == set()
+    assert stub.read_text() == content
+
+
+def test_regenerate_changed_files(package):
+    generator = PyiGenerator()
+    generator.scan_all([package])
+    generator.timings = {}
+
+    base = package / "base.py"
+    base.write_text(base.read_text() + "    color: rx.Var[str]\n")
+    (package / "other.py").unlink()
+    generator._regenerate([package], {base, package / "other.py"}, static=False)
+
+    # The module importing the changed one is reloaded after it
+    assert set(generator.timings) == {"stubpkg/base.py", "stubpkg/widget.py"}
+    assert "color: Var[str] | str | None = None" in (package / "widget.pyi").read_text()
+    assert not (package / "other.pyi").exists()
@@ -0,0 +1,55 @@
+import inspect
+from pathlib import Path
+
+import pytest
+from reflex.components.component import Component
+
+from reflex_experiment import attributes
+from reflex_experiment.pyi_generator import PyiGenerator
+from reflex_experiment.pyi_static import (
+    StaticResolver,
+    StaticStubError,
+    _c3_merge,
+    _class_key,
+    load_schema,
+)
+
+HTML_PROPS = [
+    clz
+    for name, clz in vars(attributes).items()
+    if inspect.isclass(clz)
+    and name.startswith("HTML")
+    and name.endswith("Props")
+    and clz.__module__ == attributes.__name__
+]
+
+
+def component_mro(clz: type) -> list[str]:
+    return [_class_key(c) for c in clz.__mro__ if issubclass(c, Component)]
+
+
+@pytest.mark.parametrize("module", ["accordion", "badge", "button"])
+def test_static_stub_matches_imported_stub(module):
+    module_name = f"reflex_experiment.components.ui.{module}"
+    path = Path(attributes.__file__).parent / "components" / "ui" / f"{module}.py"
+
+    generator = PyiGenerator()
+    generator._resolver = StaticResolver(load_schema())
+    static = generator._scan_file_static(path, module_name)
+    generator._resolver = None
+    assert static is not None
+    assert static == generator._scan_file(path)
+
+
+@pytest.mark.parametrize("clz", HTML_PROPS, ids=lambda clz: clz.__name__)
+def test_c3_merge_matches_mro(clz):
+    bases = [base for base in clz.__bases__ if issubclass(base, Component)]
+    merged = _c3_merge(
+        [*map(component_mro, bases), [_class_key(base) for base in bases]]
+    )
+    assert [_class_key(clz), *merged] == component_mro(clz)
+
+
+def test_c3_merge_of_inconsistent_bases():
+    with pytest.raises(StaticStubError):
+        _c3_merge([["A", "B"], ["B", "A"], ["A", "B"]])
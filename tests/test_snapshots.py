@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+import reflex as rx
+from reflex.event import Event
+
+from reflex_experiment.snapshots import (
+    DELTA_KEY,
+    SNAPSHOT_KEY,
+    VERSION_KEY,
+    SnapshotMiddleware,
+    element_snapshots,
+    resolve_snapshots,
+    set_element_snapshots,
+)
+
+
+def process(token: str, target: dict):
+    """Preprocess an event, returns its resolved target or the update sent back."""
+    event = Event(token=token, name="state.handle", payload={"e": {"target": target}})
+    update = asyncio.run(SnapshotMiddleware().preprocess(None, None, event))  # type: ignore
+    return update if update is not None else event.payload["e"]["target"]
+
+
+def test_delta_of_known_snapshot_is_resolved():
+    assert process("client", {SNAPSHOT_KEY: "a-0", "id": "x", "title": ""}) == {
+        "id": "x",
+        "title": "",
+    }
+    assert process("client", {DELTA_KEY: "a-0", VERSION_KEY: 0, "title": "t"}) == {
+        "id": "x",
+        "title": "t",
+    }
+
+
+def test_unknown_snapshot_is_sent_again():
+    update = process("client", {DELTA_KEY: "b-0", VERSION_KEY: 0})
+    (event,) = update.events
+    assert event.name == "_call_script"
+    assert "expandElementSnapshots" in event.payload["javascript_code"]
+
+
+def test_snapshot_sent_earlier_in_the_payload():
+    batch = [
+        {"target": {SNAPSHOT_KEY: "c-0", "id": "x"}},
+        {"target": {DELTA_KEY: "c-0", VERSION_KEY: 0, "title": "t"}},
+    ]
+    assert resolve_snapshots("client", {"batch": batch}) == {
+        "batch": [{"target": {"id": "x"}}, {"target": {"id": "x", "title": "t"}}]
+    }
+
+
+def test_snapshots_are_scoped_to_the_client():
+    process("client", {SNAPSHOT_KEY: "d-0", "id": "x"})
+
+    assert process("client", {DELTA_KEY: "d-0", VERSION_KEY: 0}) == {"id": "x"}
+    assert not isinstance(process("other", {DELTA_KEY: "d-0", VERSION_KEY: 0}), dict)
+
+
+def test_unknown_snapshot_is_not_stored():
+    payload = {
+        "a": {SNAPSHOT_KEY: "e-0", "id": "x"},
+        "b": {DELTA_KEY: "e-1", VERSION_KEY: 0},
+    }
+    assert resolve_snapshots("client", payload) is None
+    assert resolve_snapshots("client", {DELTA_KEY: "e-0", VERSION_KEY: 0}) is None
+
+
+def test_delta_of_another_version_is_sent_again():
+    process("client", {SNAPSHOT_KEY: "f-0", "id": "x", "title": ""})
+    assert process("client", {DELTA_KEY: "f-0", VERSION_KEY: 0, "title": "a"})
+    assert process("client", {DELTA_KEY: "f-0", VERSION_KEY: 1, "id": "y"}) == {
+        "id": "y",
+        "title": "a",
+    }
+
+    # Replayed after newer deltas
+    update = process("client", {DELTA_KEY: "f-0", VERSION_KEY: 1, "title": "b"})
+    assert not isinstance(update, dict)
+
+    # The snapshot sent in full again starts over, older deltas no longer apply
+    process("client", {SNAPSHOT_KEY: "f-0", "id": "z", "title": ""})
+    update = process("client", {DELTA_KEY: "f-0", VERSION_KEY: 2, "title": "c"})
+    assert not isinstance(update, dict)
+
+
+def test_enabling_snapshots_adds_the_middleware():
+    with pytest.raises(ValueError):
+        set_element_snapshots()
+
+    app = rx.App()
+    set_element_snapshots(app=app)
+    try:
+        assert element_snapshots()
+        assert any(isinstance(m, SnapshotMiddleware) for m in app._middlewares)
+    finally:
+        set_element_snapshots(False)